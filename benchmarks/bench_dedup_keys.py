@@ -0,0 +1,95 @@
+"""Benchmark identity-key computation with and without memoized normalizers.
+
+Usage:
+    uv run python -m benchmarks.bench_dedup_keys [--papers 50000] [--passes 5]
+
+Each pass computes ``identity_keys_for_paper`` for the whole batch, the way
+RSS dedup, Gmail dedup, final dedup and export keying each do in one
+pipeline run. ``uncached`` swaps the raw normalizers back in.
+"""
+
+import argparse
+import time
+from contextlib import contextmanager
+from typing import Generator, List
+
+from src.models.responses import PaperItem
+from src.utils import dedup
+
+_JOURNALS = ("acsenergylett", "jacs", "nl", "aenm", "adma", "ange")
+
+
+def _batch(n: int) -> List[PaperItem]:
+    papers = []
+    for i in range(n):
+        journal = _JOURNALS[i % len(_JOURNALS)]
+        doi = f"10.1021/{journal}.4c{i:05d}" if i % 2 else None
+        papers.append(
+            PaperItem(
+                title=f"Operando Study of Zn Anodes, Part {i} - Just Accepted",
+                source="bench",
+                source_type="rss",
+                doi=f"https://doi.org/{doi}" if doi and i % 4 == 1 else doi,
+                url=(
+                    f"https://pubs.acs.org/doi/abs/{doi or i}"
+                    f"?utm_source=rss&utm_medium=feed&ref={i % 7}"
+                ),
+            )
+        )
+    return papers
+
+
+@contextmanager
+def _uncached() -> Generator[None, None, None]:
+    cached = {
+        name: getattr(dedup, name)
+        for name in ("normalize_doi", "normalize_title", "normalize_url")
+    }
+    for name, fn in cached.items():
+        setattr(dedup, name, fn.__wrapped__)
+    try:
+        yield
+    finally:
+        for name, fn in cached.items():
+            setattr(dedup, name, fn)
+
+
+def _run(papers: List[PaperItem], passes: int) -> List[float]:
+    timings = []
+    for _ in range(passes):
+        start = time.perf_counter()
+        for paper in papers:
+            dedup.identity_keys_for_paper(paper)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--papers", type=int, default=50_000)
+    parser.add_argument("--passes", type=int, default=5)
+    args = parser.parse_args()
+
+    papers = _batch(args.papers)
+    with _uncached():
+        before = _run(papers, args.passes)
+    dedup.clear_normalization_caches()
+    after = _run(papers, args.passes)
+
+    def per_paper(seconds: float) -> float:
+        return seconds / len(papers) * 1e6
+
+    print(f"{len(papers)} papers, {args.passes} passes")
+    print(f"{'':<10}{'first pass':>14}{'later passes':>16}{'total':>10}")
+    for name, timings in (("uncached", before), ("cached", after)):
+        later = timings[1:] or timings
+        print(
+            f"{name:<10}{per_paper(timings[0]):>11.2f}us"
+            f"{per_paper(sum(later) / len(later)):>13.2f}us"
+            f"{sum(timings):>9.2f}s"
+        )
+    print(f"speedup: {sum(before) / sum(after):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
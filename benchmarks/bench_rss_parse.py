@@ -0,0 +1,123 @@
+"""Benchmark the fast XML feed parser against the feedparser path.
+
+Usage:
+    uv run python -m benchmarks.bench_rss_parse [--items 300] [--repeat 5]
+    uv run python -m benchmarks.bench_rss_parse --archive cache/rss-archive
+
+With ``--archive`` the latest archived body of every feed in an
+``RSS_ARCHIVE_DIR`` is used instead of the synthetic feeds.
+"""
+
+import argparse
+import time
+from typing import Callable, Iterator, List, Tuple
+
+from src.sources.rss import parse_feed_body
+from src.sources.rss_archive import FeedArchive
+
+_RSS20_ITEM = """<item>
+<title>Operando study of Zn anodes part {i}</title>
+<link>https://pubs.acs.org/doi/10.1021/acsenergylett.4c{i:05d}</link>
+<guid isPermaLink="false">10.1021/acsenergylett.4c{i:05d}</guid>
+<description><![CDATA[<p>Abstract {i} for an aqueous zinc battery paper.</p>]]></description>
+<pubDate>Mon, 01 Jan 2024 10:00:00 GMT</pubDate>
+<dc:creator>Alice Smith, Bob Jones</dc:creator>
+<prism:doi>10.1021/acsenergylett.4c{i:05d}</prism:doi>
+</item>"""
+
+_ATOM_ENTRY = """<entry>
+<title type="html">Cathode study {i}</title>
+<id>tag:nature.com,2024:s41557-{i}</id>
+<link rel="alternate" type="text/html" href="https://www.nature.com/articles/s{i}"/>
+<published>2024-02-03T01:00:00Z</published>
+<author><name>Carol White</name></author>
+<summary type="html">&lt;p&gt;Summary {i}&lt;/p&gt;</summary>
+</entry>"""
+
+_RDF_ITEM = """<item rdf:about="https://onlinelibrary.wiley.com/doi/10.1002/aenm.{i}">
+<title>Sodium ion batteries {i}</title>
+<link>https://onlinelibrary.wiley.com/doi/10.1002/aenm.{i}</link>
+<content:encoded>&lt;p&gt;Abstract {i}&lt;/p&gt;</content:encoded>
+<dc:creator>Frank Blue, Gina Red</dc:creator>
+<dc:date>2024-03-05T08:00:00Z</dc:date>
+<dc:identifier>10.1002/aenm.{i}</dc:identifier>
+</item>"""
+
+
+def _rss20(n: int) -> bytes:
+    items = "\n".join(_RSS20_ITEM.format(i=i) for i in range(n))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/" '
+        'xmlns:prism="http://prismstandard.org/namespaces/basic/2.0/">'
+        f"<channel><title>ACS</title>{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+def _atom(n: int) -> bytes:
+    entries = "\n".join(_ATOM_ENTRY.format(i=i) for i in range(n))
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>Nature</title>{entries}</feed>"
+    ).encode("utf-8")
+
+
+def _rdf(n: int) -> bytes:
+    items = "\n".join(_RDF_ITEM.format(i=i) for i in range(n))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+        'xmlns="http://purl.org/rss/1.0/" '
+        'xmlns:dc="http://purl.org/dc/elements/1.1/" '
+        'xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+        f"<channel><title>Wiley</title></channel>{items}</rdf:RDF>"
+    ).encode("utf-8")
+
+
+def _synthetic_corpus(items: int) -> Iterator[Tuple[str, bytes]]:
+    for name, build in (("rss20", _rss20), ("atom", _atom), ("rdf", _rdf)):
+        yield name, build(items)
+
+
+def _archive_corpus(archive_dir: str) -> Iterator[Tuple[str, bytes]]:
+    archive = FeedArchive(archive_dir)
+    for url, record in sorted(archive.latest().items()):
+        yield url.split("//", 1)[-1][:40], archive.load(record.sha256)
+
+
+def _best_of(fn: Callable[[], object], repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--archive", help="RSS_ARCHIVE_DIR to benchmark on")
+    args = parser.parse_args()
+
+    if args.archive:
+        corpus = _archive_corpus(args.archive)
+        width = 42
+    else:
+        corpus = _synthetic_corpus(args.items)
+        width = 8
+
+    print(f"{'feed':<{width}}{'feedparser':>14}{'fast':>12}{'speedup':>10}")
+    for name, body in corpus:
+        slow = _best_of(lambda: parse_feed_body(body, name, fast=False), args.repeat)
+        fast = _best_of(lambda: parse_feed_body(body, name, fast=True), args.repeat)
+        print(
+            f"{name:<{width}}{slow * 1000:>12.1f}ms{fast * 1000:>10.1f}ms"
+            f"{slow / fast:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from src.models.responses import ExportAdapter, PaperItem
+from src.utils.bloom import IdentityKeySet
 from src.utils.dedup import paper_export_identity_keys, zotero_data_identity_keys
 
 try:
@@ -36,12 +37,14 @@ class ZoteroAdapter(ExportAdapter):
     )
     _ITEM_PAGE_SIZE = 100
     _NON_PARENT_ITEM_TYPES = {"attachment", "note", "annotation"}
+    dedup_false_positive_rate: float = 0.001
 
     def __init__(
         self,
         library_id: str,
         api_key: str,
         library_type: str = "user",
+        dedup_false_positive_rate: Optional[float] = None,
     ):
         if not zotero_available or ZoteroAPIClient is None or ItemService is None:
             raise ImportError(
@@ -52,6 +55,8 @@ class ZoteroAdapter(ExportAdapter):
         self.library_id = library_id
         self.api_key = api_key
         self.library_type = library_type
+        if dedup_false_positive_rate is not None:
+            self.dedup_false_positive_rate = dedup_false_positive_rate
 
         self._api_client = ZoteroAPIClient(
             library_id=library_id,
@@ -315,9 +320,13 @@ class ZoteroAdapter(ExportAdapter):
         }
         return {k: v for k, v in zotero_item.items() if k in allowed_fields}
 
-    async def _load_existing_identity_keys(self) -> set[tuple[str, str]]:
+    async def _load_existing_identity_keys(self) -> IdentityKeySet:
         items = await self._list_existing_items()
-        keys: set[tuple[str, str]] = set()
+        # Three keys per item at most (DOI, title+date, URL).
+        keys = IdentityKeySet(
+            false_positive_rate=self.dedup_false_positive_rate,
+            capacity=max(3 * len(items), 1024),
+        )
         parent_items = 0
         for item in items:
             if not isinstance(item, dict):
@@ -5,8 +5,10 @@ import hashlib
 import json
 import logging
 import re
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 
 from openai import OpenAI
 
@@ -16,6 +18,7 @@ from src.config.settings import (
     get_research_prompt,
 )
 from src.models.responses import PaperItem
+from src.utils.text import normalize_words, word_stem
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,82 @@ _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 KEYWORDS_CACHE_FILE = _PROJECT_ROOT / "cache" / "keywords_cache.json"
 
 
+@dataclass(frozen=True)
+class TextAnalysis:
+    """Normalized forms of one text, as compared by keyword matching."""
+
+    norm: str
+    stems: FrozenSet[str]
+    expanded: FrozenSet[str]
+    core_hits: FrozenSet[int]
+
+
+@dataclass(frozen=True)
+class _CompiledKeyword:
+    norm: str
+    stems: FrozenSet[str]
+    expanded: FrozenSet[str]
+    core_ids: FrozenSet[int]
+
+
+class CompiledKeywordSet:
+    """Keywords preprocessed once for :meth:`KeywordGenerator._matches_keyword`.
+
+    Word sets, stems, synonym expansions and the core terms each keyword
+    mentions are computed up front, so checking a text costs one
+    :class:`TextAnalysis` plus a substring test and a few set comparisons
+    per keyword.
+    """
+
+    def __init__(self, keywords: Sequence[str], generator: "KeywordGenerator"):
+        self.keywords = list(keywords)
+        self._generator = generator
+        compiled: List[_CompiledKeyword] = []
+        for keyword in self.keywords:
+            norm = generator._normalize_text(keyword)
+            words = norm.split()
+            compiled.append(
+                _CompiledKeyword(
+                    norm=norm,
+                    stems=frozenset(generator._get_word_stem(w) for w in words),
+                    expanded=frozenset(
+                        generator._expand_with_synonyms(norm).split()
+                    ),
+                    core_ids=frozenset(
+                        i
+                        for i, (core_norm, core_words) in enumerate(
+                            generator._core_forms
+                        )
+                        if core_words.issubset(words) or core_norm in norm
+                    ),
+                )
+            )
+        self._compiled = compiled
+        self._any_core: FrozenSet[int] = frozenset().union(
+            *(kw.core_ids for kw in compiled)
+        )
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def analyze(self, text: str) -> TextAnalysis:
+        return self._generator.analyze_text(text)
+
+    def matches(self, text: str | TextAnalysis) -> bool:
+        analysis = text if isinstance(text, TextAnalysis) else self.analyze(text)
+        if self._any_core & analysis.core_hits:
+            return True
+        for kw in self._compiled:
+            # Word-subset matches imply stem-subset matches, so stems cover both.
+            if (
+                kw.norm in analysis.norm
+                or kw.stems <= analysis.stems
+                or kw.expanded <= analysis.expanded
+            ):
+                return True
+        return False
+
+
 class KeywordGenerator:
     """Extract and match keywords for paper filtering."""
 
@@ -270,25 +349,10 @@ class KeywordGenerator:
         return best_keywords
 
     def _normalize_text(self, text: str) -> str:
-        text = text.lower()
-        text = re.sub(r"[-_]", " ", text)
-        text = re.sub(r"[^\w\s]", " ", text)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        return normalize_words(text)
 
     def _get_word_stem(self, word: str) -> str:
-        word = word.lower()
-        if word.endswith("ies") and len(word) > 3:
-            return word[:-3] + "y"
-        elif word.endswith("es") and len(word) > 2:
-            return word[:-2]
-        elif word.endswith("s") and len(word) > 2 and not word.endswith("ss"):
-            return word[:-1]
-        elif word.endswith("ed") and len(word) > 2:
-            return word[:-2]
-        elif word.endswith("ing") and len(word) > 3:
-            return word[:-3]
-        return word
+        return word_stem(word)
 
     def _get_word_stems(self, text: str) -> Set[str]:
         words = self._normalize_text(text).split()
@@ -303,40 +367,47 @@ class KeywordGenerator:
                 expanded.append(self.CHEMICAL_SYNONYMS[word])
         return " ".join(expanded)
 
-    def _matches_keyword(self, text: str, keyword: str) -> bool:
-        text_norm = self._normalize_text(text)
-        kw_norm = self._normalize_text(keyword)
-
-        if kw_norm in text_norm:
-            return True
-
-        kw_words = set(kw_norm.split())
-        text_words = set(text_norm.split())
-        if kw_words and kw_words.issubset(text_words):
-            return True
-
-        text_stems = self._get_word_stems(text)
-        kw_stems = self._get_word_stems(keyword)
-        if kw_stems and kw_stems.issubset(text_stems):
-            return True
+    @cached_property
+    def _core_forms(self) -> List[Tuple[str, FrozenSet[str]]]:
+        forms = []
+        for core_term in sorted(self.CORE_TERMS):
+            core_norm = self._normalize_text(core_term)
+            forms.append((core_norm, frozenset(core_norm.split())))
+        return forms
+
+    def analyze_text(self, text: str) -> TextAnalysis:
+        norm = self._normalize_text(text)
+        word_set = frozenset(norm.split())
+        return self._analysis(
+            norm, word_set, frozenset(self._get_word_stem(w) for w in word_set)
+        )
 
-        text_expanded = self._expand_with_synonyms(text_norm)
-        kw_expanded = self._expand_with_synonyms(kw_norm)
-        text_exp_words = set(text_expanded.split())
-        kw_exp_words = set(kw_expanded.split())
-        if kw_exp_words and kw_exp_words.issubset(text_exp_words):
-            return True
+    def analyze_paper(self, paper: PaperItem) -> TextAnalysis:
+        """Like ``analyze_text(f"{title} {abstract}")``, reusing the paper's
+        cached :attr:`PaperItem.text_analysis`."""
+        shared = paper.text_analysis
+        return self._analysis(shared.norm_text, shared.words, shared.stems)
+
+    def _analysis(
+        self, norm: str, word_set: FrozenSet[str], stems: FrozenSet[str]
+    ) -> TextAnalysis:
+        synonyms = self.CHEMICAL_SYNONYMS
+        return TextAnalysis(
+            norm=norm,
+            stems=stems,
+            expanded=word_set.union(synonyms[w] for w in word_set if w in synonyms),
+            core_hits=frozenset(
+                i
+                for i, (core_norm, core_words) in enumerate(self._core_forms)
+                if core_words <= word_set or core_norm in norm
+            ),
+        )
 
-        kw_words_lower = {w.lower() for w in kw_norm.split()}
-        text_words_lower = {w.lower() for w in text_norm.split()}
-        for core_term in self.CORE_TERMS:
-            core_norm = self._normalize_text(core_term)
-            core_words = set(core_norm.split())
-            if core_words.issubset(kw_words_lower) or core_norm in kw_norm:
-                if core_words.issubset(text_words_lower) or core_norm in text_norm:
-                    return True
+    def compile_keywords(self, keywords: Sequence[str]) -> CompiledKeywordSet:
+        return CompiledKeywordSet(keywords, self)
 
-        return False
+    def _matches_keyword(self, text: str, keyword: str) -> bool:
+        return self.compile_keywords([keyword]).matches(text)
 
     def filter_items(
         self,
@@ -350,12 +421,12 @@ class KeywordGenerator:
                 "or provide keywords."
             )
 
+        compiled = self.compile_keywords(kw_list)
         relevant: List[PaperItem] = []
         irrelevant: List[PaperItem] = []
 
         for item in items:
-            text = f"{item.title} {item.abstract}"
-            is_relevant = any(self._matches_keyword(text, kw) for kw in kw_list)
+            is_relevant = compiled.matches(self.analyze_paper(item))
 
             if is_relevant:
                 relevant.append(item)
@@ -2,16 +2,19 @@
 
 import argparse
 import asyncio
+import hashlib
 import json
 import logging
 import sys
+from contextlib import nullcontext
 from datetime import date, timedelta
 from pathlib import Path
 import shutil
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from src.config.settings import (
     get_openai_config,
+    get_research_prompt,
     get_rss_config,
     get_zotero_config,
 )
@@ -78,6 +81,31 @@ def _positive_int(value: str) -> int:
     return parsed
 
 
+def _positive_float(value: str) -> float:
+    parsed = float(value)
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("must be a positive number (> 0)")
+    return parsed
+
+
+def _similarity(value: str) -> float:
+    parsed = float(value)
+    if not 0 < parsed <= 1:
+        raise argparse.ArgumentTypeError("must be in (0, 1]")
+    return parsed
+
+
+def _shard_spec(value: str) -> tuple[int, int]:
+    try:
+        index_text, count_text = value.split("/", 1)
+        index, count = int(index_text), int(count_text)
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected i/N, e.g. 1/4")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError("expected 1 <= i <= N")
+    return index, count
+
+
 def _add_input_arg(parser: argparse.ArgumentParser, help_text: str = "输入 JSON 文件") -> None:
     parser.add_argument(
         "-i",
@@ -100,6 +128,49 @@ def _add_output_arg(
     )
 
 
+def _add_identity_index_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--identity-index",
+        dest="identity_index",
+        help="跨运行论文身份索引（SQLite）路径；跳过已处理过本阶段的论文",
+    )
+
+
+def _open_identity_index(args: argparse.Namespace):
+    """Context manager yielding the ``--identity-index`` store, or None."""
+    path = getattr(args, "identity_index", None)
+    if not path:
+        return nullcontext()
+
+    from src.utils.identity_index import PaperIdentityIndex
+
+    return PaperIdentityIndex(path)
+
+
+def _skip_processed(
+    index, papers: List[PaperItem], stage: str, scope: Optional[str] = None
+) -> List[PaperItem]:
+    if index is None:
+        return papers
+    pending, done = index.partition(papers, stage, scope=scope)
+    if done:
+        print(f"Skipped {len(done)} papers already {stage} in an earlier run")
+    return pending
+
+
+def _filter_scope(criteria: FilterCriteria, semantic: bool) -> str:
+    """Digest of everything that decides a filter verdict.
+
+    Papers are only skipped by a later filter run with the same scope, so
+    changed criteria or chained runs still see every paper.
+    """
+    settings = {"criteria": criteria.model_dump(mode="json"), "semantic": semantic}
+    if semantic:
+        settings["research_prompt"] = get_research_prompt()
+    encoded = json.dumps(settings, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
 def _build_llm_client(enable_semantic_filter: bool):
     if not enable_semantic_filter:
         return None
@@ -123,6 +194,69 @@ def _build_llm_client(enable_semantic_filter: bool):
     return OpenAI(**kwargs)
 
 
+def _print_rss_report(report) -> None:
+    from src.sources.rss import RSSFetchReport
+
+    if not isinstance(report, RSSFetchReport):
+        return
+    if report.timed_out:
+        print(
+            f"Fetch budget exhausted; cut off {len(report.timed_out)} feeds:"
+        )
+        for url in report.timed_out:
+            print(f"  - {url}")
+    if report.failed:
+        print(f"Failed feeds: {len(report.failed)}/{report.feeds_total}")
+    if report.deferred:
+        print(
+            f"Deferred {len(report.deferred)} feeds not expected to have new "
+            "entries yet (use --force-all to poll them)"
+        )
+    if report.skipped:
+        print(
+            f"Skipped {len(report.skipped)} unhealthy feeds "
+            "(repeated failures, will be probed again later):"
+        )
+        for feed in report.skipped:
+            print(
+                f"  - {feed.title} ({feed.consecutive_failures} failures, "
+                f"retry after {feed.retry_after})"
+            )
+
+
+def _report_rss_stats(stats, report, output_path: str, top_n: int = 5) -> None:
+    from src.sources.rss import RSSFetchReport
+    from src.sources.rss_stats import FETCH_STATS_FILENAME, RSSFetchStats
+
+    if not isinstance(stats, RSSFetchStats) or not stats.feeds:
+        return
+
+    data = stats.to_dict()
+    if isinstance(report, RSSFetchReport):
+        data["report"] = report.to_dict()
+    stats_path = Path(output_path).parent / FETCH_STATS_FILENAME
+    _save_json(data, str(stats_path))
+
+    summary = data["summary"]
+    print(
+        f"RSS fetch: {summary['feeds']} feeds in {summary['wall_seconds']:.1f}s, "
+        f"{summary['bytes'] / 1e6:.1f} MB, entries kept "
+        f"{summary['entries_kept']}/{summary['entries_total']} "
+        f"(stats -> {stats_path})"
+    )
+    if top_n <= 0:
+        return
+    print(f"Slowest {min(top_n, len(stats.feeds))} feeds:")
+    for timing in stats.slowest(top_n):
+        ttfb = f"{timing.ttfb_seconds:.2f}s" if timing.ttfb_seconds else "-"
+        print(
+            f"  {timing.total_seconds:6.2f}s  ttfb {ttfb:>6}  "
+            f"wait {timing.wait_seconds:5.2f}s  "
+            f"parse {timing.parse_seconds + timing.convert_seconds:5.2f}s  "
+            f"{timing.bytes / 1024:7.0f} KB  {timing.outcome:<12} {timing.title}"
+        )
+
+
 # -------------------- Handlers --------------------
 
 
@@ -138,8 +272,47 @@ async def _handle_fetch(args: argparse.Namespace) -> None:
         if not opml_path:
             opml_path = get_rss_config()["opml_path"]
 
-        source = RSSSource(opml_path)
-        papers = await source.fetch_papers(limit=args.limit, since=since)
+        rss_kwargs: Dict[str, Any] = {}
+        cache_dir = getattr(args, "cache_dir", None)
+        if cache_dir:
+            rss_kwargs["cache_dir"] = cache_dir
+        archive_dir = getattr(args, "archive_dir", None)
+        if archive_dir:
+            rss_kwargs["archive_dir"] = archive_dir
+        parse_workers = getattr(args, "parse_workers", None)
+        if parse_workers is not None:
+            rss_kwargs["parse_workers"] = parse_workers
+        if getattr(args, "force_all", False):
+            rss_kwargs["force_all"] = True
+        shard = getattr(args, "shard", None)
+        if shard is not None:
+            rss_kwargs["shard"] = shard
+
+        fetch_kwargs: Dict[str, Any] = {}
+        if getattr(args, "incremental", False):
+            fetch_kwargs["incremental"] = True
+        budget_seconds = getattr(args, "budget_seconds", None)
+        if budget_seconds is not None:
+            fetch_kwargs["budget_seconds"] = budget_seconds
+
+        source = RSSSource(opml_path, **rss_kwargs)
+        if getattr(args, "from_archive", False):
+            try:
+                papers = await source.fetch_from_archive(limit=args.limit, since=since)
+            except ValueError as exc:
+                print(f"Error: {exc}", file=sys.stderr)
+                sys.exit(1)
+        else:
+            papers = await source.fetch_papers(
+                limit=args.limit, since=since, **fetch_kwargs
+            )
+        _print_rss_report(getattr(source, "last_report", None))
+        _report_rss_stats(
+            getattr(source, "last_stats", None),
+            getattr(source, "last_report", None),
+            args.output,
+            top_n=getattr(args, "slowest", 5),
+        )
     elif args.source == "gmail":
         from src.sources.gmail import GmailSource
 
@@ -153,138 +326,197 @@ async def _handle_fetch(args: argparse.Namespace) -> None:
         )
         sys.exit(1)
 
+    with _open_identity_index(args) as index:
+        if index is not None:
+            # Only note first sightings here: skipping belongs to the stages
+            # that consume the papers, once their output is written.
+            index.record(papers, "fetched")
+
     _save_papers(papers, args.output)
     print(f"Fetched {len(papers)} papers -> {args.output}")
 
 
+async def _handle_merge(args: argparse.Namespace) -> None:
+    from src.utils.dedup import deduplicate_papers
+
+    papers: List[PaperItem] = []
+    for path in args.inputs:
+        papers.extend(_load_papers(path))
+
+    near_threshold = getattr(args, "near_duplicates", None)
+    merged, stats = deduplicate_papers(
+        papers,
+        near_duplicates=near_threshold is not None,
+        near_threshold=near_threshold or 0.8,
+        merge=True,
+    )
+    _save_papers(merged, args.output)
+    print(
+        f"Merged {len(merged)} papers from {len(args.inputs)} files "
+        f"({stats['dropped_count']} duplicates dropped) -> {args.output}"
+    )
+    for cluster in stats.get("near_duplicate_clusters", []):
+        print(f"  near duplicates of: {cluster['kept']}")
+        for duplicate in cluster["duplicates"]:
+            print(f"    {duplicate['similarity']:.2f}  {duplicate['title']}")
+
+
 async def _handle_filter(args: argparse.Namespace) -> None:
     from src.filters.pipeline import FilterPipeline
 
     papers = _load_papers(args.input)
+    with _open_identity_index(args) as index:
+        min_date = None
+        if args.min_date:
+            min_date = date.fromisoformat(args.min_date)
+
+        query = getattr(args, "query", None)
+        if query:
+            from src.filters.query import QuerySyntaxError, compile_query
+
+            try:
+                compile_query(query)
+            except QuerySyntaxError as exc:
+                print(f"Error: invalid --query: {exc}", file=sys.stderr)
+                sys.exit(1)
 
-    min_date = None
-    if args.min_date:
-        min_date = date.fromisoformat(args.min_date)
-
-    keywords = args.keywords or []
-    auto_generate_keywords = not keywords and not any(
-        [
-            args.exclude,
-            args.authors,
-            args.min_date,
-            args.has_pdf,
-        ]
-    )
-    if auto_generate_keywords:
-        from src.ai.keyword_generator import KeywordGenerator
-
-        try:
-            keywords = await KeywordGenerator().extract_keywords()
-            if keywords:
-                logger.info(
-                    "Auto-generated keywords from RESEARCH_PROMPT: %s",
-                    keywords,
-                )
-            else:
+        keywords = args.keywords or []
+        auto_generate_keywords = not keywords and not any(
+            [
+                args.exclude,
+                args.authors,
+                args.min_date,
+                args.has_pdf,
+                query,
+            ]
+        )
+        if auto_generate_keywords:
+            from src.ai.keyword_generator import KeywordGenerator
+
+            try:
+                keywords = await KeywordGenerator().extract_keywords()
+                if keywords:
+                    logger.info(
+                        "Auto-generated keywords from RESEARCH_PROMPT: %s",
+                        keywords,
+                    )
+                else:
+                    print(
+                        "Error: no keywords available. "
+                        "Provide --keywords or configure RESEARCH_PROMPT with a valid AI API key.",
+                        file=sys.stderr,
+                    )
+                    sys.exit(1)
+            except Exception as exc:
                 print(
-                    "Error: no keywords available. "
-                    "Provide --keywords or configure RESEARCH_PROMPT with a valid AI API key.",
+                    f"Error: failed to generate keywords from RESEARCH_PROMPT: {exc}",
                     file=sys.stderr,
                 )
                 sys.exit(1)
-        except Exception as exc:
-            print(
-                f"Error: failed to generate keywords from RESEARCH_PROMPT: {exc}",
-                file=sys.stderr,
+        elif not keywords:
+            logger.info(
+                "No keywords provided; running with non-keyword filters only."
             )
-            sys.exit(1)
-    elif not keywords:
-        logger.info(
-            "No keywords provided; running with non-keyword filters only."
-        )
 
-    criteria = FilterCriteria(
-        keywords=keywords,
-        exclude_keywords=args.exclude or [],
-        authors=args.authors or [],
-        min_date=min_date,
-        has_pdf=args.has_pdf,
-    )
+        criteria = FilterCriteria(
+            keywords=keywords,
+            exclude_keywords=args.exclude or [],
+            authors=args.authors or [],
+            min_date=min_date,
+            has_pdf=args.has_pdf,
+            query=query or None,
+        )
 
-    use_semantic_filter = getattr(
-        args, "semantic_filter", getattr(args, "ai", True)
-    )
-    llm_client = _build_llm_client(use_semantic_filter)
+        use_semantic_filter = getattr(
+            args, "semantic_filter", getattr(args, "ai", True)
+        )
+        llm_client = _build_llm_client(use_semantic_filter)
 
-    pipeline = FilterPipeline(llm_client=llm_client)
-    result: FilterResult = await pipeline.filter(papers, criteria)
+        scope = _filter_scope(criteria, llm_client is not None)
+        papers = _skip_processed(index, papers, "filtered", scope=scope)
+        pipeline = FilterPipeline(llm_client=llm_client)
+        result: FilterResult = await pipeline.filter(papers, criteria)
 
-    _save_papers(result.papers, args.output)
-    print(
-        f"Filtered: {result.passed_count} passed, "
-        f"{result.rejected_count} rejected "
-        f"(from {result.total_count} total) -> {args.output}"
-    )
+        _save_papers(result.papers, args.output)
+        if index is not None:
+            index.record(result.papers, "filtered")
+            index.record_checked(papers, "filtered", scope)
+        print(
+            f"Filtered: {result.passed_count} passed, "
+            f"{result.rejected_count} rejected "
+            f"(from {result.total_count} total) -> {args.output}"
+        )
 
 
 async def _handle_export(args: argparse.Namespace) -> None:
     papers = _load_papers(args.input)
-    input_name = Path(args.input).name.lower()
-    if input_name in {"raw.json", FETCH_OUTPUT_FILENAME}:
-        print(
-            "Warning: exporting from fetched/raw input means filter step was not applied.",
-            file=sys.stderr,
-        )
+    with _open_identity_index(args) as index:
+        papers = _skip_processed(index, papers, "exported")
+        input_name = Path(args.input).name.lower()
+        if input_name in {"raw.json", FETCH_OUTPUT_FILENAME}:
+            print(
+                "Warning: exporting from fetched/raw input means filter step was not applied.",
+                file=sys.stderr,
+            )
 
-    if args.format == "json":
-        from src.adapters.json import JSONAdapter
+        if args.format == "json":
+            from src.adapters.json import JSONAdapter
 
-        adapter = JSONAdapter()
-        await adapter.export(
-            papers,
-            args.output,
-            include_metadata=args.include_metadata,
-        )
-    elif args.format == "zotero":
-        from src.adapters.zotero import ZoteroAdapter
+            adapter = JSONAdapter()
+            await adapter.export(
+                papers,
+                args.output,
+                include_metadata=args.include_metadata,
+            )
+        elif args.format == "zotero":
+            from src.adapters.zotero import ZoteroAdapter
 
-        zotero_config = get_zotero_config()
-        collection_id = (
-            getattr(args, "collection", None)
-            or zotero_config.get("target_collection")
-        )
-        adapter = ZoteroAdapter(
-            library_id=zotero_config["library_id"],
-            api_key=zotero_config["api_key"],
-            library_type=zotero_config.get("library_type", "user"),
-        )
-        result = await adapter.export(papers, collection_id=collection_id)
-        _save_json(
-            {
-                "format": "zotero",
-                "input_file": args.input,
-                "output_file": args.output,
-                "collection": collection_id or "root",
-                "total": len(papers),
-                **result,
-            },
-            args.output,
-        )
-        print(
-            "Zotero export stats: "
-            f"created={result.get('success_count', 0)}, "
-            f"skipped={result.get('skipped_count', 0)}, "
-            f"failed={len(result.get('failures', []))}, "
-            f"collection={collection_id or 'root'}"
-        )
-    else:
-        print(
-            f"Error: unknown format: {args.format}",
-            file=sys.stderr,
-        )
-        sys.exit(1)
+            zotero_config = get_zotero_config()
+            collection_id = (
+                getattr(args, "collection", None)
+                or zotero_config.get("target_collection")
+            )
+            adapter = ZoteroAdapter(
+                library_id=zotero_config["library_id"],
+                api_key=zotero_config["api_key"],
+                library_type=zotero_config.get("library_type", "user"),
+                dedup_false_positive_rate=zotero_config.get("dedup_false_positive_rate"),
+            )
+            result = await adapter.export(papers, collection_id=collection_id)
+            _save_json(
+                {
+                    "format": "zotero",
+                    "input_file": args.input,
+                    "output_file": args.output,
+                    "collection": collection_id or "root",
+                    "total": len(papers),
+                    **result,
+                },
+                args.output,
+            )
+            print(
+                "Zotero export stats: "
+                f"created={result.get('success_count', 0)}, "
+                f"skipped={result.get('skipped_count', 0)}, "
+                f"failed={len(result.get('failures', []))}, "
+                f"collection={collection_id or 'root'}"
+            )
+        else:
+            print(
+                f"Error: unknown format: {args.format}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
 
-    print(f"Exported {len(papers)} papers ({args.format}) -> {args.output}")
+        if index is not None:
+            failed_titles = set()
+            if args.format == "zotero":
+                failed_titles = {f.get("title") for f in result.get("failures", [])}
+            index.record(
+                [p for p in papers if p.title not in failed_titles], "exported"
+            )
+
+        print(f"Exported {len(papers)} papers ({args.format}) -> {args.output}")
 
 
 async def _handle_enrich(args: argparse.Namespace) -> None:
@@ -293,52 +525,62 @@ async def _handle_enrich(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     papers = _load_papers(args.input)
+    with _open_identity_index(args) as index:
+        papers = _skip_processed(index, papers, "enriched")
 
-    use_crossref = args.source in ("crossref", "all")
-    use_openalex = args.source in ("openalex", "all")
+        use_crossref = args.source in ("crossref", "all")
+        use_openalex = args.source in ("openalex", "all")
 
-    semaphore = asyncio.Semaphore(args.concurrency)
+        semaphore = asyncio.Semaphore(args.concurrency)
 
-    crossref_client = None
-    openalex_client = None
-    if use_crossref:
-        from src.sources.crossref import CrossrefClient
+        crossref_client = None
+        openalex_client = None
+        if use_crossref:
+            from src.sources.crossref import CrossrefClient
 
-        crossref_client = CrossrefClient()
-    if use_openalex:
-        from src.sources.openalex import OpenAlexClient
+            crossref_client = CrossrefClient()
+        if use_openalex:
+            from src.sources.openalex import OpenAlexClient
 
-        openalex_client = OpenAlexClient()
+            openalex_client = OpenAlexClient()
 
-    async def _enrich_one(paper: PaperItem) -> PaperItem:
-        async with semaphore:
-            result = paper
+        async def _enrich_one(paper: PaperItem) -> PaperItem:
+            async with semaphore:
+                result = paper
 
-            if use_crossref:
-                assert crossref_client is not None
-                result = await crossref_client.enrich_paper(result)
+                if use_crossref:
+                    assert crossref_client is not None
+                    result = await crossref_client.enrich_paper(result)
 
-            if use_openalex:
-                assert openalex_client is not None
-                result = await openalex_client.enrich_paper(result)
+                if use_openalex:
+                    assert openalex_client is not None
+                    result = await openalex_client.enrich_paper(result)
 
-            return result
+                return result
 
-    try:
-        tasks = [_enrich_one(p) for p in papers]
-        results = await asyncio.gather(*tasks)
-    finally:
-        if crossref_client is not None:
-            await crossref_client.close()
-        if openalex_client is not None:
-            await openalex_client.close()
-
-    final_papers = [p for p in results if p is not None]
-
-    _save_papers(list(final_papers), args.output)
+        try:
+            tasks = [_enrich_one(p) for p in papers]
+            results = await asyncio.gather(*tasks)
+        finally:
+            if crossref_client is not None:
+                await crossref_client.close()
+            if openalex_client is not None:
+                await openalex_client.close()
+
+        final_papers = [p for p in results if p is not None]
+        enriched = [
+            (orig, enr)
+            for orig, enr in zip(papers, results)
+            if enr is not None and orig != enr
+        ]
+        _save_papers(list(final_papers), args.output)
+        if index is not None:
+            # Papers no source had metadata for stay pending, so a later
+            # run can try them again; both identities of an enriched paper
+            # are recorded because enrichment may add a DOI.
+            index.record([p for pair in enriched for p in pair], "enriched")
 
-    enriched_count = sum(1 for orig, enr in zip(papers, final_papers) if orig != enr)
-    print(f"Enriched {enriched_count}/{len(papers)} papers -> {args.output}")
+        print(f"Enriched {len(enriched)}/{len(papers)} papers -> {args.output}")
 
 
 def _delete_output_dir(output_dir: str, force: bool = False) -> None:
@@ -451,12 +693,89 @@ def _build_parser() -> argparse.ArgumentParser:
         default=default_since,
         help="仅抓取自此日期之后（YYYY-MM-DD，默认近15天）",
     )
+    fetch_parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        help="RSS 条件请求缓存目录（ETag/Last-Modified；默认读取 RSS_CACHE_DIR）",
+    )
+    fetch_parser.add_argument(
+        "--archive-dir",
+        dest="archive_dir",
+        help="RSS 原始响应归档目录（gzip 内容寻址；默认读取 RSS_ARCHIVE_DIR）",
+    )
+    fetch_parser.add_argument(
+        "--from-archive",
+        dest="from_archive",
+        action="store_true",
+        help="离线模式：不访问网络，用归档中的最新响应重新解析 RSS 源",
+    )
+    fetch_parser.add_argument(
+        "--slowest",
+        dest="slowest",
+        type=int,
+        default=5,
+        help="打印耗时最长的 N 个 RSS 源（0 关闭；统计另存为 rss_fetch_stats.json）",
+    )
+    fetch_parser.add_argument(
+        "--shard",
+        type=_shard_spec,
+        help="只抓取第 i/N 个分片的 RSS 源（按 URL 哈希划分，i 从 1 开始），结果用 merge 合并",
+    )
+    fetch_parser.add_argument(
+        "--parse-workers",
+        dest="parse_workers",
+        type=int,
+        help="RSS 解析进程数（0 为线程解析；默认读取 RSS_PARSE_WORKERS）",
+    )
+    fetch_parser.add_argument(
+        "--force-all",
+        dest="force_all",
+        action="store_true",
+        help="忽略自适应轮询计划与失败退避，抓取全部 RSS 源",
+    )
+    fetch_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="增量模式：仅输出此前增量运行未见过的 RSS 条目（需要缓存目录）",
+    )
+    fetch_parser.add_argument(
+        "--budget-seconds",
+        "--deadline",
+        dest="budget_seconds",
+        type=_positive_float,
+        help="RSS 抓取总时长上限（秒）；超时后取消未完成的源并返回已抓取结果",
+    )
+    _add_identity_index_arg(fetch_parser)
     _add_output_arg(
         fetch_parser,
         FETCH_OUTPUT_FILENAME,
         "输出 JSON 文件路径（默认：output/YYYY-MM-DD/fetched_papers.json）",
     )
 
+    merge_parser = subparsers.add_parser(
+        "merge", help="合并多个抓取结果（如分片输出）并去重（重复项字段合并，保留信息最全的一条）"
+    )
+    merge_parser.add_argument(
+        "-i",
+        "--input",
+        dest="inputs",
+        nargs="+",
+        required=True,
+        help="待合并的 JSON 文件（可多个）",
+    )
+    merge_parser.add_argument(
+        "--near-duplicates",
+        type=_similarity,
+        nargs="?",
+        const=0.8,
+        help="同时按标题相似度（MinHash/LSH，Jaccard 阈值，默认 0.8）去除近似重复",
+    )
+    _add_output_arg(
+        merge_parser,
+        FETCH_OUTPUT_FILENAME,
+        "输出 JSON 文件路径（默认：output/YYYY-MM-DD/fetched_papers.json）",
+    )
+
     filter_parser = subparsers.add_parser(
         "filter", help="按条件过滤论文"
     )
@@ -486,6 +805,14 @@ def _build_parser() -> argparse.ArgumentParser:
         nargs="+",
         help="作者过滤（OR 逻辑）",
     )
+    filter_parser.add_argument(
+        "-q",
+        "--query",
+        help=(
+            '布尔查询，与其他条件取交集（AND/OR/NOT 或 -词、"短语"、'
+            "title:/abstract:/author:/journal: 字段、* ? 通配符）"
+        ),
+    )
     filter_parser.add_argument(
         "--min-date",
         "--after",
@@ -521,6 +848,7 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_false",
         help="禁用语义过滤（等价于旧参数 --no-ai）",
     )
+    _add_identity_index_arg(filter_parser)
 
     export_parser = subparsers.add_parser(
         "export", help="导出论文到指定格式"
@@ -561,6 +889,7 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_false",
         help="导出时去除扩展字段",
     )
+    _add_identity_index_arg(export_parser)
 
     enrich_parser = subparsers.add_parser(
         "enrich",
@@ -591,6 +920,7 @@ def _build_parser() -> argparse.ArgumentParser:
         default=5,
         help="最大并发数（默认：5）",
     )
+    _add_identity_index_arg(enrich_parser)
 
     delete_parser = subparsers.add_parser(
         "delete",
@@ -638,6 +968,7 @@ def main() -> None:
 
     handlers = {
         "fetch": _handle_fetch,
+        "merge": _handle_merge,
         "filter": _handle_filter,
         "export": _handle_export,
         "enrich": _handle_enrich,
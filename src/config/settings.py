@@ -44,6 +44,17 @@ class PaperFeedSettings(BaseSettings):
     )
     rss_timeout: int = 30
     rss_max_concurrent: int = 10
+    rss_max_per_host: int = 4
+    rss_http2: bool = False
+    rss_keepalive_expiry: float = 30.0
+    rss_max_feed_bytes: int = 10 * 1024 * 1024
+    rss_cache_dir: Optional[str] = None
+    rss_archive_dir: Optional[str] = None
+    rss_parse_workers: int = 0
+    rss_fast_parser: bool = True
+    rss_failure_threshold: int = 3
+    rss_backoff_hours: float = 24.0
+    rss_adaptive_schedule: bool = True
 
     # ---- Gmail ----
     gmail_token_json: Optional[str] = None
@@ -103,6 +114,7 @@ class PaperFeedSettings(BaseSettings):
     zotero_api_key: str = ""
     zotero_library_type: str = "user"
     target_collection: str = "00_INBOXS_AA"
+    zotero_dedup_false_positive_rate: float = 0.001
 
     # ---- Derived accessors (compatibility with old config functions) ----
 
@@ -136,6 +148,17 @@ class PaperFeedSettings(BaseSettings):
             "user_agent": self.paper_feed_user_agent,
             "timeout": self.rss_timeout,
             "max_concurrent": self.rss_max_concurrent,
+            "max_per_host": self.rss_max_per_host,
+            "http2": self.rss_http2,
+            "keepalive_expiry": self.rss_keepalive_expiry,
+            "max_feed_bytes": self.rss_max_feed_bytes,
+            "cache_dir": self.rss_cache_dir,
+            "archive_dir": self.rss_archive_dir,
+            "parse_workers": self.rss_parse_workers,
+            "fast_parser": self.rss_fast_parser,
+            "failure_threshold": self.rss_failure_threshold,
+            "backoff_hours": self.rss_backoff_hours,
+            "adaptive_schedule": self.rss_adaptive_schedule,
         }
 
     def get_crossref_config(self) -> dict:
@@ -162,6 +185,7 @@ class PaperFeedSettings(BaseSettings):
             "api_key": self.zotero_api_key,
             "library_type": self.zotero_library_type,
             "target_collection": self.target_collection,
+            "dedup_false_positive_rate": self.zotero_dedup_false_positive_rate,
         }
 
     def get_research_prompt(self) -> Optional[str]:
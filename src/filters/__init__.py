@@ -1,6 +1,7 @@
 """Filter pipeline and stages for paper filtering."""
 
 from src.filters.ai_filter import AIFilterStage
+from src.filters.inverted_index import PaperIndex
 from src.filters.keyword import KeywordFilterStage
 from src.filters.pipeline import FilterPipeline
 
@@ -8,4 +9,5 @@ __all__ = [
     "FilterPipeline",
     "KeywordFilterStage",
     "AIFilterStage",
+    "PaperIndex",
 ]
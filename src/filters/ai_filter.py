@@ -161,7 +161,7 @@ class AIFilterStage:
     def _build_papers_text(self, items: List[PaperItem]) -> str:
         lines: List[str] = []
         for i, item in enumerate(items):
-            abstract = (item.abstract or "").strip()
+            abstract = item.text_analysis.abstract_text
             if len(abstract) > 500:
                 abstract = abstract[:500] + "..."
             lines.append(f"### [{i}] {item.title}")
@@ -0,0 +1,205 @@
+"""In-memory inverted index over a paper corpus for repeated keyword queries."""
+
+import re
+from collections import defaultdict
+from typing import Callable, Dict, FrozenSet, Iterable, List, Pattern, Set, Tuple
+
+from src.models.responses import PaperItem
+
+_WORD = re.compile(r"\w+")
+
+
+def _journal_text(paper: PaperItem) -> str:
+    names = (paper.publication_title, paper.journal_abbreviation, paper.source)
+    return "\n".join(name.lower() for name in names if name)
+
+
+# Lowercased text of each searchable field. Multi-valued fields are joined
+# with newlines, which no query term contains, so substring matching over
+# the joined text equals matching any single value.
+FIELD_TEXT: Dict[str, Callable[[PaperItem], str]] = {
+    "text": lambda paper: paper.text_analysis.lower_text,
+    "title": lambda paper: paper.title.lower(),
+    "abstract": lambda paper: paper.abstract.lower(),
+    "author": lambda paper: "\n".join(a.lower() for a in paper.authors),
+    "journal": _journal_text,
+}
+
+
+class _FieldIndex:
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        postings: Dict[str, Set[int]] = defaultdict(set)
+        for paper_id, text in enumerate(texts):
+            for token in _WORD.findall(text):
+                postings[token].add(paper_id)
+        self.postings: Dict[str, FrozenSet[int]] = {
+            token: frozenset(ids) for token, ids in postings.items()
+        }
+        self.word_cache: Dict[str, FrozenSet[int]] = {}
+
+
+class PaperIndex:
+    """Token -> posting set of paper ids, built once per corpus.
+
+    Paper ids are positions in :attr:`papers`. Queries keep the exact
+    semantics of :class:`~src.filters.keyword.KeywordFilterStage`: a keyword
+    matches when it is a case-insensitive substring of ``title abstract``,
+    an author query when it is a substring of any author name. Each word of
+    a keyword must lie inside one indexed token, so the candidates are the
+    intersection, over the keyword's words, of the unions of postings of
+    vocabulary tokens containing that word; only multi-word or punctuated
+    keywords are then confirmed against the candidates' text. Results are
+    memoized per term, so re-running a query with overlapping keyword sets
+    only resolves the new terms.
+
+    Besides the combined ``text`` field, each field of :data:`FIELD_TEXT`
+    is indexed the same way on first use, for field-scoped queries.
+    """
+
+    def __init__(self, papers: Iterable[PaperItem]):
+        self.papers: List[PaperItem] = list(papers)
+        self.all_ids: FrozenSet[int] = frozenset(range(len(self.papers)))
+        self._fields: Dict[str, _FieldIndex] = {}
+        self._field("text")
+
+        author_postings: Dict[str, Set[int]] = defaultdict(set)
+        for paper_id, paper in enumerate(self.papers):
+            for author in paper.authors:
+                author_postings[author.lower()].add(paper_id)
+        self._author_postings: Dict[str, FrozenSet[int]] = {
+            name: frozenset(ids) for name, ids in author_postings.items()
+        }
+        self._keyword_cache: Dict[Tuple[str, str], FrozenSet[int]] = {}
+        self._author_cache: Dict[str, FrozenSet[int]] = {}
+        self._wildcard_cache: Dict[Tuple[str, str], FrozenSet[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.papers)
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._fields["text"].postings)
+
+    def _field(self, field: str) -> _FieldIndex:
+        index = self._fields.get(field)
+        if index is None:
+            try:
+                text_of = FIELD_TEXT[field]
+            except KeyError:
+                raise ValueError(
+                    f"Unknown field {field!r}; expected one of {sorted(FIELD_TEXT)}"
+                ) from None
+            index = _FieldIndex([text_of(paper) for paper in self.papers])
+            self._fields[field] = index
+        return index
+
+    def _containing_word(self, index: _FieldIndex, word: str) -> FrozenSet[int]:
+        ids = index.word_cache.get(word)
+        if ids is None:
+            ids = frozenset().union(
+                *(
+                    postings
+                    for token, postings in index.postings.items()
+                    if word in token
+                )
+            )
+            index.word_cache[word] = ids
+        return ids
+
+    def match_keyword(self, keyword: str, field: str = "text") -> FrozenSet[int]:
+        """Ids of papers whose ``field`` text contains ``keyword``."""
+        keyword = keyword.lower()
+        ids = self._keyword_cache.get((field, keyword))
+        if ids is not None:
+            return ids
+
+        index = self._field(field)
+        words = _WORD.findall(keyword)
+        if len(words) == 1 and words[0] == keyword:
+            ids = self._containing_word(index, keyword)
+        else:
+            candidates = self.all_ids
+            for postings in sorted(
+                (self._containing_word(index, w) for w in set(words)), key=len
+            ):
+                candidates = candidates & postings
+                if not candidates:
+                    break
+            ids = frozenset(i for i in candidates if keyword in index.texts[i])
+        self._keyword_cache[(field, keyword)] = ids
+        return ids
+
+    def match_wildcard(self, term: str, field: str = "text") -> FrozenSet[int]:
+        """Ids of papers whose ``field`` text matches wildcard ``term``.
+
+        A term made only of word characters and wildcards matches whole
+        tokens and is resolved against the vocabulary; any other term is
+        searched in each paper's text.
+        """
+        term = term.lower()
+        ids = self._wildcard_cache.get((field, term))
+        if ids is None:
+            index = self._field(field)
+            if _WILDCARD_TOKEN.fullmatch(term):
+                body = re.compile(_wildcard_body(term))
+                ids = frozenset().union(
+                    *(
+                        postings
+                        for token, postings in index.postings.items()
+                        if body.fullmatch(token)
+                    )
+                )
+            else:
+                pattern = wildcard_pattern(term)
+                ids = frozenset(
+                    i for i, text in enumerate(index.texts) if pattern.search(text)
+                )
+            self._wildcard_cache[(field, term)] = ids
+        return ids
+
+    def match_any(self, keywords: Iterable[str]) -> FrozenSet[int]:
+        return frozenset().union(*(self.match_keyword(k) for k in keywords))
+
+    def match_author(self, author: str) -> FrozenSet[int]:
+        """Ids of papers with an author name containing ``author``."""
+        author = author.lower()
+        ids = self._author_cache.get(author)
+        if ids is None:
+            ids = frozenset().union(
+                *(
+                    postings
+                    for name, postings in self._author_postings.items()
+                    if author in name
+                )
+            )
+            self._author_cache[author] = ids
+        return ids
+
+    def match_any_author(self, authors: Iterable[str]) -> FrozenSet[int]:
+        return frozenset().union(*(self.match_author(a) for a in authors))
+
+
+_WILDCARD_TOKEN = re.compile(r"[\w*?]+")
+
+
+def _wildcard_body(term: str) -> str:
+    parts = []
+    for ch in term:
+        if ch == "*":
+            parts.append(r"\w*")
+        elif ch == "?":
+            parts.append(r"\w")
+        else:
+            parts.append(re.escape(ch))
+    return "".join(parts)
+
+
+def wildcard_pattern(term: str) -> Pattern[str]:
+    """Compile a ``*``/``?`` wildcard term to a regex over lowercased text.
+
+    ``*`` stands for any run of word characters and ``?`` for exactly one;
+    the match must start and end on word boundaries, so ``batter*``
+    matches ``battery`` and ``batteries`` but not ``abattery``.
+    """
+    return re.compile(r"(?<!\w)" + _wildcard_body(term.lower()) + r"(?!\w)")
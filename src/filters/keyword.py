@@ -1,7 +1,66 @@
 """Keyword-based filter stage for paper filtering."""
 
-from typing import List, Tuple
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Sequence, Tuple
+from src.filters.inverted_index import PaperIndex
+from src.filters.query import compile_query
 from src.models.responses import PaperItem, FilterCriteria
+from src.utils.aho_corasick import AhoCorasick
+
+# Below this many distinct keywords, C-level ``str.__contains__`` per keyword
+# beats a pure-Python automaton pass over the text.
+_AUTOMATON_MIN_PATTERNS = 100
+
+
+class KeywordMatcher:
+    """Include and exclude keywords compiled for a single pass per text.
+
+    With many keywords all of them are found by one :class:`AhoCorasick`
+    scan that stops at the first exclude hit, or at the first include hit
+    when there are no excludes. Matching is case-insensitive substring
+    matching on pre-lowercased text, as before.
+    """
+
+    def __init__(
+        self, keywords: Sequence[str] = (), exclude_keywords: Sequence[str] = ()
+    ):
+        self.include = tuple(dict.fromkeys(k.lower() for k in keywords))
+        self.exclude = tuple(dict.fromkeys(k.lower() for k in exclude_keywords))
+        self._automaton: Optional[AhoCorasick] = None
+        if len(self.include) + len(self.exclude) >= _AUTOMATON_MIN_PATTERNS:
+            self._automaton = AhoCorasick(self.exclude + self.include)
+
+    def scan(self, text: str) -> Tuple[bool, bool]:
+        """Return ``(excluded, included)`` for lowercased ``text``.
+
+        ``included`` is only meaningful when ``excluded`` is False.
+        """
+        if self._automaton is None:
+            if any(keyword in text for keyword in self.exclude):
+                return True, False
+            return False, any(keyword in text for keyword in self.include)
+
+        exclude_count = len(self.exclude)
+        included = False
+        for pattern_id in self._automaton.iter_matches(text):
+            if pattern_id < exclude_count:
+                return True, included
+            included = True
+            if not exclude_count:
+                break
+        return False, included
+
+
+@lru_cache(maxsize=32)
+def compile_keywords(
+    keywords: Tuple[str, ...], exclude_keywords: Tuple[str, ...] = ()
+) -> KeywordMatcher:
+    """Cached :class:`KeywordMatcher` for repeated identical criteria."""
+    return KeywordMatcher(keywords, exclude_keywords)
+
+
+def _paper_text(paper: PaperItem) -> str:
+    return paper.text_analysis.lower_text
 
 
 class KeywordFilterStage:
@@ -14,36 +73,67 @@ class KeywordFilterStage:
             or criteria.authors
             or criteria.has_pdf
             or criteria.min_date is not None
+            or criteria.query
         )
 
     async def filter(
-        self, papers: List[PaperItem], criteria: FilterCriteria
+        self,
+        papers: List[PaperItem],
+        criteria: FilterCriteria,
+        index: Optional[PaperIndex] = None,
     ) -> Tuple[List[PaperItem], List[str]]:
+        """Apply the criteria, resolving text and authors through ``index``
+        when one built over ``papers`` is given instead of scanning."""
         if not self.is_applicable(criteria):
             return papers, []
 
         filtered = []
         messages = []
-
-        for paper in papers:
-            if criteria.exclude_keywords and self._should_exclude(
-                paper, criteria.exclude_keywords
-            ):
+        matcher = compile_keywords(
+            tuple(criteria.keywords), tuple(criteria.exclude_keywords)
+        )
+        scan_text = bool(criteria.keywords or criteria.exclude_keywords)
+        query = compile_query(criteria.query) if criteria.query else None
+        if index is not None:
+            excluded_ids = index.match_any(criteria.exclude_keywords)
+            included_ids = index.match_any(criteria.keywords)
+            author_ids: FrozenSet[int] = index.match_any_author(criteria.authors)
+            query_ids = query.select(index) if query is not None else index.all_ids
+
+        for paper_id, paper in enumerate(papers):
+            if index is not None:
+                excluded = paper_id in excluded_ids
+                included = paper_id in included_ids
+            else:
+                excluded, included = (
+                    matcher.scan(_paper_text(paper)) if scan_text else (False, True)
+                )
+            if criteria.exclude_keywords and excluded:
                 messages.append(
                     f"Excluded: '{paper.title[:50]}...' (matched exclude keyword)"
                 )
                 continue
 
-            if criteria.keywords and not self._matches_keywords(
-                paper, criteria.keywords
-            ):
+            if criteria.keywords and not included:
                 messages.append(
                     f"Filtered: '{paper.title[:50]}...' "
                     f"(no matching keywords)"
                 )
                 continue
 
-            if criteria.authors and not self._matches_authors(paper, criteria.authors):
+            if query is not None and not (
+                paper_id in query_ids if index is not None else query.matches(paper)
+            ):
+                messages.append(
+                    f"Filtered: '{paper.title[:50]}...' (query not matched)"
+                )
+                continue
+
+            if criteria.authors and not (
+                paper_id in author_ids
+                if index is not None
+                else self._matches_authors(paper, criteria.authors)
+            ):
                 messages.append(
                     f"Filtered: '{paper.title[:50]}...' (no matching authors)"
                 )
@@ -67,8 +157,7 @@ class KeywordFilterStage:
         return filtered, messages
 
     def _matches_keywords(self, paper: PaperItem, keywords: List[str]) -> bool:
-        text = (paper.title + " " + paper.abstract).lower()
-        return any(keyword.lower() in text for keyword in keywords)
+        return compile_keywords(tuple(keywords)).scan(_paper_text(paper))[1]
 
     def _matches_authors(self, paper: PaperItem, authors: List[str]) -> bool:
         paper_authors = [author.lower() for author in paper.authors]
@@ -78,8 +167,7 @@ class KeywordFilterStage:
         )
 
     def _should_exclude(self, paper: PaperItem, exclude_keywords: List[str]) -> bool:
-        text = (paper.title + " " + paper.abstract).lower()
-        return any(keyword.lower() in text for keyword in exclude_keywords)
+        return compile_keywords((), tuple(exclude_keywords)).scan(_paper_text(paper))[0]
 
     def _has_pdf(self, paper: PaperItem) -> bool:
         return paper.pdf_url is not None
@@ -1,9 +1,10 @@
 """Filter pipeline for applying multiple filter stages."""
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from src.models.responses import FilterCriteria, FilterResult, PaperItem
+from src.filters.inverted_index import PaperIndex
 from src.filters.keyword import KeywordFilterStage
 
 logger = logging.getLogger(__name__)
@@ -31,12 +32,15 @@ class FilterPipeline:
         self,
         papers: List[PaperItem],
         criteria: FilterCriteria,
+        index: Optional[PaperIndex] = None,
     ) -> FilterResult:
         total_count = len(papers)
         filter_stats: Dict[str, Any] = {}
 
         if self.keyword_stage.is_applicable(criteria):
-            papers, messages = await self.keyword_stage.filter(papers, criteria)
+            papers, messages = await self.keyword_stage.filter(
+                papers, criteria, index=index
+            )
             filter_stats["keyword_filter"] = {
                 "input_count": total_count,
                 "output_count": len(papers),
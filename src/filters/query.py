@@ -0,0 +1,249 @@
+"""Boolean paper query language, parsed once and compiled to a matcher.
+
+Syntax::
+
+    zinc AND (anode OR "solid electrolyte interphase") NOT review
+    title:operando author:smith -journal:"chemrxiv"
+    abstract:batter* title:(xas OR xanes)
+
+* Terms are case-insensitive substrings, as with keyword filtering.
+  ``"quoted phrases"`` may contain spaces and operator words.
+* ``AND``, ``OR`` and ``NOT`` must be uppercase. Adjacent terms are
+  ANDed, ``AND`` binds tighter than ``OR``, and ``-term`` is ``NOT term``.
+* ``title:``, ``abstract:``, ``author:`` and ``journal:`` scope a term,
+  phrase or parenthesized group to one field; unscoped terms search title
+  and abstract. ``journal:`` covers the publication title, its
+  abbreviation and the feed source name.
+* In unquoted terms ``*`` matches any run of word characters and ``?``
+  one word character, anchored at word boundaries (``batter*`` matches
+  ``battery`` and ``batteries``).
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from src.filters.inverted_index import FIELD_TEXT, PaperIndex, wildcard_pattern
+from src.models.responses import PaperItem
+from src.utils.errors import FilterError
+
+QUERY_FIELDS: Tuple[str, ...] = ("title", "abstract", "author", "journal")
+
+_TOKEN = re.compile(
+    r"(?P<lparen>\()|(?P<rparen>\))|(?P<minus>-(?=[^\s)-]))"
+    r"|(?P<field>(?:%s)):(?=[^\s)])"
+    r'|"(?P<phrase>[^"]*)"'
+    r'|(?P<word>[^\s()"]+)' % "|".join(QUERY_FIELDS),
+    re.IGNORECASE,
+)
+_OPERATORS = {"AND", "OR", "NOT"}
+
+
+class QuerySyntaxError(FilterError):
+    """Query string that cannot be parsed."""
+
+
+@dataclass(frozen=True)
+class Term:
+    field: str
+    text: str
+    wildcard: bool = False
+
+
+@dataclass(frozen=True)
+class And:
+    children: Tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    children: Tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Not:
+    child: "Node"
+
+
+Node = Union[Term, And, Or, Not]
+
+
+def _tokenize(source: str) -> List[Tuple[str, str]]:
+    tokens: List[Tuple[str, str]] = []
+    pos = 0
+    while True:
+        while pos < len(source) and source[pos].isspace():
+            pos += 1
+        if pos == len(source):
+            return tokens
+        match = _TOKEN.match(source, pos)
+        if match is None:
+            raise QuerySyntaxError(f"Unterminated quote at position {pos}")
+        kind = match.lastgroup or ""
+        value = match.group(kind)
+        if kind == "minus" or (kind == "word" and value in _OPERATORS):
+            kind = "NOT" if kind == "minus" else value
+        elif kind == "field":
+            value = value.lower()
+        tokens.append((kind, value))
+        pos = match.end()
+
+
+def _flatten(kind, children: List["Node"]) -> "Node":
+    """Merge nested nodes of the same kind, e.g. ``a (b c)`` into one AND."""
+    flat: List[Node] = []
+    for child in children:
+        flat.extend(child.children if isinstance(child, kind) else (child,))
+    return flat[0] if len(flat) == 1 else kind(tuple(flat))
+
+
+class _Parser:
+    def __init__(self, source: str):
+        self.tokens = _tokenize(source)
+        self.pos = 0
+
+    def _peek(self) -> str:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else "EOF"
+
+    def _take(self) -> Tuple[str, str]:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise QuerySyntaxError("Empty query")
+        node = self._or("text")
+        if self._peek() != "EOF":
+            raise QuerySyntaxError(f"Unexpected {self._take()[1]!r}")
+        return node
+
+    def _or(self, field: str) -> Node:
+        children = [self._and(field)]
+        while self._peek() == "OR":
+            self._take()
+            children.append(self._and(field))
+        return _flatten(Or, children)
+
+    def _and(self, field: str) -> Node:
+        children = [self._not(field)]
+        while self._peek() not in ("OR", "rparen", "EOF"):
+            if self._peek() == "AND":
+                self._take()
+            children.append(self._not(field))
+        return _flatten(And, children)
+
+    def _not(self, field: str) -> Node:
+        if self._peek() == "NOT":
+            self._take()
+            return Not(self._not(field))
+        return self._primary(field)
+
+    def _primary(self, field: str) -> Node:
+        kind = self._peek()
+        if kind == "EOF":
+            raise QuerySyntaxError("Query ends where a term was expected")
+        _, value = self._take()
+        if kind == "lparen":
+            node = self._or(field)
+            if self._peek() != "rparen":
+                raise QuerySyntaxError("Missing closing parenthesis")
+            self._take()
+            return node
+        if kind == "field":
+            return self._primary(value)
+        if kind == "phrase":
+            return Term(field, value.lower())
+        if kind == "word":
+            wildcard = "*" in value or "?" in value
+            if wildcard and not value.strip("*?"):
+                raise QuerySyntaxError(f"Wildcard term {value!r} has no letters")
+            return Term(field, value.lower(), wildcard)
+        raise QuerySyntaxError(f"Expected a term, got {value!r}")
+
+
+def parse_query(source: str) -> Node:
+    """Parse a query string into its syntax tree."""
+    return _Parser(source).parse()
+
+
+Matcher = Callable[[Callable[[str], str]], bool]
+
+
+class PaperQuery:
+    """A parsed query with two evaluators over the same tree.
+
+    :meth:`matches` tests one paper, reading each field's text at most once.
+    :meth:`select` answers for a whole corpus from a :class:`PaperIndex`:
+    terms become posting sets, ``AND`` intersects them (subtracting
+    negated children rather than complementing them), ``OR`` unions them.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.root = parse_query(source)
+        self._matcher = self._compile(self.root)
+
+    def __repr__(self) -> str:
+        return f"PaperQuery({self.source!r})"
+
+    def _compile(self, node: Node) -> Matcher:
+        if isinstance(node, Term):
+            field, text = node.field, node.text
+            if node.wildcard:
+                search = wildcard_pattern(text).search
+                return lambda get: search(get(field)) is not None
+            return lambda get: text in get(field)
+        if isinstance(node, Not):
+            child = self._compile(node.child)
+            return lambda get: not child(get)
+        children = [self._compile(c) for c in node.children]
+        if isinstance(node, And):
+            return lambda get: all(c(get) for c in children)
+        return lambda get: any(c(get) for c in children)
+
+    def matches(self, paper: PaperItem) -> bool:
+        texts: Dict[str, str] = {}
+
+        def get(field: str) -> str:
+            text = texts.get(field)
+            if text is None:
+                text = texts[field] = FIELD_TEXT[field](paper)
+            return text
+
+        return self._matcher(get)
+
+    def select(self, index: PaperIndex) -> FrozenSet[int]:
+        """Ids of the papers in ``index`` that match."""
+        return self._select(self.root, index)
+
+    def _select(self, node: Node, index: PaperIndex) -> FrozenSet[int]:
+        if isinstance(node, Term):
+            if node.wildcard:
+                return index.match_wildcard(node.text, node.field)
+            return index.match_keyword(node.text, node.field)
+        if isinstance(node, Not):
+            return index.all_ids - self._select(node.child, index)
+        if isinstance(node, Or):
+            return frozenset().union(*(self._select(c, index) for c in node.children))
+
+        included: Optional[FrozenSet[int]] = None
+        for postings in sorted(
+            (self._select(c, index) for c in node.children if not isinstance(c, Not)),
+            key=len,
+        ):
+            included = postings if included is None else included & postings
+            if not included:
+                return frozenset()
+        result = index.all_ids if included is None else included
+        for child in node.children:
+            if isinstance(child, Not):
+                result = result - self._select(child.child, index)
+        return result
+
+
+@lru_cache(maxsize=32)
+def compile_query(source: str) -> PaperQuery:
+    """Cached :class:`PaperQuery` for repeated identical query strings."""
+    return PaperQuery(source)
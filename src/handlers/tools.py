@@ -75,7 +75,7 @@ class ToolHandler:
             },
             {
                 "name": ToolName.FILTER_KEYWORDS.value,
-                "description": "Filter papers by keyword criteria",
+                "description": "Filter papers by keyword criteria or a boolean query",
                 "inputSchema": FilterKeywordsInput.model_json_schema(),
             },
             {
@@ -132,7 +132,9 @@ class ToolHandler:
                     limit=payload.limit,
                     since=payload.since,
                 )
-                return _ok(_papers_payload(papers)), False
+                report = self.fetch_service.last_rss_report
+                meta = report.to_dict() if report is not None else None
+                return _ok(_papers_payload(papers), meta), False
 
             if name == ToolName.FETCH_GMAIL.value:
                 payload = FetchGmailInput.model_validate(args)
@@ -152,6 +154,7 @@ class ToolHandler:
                     authors=payload.authors,
                     min_date=payload.min_date,
                     has_pdf=payload.has_pdf,
+                    query=payload.query,
                 )
                 return _ok(
                     {
@@ -0,0 +1,52 @@
+"""Lazily computed text forms of a paper, shared by filter stages."""
+
+from functools import cached_property
+from typing import FrozenSet
+
+
+class PaperTextAnalysis:
+    """Normalized title/abstract forms of one paper, each computed on first use.
+
+    Keyword filtering, keyword-generator matching and AI prompt building
+    all derive text from the same title and abstract;
+    :attr:`PaperItem.text_analysis` hands them one shared instance so each
+    form is computed at most once per paper. The analysis is a cache, not
+    data: ``PaperItem`` never serializes it and leaves it out of equality.
+    """
+
+    def __init__(self, title: str, abstract: str):
+        self.title = title
+        self.abstract = abstract
+
+    def __repr__(self) -> str:
+        return f"PaperTextAnalysis(title={self.title[:40]!r})"
+
+    def is_for(self, title: str, abstract: str) -> bool:
+        return self.title == title and self.abstract == abstract
+
+    @cached_property
+    def lower_text(self) -> str:
+        """``title abstract`` lowercased, for substring keyword matching."""
+        return f"{self.title} {self.abstract}".lower()
+
+    @cached_property
+    def norm_text(self) -> str:
+        """Title and abstract as space-separated words without punctuation."""
+        from src.utils.text import normalize_words
+
+        return normalize_words(f"{self.title} {self.abstract}")
+
+    @cached_property
+    def words(self) -> FrozenSet[str]:
+        return frozenset(self.norm_text.split())
+
+    @cached_property
+    def stems(self) -> FrozenSet[str]:
+        from src.utils.text import word_stem
+
+        return frozenset(word_stem(w) for w in self.words)
+
+    @cached_property
+    def abstract_text(self) -> str:
+        """Abstract with surrounding whitespace removed."""
+        return (self.abstract or "").strip()
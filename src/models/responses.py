@@ -7,7 +7,9 @@ from abc import ABC, abstractmethod
 from datetime import date
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from src.models.analysis import PaperTextAnalysis
 
 
 class PaperItem(BaseModel):
@@ -56,6 +58,25 @@ class PaperItem(BaseModel):
     source_id: Optional[str] = None
     extra: Dict[str, Any] = Field(default_factory=dict)
 
+    # Derived text forms; never serialized and ignored by equality.
+    _text_analysis: Optional[PaperTextAnalysis] = PrivateAttr(default=None)
+
+    def __eq__(self, other: object) -> bool:
+        # BaseModel equality also compares private attributes, which would
+        # make a paper differ from its copy once either built its analysis.
+        if not isinstance(other, PaperItem):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    @property
+    def text_analysis(self) -> PaperTextAnalysis:
+        """Cached text analysis, rebuilt if title or abstract changed."""
+        analysis = self._text_analysis
+        if analysis is None or not analysis.is_for(self.title, self.abstract):
+            analysis = PaperTextAnalysis(self.title, self.abstract)
+            self._text_analysis = analysis
+        return analysis
+
 
 class FilterCriteria(BaseModel):
     """Filter criteria for paper selection."""
@@ -65,6 +86,7 @@ class FilterCriteria(BaseModel):
     min_date: Optional[date] = None
     authors: List[str] = Field(default_factory=list)
     has_pdf: bool = False
+    query: Optional[str] = None  # boolean query, see src.filters.query
 
 
 class FilterResult(BaseModel):
@@ -3,7 +3,7 @@
 from datetime import date
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class FetchRSSInput(BaseModel):
@@ -43,7 +43,7 @@ class FilterKeywordsInput(BaseModel):
         ..., description="JSON string of papers array to filter"
     )
     keywords: List[str] = Field(
-        ..., description="Keywords to match (OR logic)"
+        default_factory=list, description="Keywords to match (OR logic)"
     )
     exclude: Optional[List[str]] = Field(
         None, description="Keywords to exclude"
@@ -55,6 +55,21 @@ class FilterKeywordsInput(BaseModel):
         None, description="Minimum publication date"
     )
     has_pdf: bool = Field(False, description="Require PDF availability")
+    query: Optional[str] = Field(
+        None,
+        description=(
+            "Boolean query ANDed with the other criteria: AND/OR/NOT "
+            '(or -term), "quoted phrases", title:/abstract:/author:/journal: '
+            "field scopes and * ? wildcards"
+        ),
+    )
+
+    @model_validator(mode="after")
+    def _require_keywords_or_query(self) -> "FilterKeywordsInput":
+        # Without either one every paper would pass the keyword stage.
+        if not self.keywords and not (self.query and self.query.strip()):
+            raise ValueError("Provide at least one of keywords or query")
+        return self
 
 
 class FilterAIInput(BaseModel):
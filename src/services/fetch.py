@@ -5,12 +5,15 @@ from typing import List, Optional
 
 from src.models.responses import PaperItem
 from src.sources.gmail import GmailSource
-from src.sources.rss import RSSSource
+from src.sources.rss import RSSFetchReport, RSSSource
 
 
 class FetchService:
     """Service for fetching papers from external sources."""
 
+    def __init__(self) -> None:
+        self.last_rss_report: Optional[RSSFetchReport] = None
+
     async def fetch_rss(
         self,
         opml_path: Optional[str] = None,
@@ -20,7 +23,9 @@ class FetchService:
         if limit is not None and limit < 1:
             raise ValueError("limit must be >= 1")
         source = RSSSource(opml_path=opml_path)
-        return await source.fetch_papers(limit=limit, since=since)
+        papers = await source.fetch_papers(limit=limit, since=since)
+        self.last_rss_report = source.last_report
+        return papers
 
     async def fetch_gmail(
         self,
@@ -1,6 +1,8 @@
 """Filtering service wrapping keyword and AI filtering."""
 
+import hashlib
 import json
+from collections import OrderedDict
 from datetime import date
 from typing import List, Optional
 
@@ -9,6 +11,7 @@ from openai import OpenAI
 from src.ai.keyword_generator import KeywordGenerator
 from src.config.settings import get_openai_config
 from src.filters.ai_filter import AIFilterStage
+from src.filters.inverted_index import PaperIndex
 from src.filters.pipeline import FilterPipeline
 from src.models.responses import FilterCriteria, FilterResult, PaperItem
 
@@ -20,9 +23,34 @@ def _load_papers_json(papers_json: str) -> List[PaperItem]:
     return [PaperItem(**item) for item in data]
 
 
+# Corpora kept parsed and indexed between keyword-filter calls.
+_CORPUS_CACHE_SIZE = 8
+
+
 class FilterService:
     """Service for filtering papers."""
 
+    def __init__(self) -> None:
+        self._corpora: "OrderedDict[str, PaperIndex]" = OrderedDict()
+
+    def corpus_index(self, papers_json: str) -> PaperIndex:
+        """Parsed and indexed corpus for ``papers_json``, reused across calls.
+
+        MCP sessions tend to filter one fetched batch many times with
+        different criteria; keying by content digest skips re-parsing and
+        re-indexing it each time.
+        """
+        digest = hashlib.sha256(papers_json.encode("utf-8")).hexdigest()
+        index = self._corpora.get(digest)
+        if index is None:
+            index = PaperIndex(_load_papers_json(papers_json))
+            self._corpora[digest] = index
+            if len(self._corpora) > _CORPUS_CACHE_SIZE:
+                self._corpora.popitem(last=False)
+        else:
+            self._corpora.move_to_end(digest)
+        return index
+
     async def filter_keywords(
         self,
         papers_json: str,
@@ -31,17 +59,19 @@ class FilterService:
         authors: Optional[List[str]] = None,
         min_date: Optional[date] = None,
         has_pdf: bool = False,
+        query: Optional[str] = None,
     ) -> FilterResult:
-        papers = _load_papers_json(papers_json)
+        index = self.corpus_index(papers_json)
         criteria = FilterCriteria(
             keywords=keywords,
             exclude_keywords=exclude or [],
             authors=authors or [],
             min_date=min_date,
             has_pdf=has_pdf,
+            query=query,
         )
         pipeline = FilterPipeline(llm_client=None)
-        return await pipeline.filter(papers, criteria)
+        return await pipeline.filter(index.papers, criteria, index=index)
 
     async def filter_ai(
         self,
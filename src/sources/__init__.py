@@ -1,6 +1,6 @@
 """Paper data sources (RSS, Gmail, CrossRef, OpenAlex, etc.)."""
 
-from src.sources.opml import OPMLParser, parse_opml
+from src.sources.opml import OPMLParser, parse_opml, shard_feeds
 from src.sources.rss import RSSSource
 from src.sources.rss_parser import RSSParser
 from src.sources.gmail import GmailSource
@@ -13,6 +13,7 @@ __all__ = [
     "RSSParser",
     "OPMLParser",
     "parse_opml",
+    "shard_feeds",
     "GmailSource",
     "GmailParser",
     "CrossrefClient",
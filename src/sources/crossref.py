@@ -15,7 +15,7 @@ import httpx
 from src.config.settings import get_crossref_config
 from src.models.responses import PaperItem
 from src.utils.dedup import normalize_doi
-from src.utils.text import DOI_PATTERN, clean_abstract
+from src.utils.text import DOI_PATTERN, clean_abstract, title_words
 
 logger = logging.getLogger(__name__)
 
@@ -329,15 +329,9 @@ class CrossrefClient:
         if not works:
             return None
 
-        def _normalize(s: str) -> str:
-            s = s.lower()
-            s = re.sub(r"[^\w\s]", "", s)
-            s = re.sub(r"\s+", " ", s).strip()
-            return s
-
         def _similarity(s1: str, s2: str) -> float:
-            words1 = set(_normalize(s1).split())
-            words2 = set(_normalize(s2).split())
+            words1 = title_words(s1)
+            words2 = title_words(s2)
             if not words1 or not words2:
                 return 0.0
             intersection = words1 & words2
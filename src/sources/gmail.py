@@ -416,7 +416,7 @@ class GmailSource(PaperSource):
                 if limit and len(papers) >= limit:
                     break
 
-            papers, dedup_stats = deduplicate_papers(papers)
+            papers, dedup_stats = deduplicate_papers(papers, merge=True)
             if limit and len(papers) > limit:
                 papers = papers[:limit]
             logger.info(
@@ -6,7 +6,7 @@ from typing import List, Optional, Tuple
 from bs4 import BeautifulSoup, Tag
 
 from src.models.responses import PaperItem
-from src.utils.dedup import deduplicate_papers, normalize_title
+from src.utils.dedup import deduplicate_papers, normalize_title, paper_quality
 from src.utils.text import DOI_PATTERN, clean_title
 
 logger = logging.getLogger(__name__)
@@ -17,15 +17,7 @@ class GmailParser:
 
     @staticmethod
     def _item_quality(item: PaperItem) -> int:
-        score = 0
-        if item.doi:
-            score += 4
-        if item.url:
-            score += 2
-        if item.abstract:
-            score += 1
-        score += min(len(item.authors), 3)
-        return score
+        return paper_quality(item)
 
     def _deduplicate_by_title(
         self,
@@ -91,7 +83,7 @@ class GmailParser:
             )
         )
 
-        identity_unique_items, dedup_stats = deduplicate_papers(items)
+        identity_unique_items, dedup_stats = deduplicate_papers(items, merge=True)
         unique_items, title_dropped = self._deduplicate_by_title(identity_unique_items)
 
         logger.info(
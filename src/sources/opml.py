@@ -1,5 +1,6 @@
 """OPML file parser for RSS feed sources."""
 
+import hashlib
 import logging
 import os
 from pathlib import Path
@@ -90,3 +91,25 @@ def parse_opml(file_path: str) -> List[Dict[str, str]]:
     """Convenience function to parse OPML file."""
     parser = OPMLParser(file_path)
     return parser.parse()
+
+
+def feed_shard(url: str, shard_count: int) -> int:
+    """Zero-based shard of a feed URL; stable across runs and machines."""
+    digest = hashlib.sha1(url.strip().encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+def shard_feeds(
+    feeds: List[Dict[str, str]], shard_index: int, shard_count: int
+) -> List[Dict[str, str]]:
+    """Feeds belonging to shard ``shard_index`` (1-based) of ``shard_count``."""
+    if shard_count < 1 or not 1 <= shard_index <= shard_count:
+        raise ValueError(
+            f"invalid shard {shard_index}/{shard_count}: "
+            "expected 1 <= i <= N"
+        )
+    return [
+        feed
+        for feed in feeds
+        if feed_shard(feed["url"], shard_count) == shard_index - 1
+    ]
@@ -1,9 +1,26 @@
 """RSS feed source for paper collection."""
 
 import asyncio
+import importlib.util
 import logging
-from datetime import date
-from typing import Any, Dict, List, Optional
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import aclosing, nullcontext
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from itertools import repeat
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 from urllib.parse import urlparse
 
 import feedparser
@@ -11,17 +28,172 @@ import httpx
 
 from src.config.settings import get_rss_config
 from src.models.responses import PaperItem, PaperSource
-from src.sources.opml import OPMLParser
+from src.sources.opml import OPMLParser, shard_feeds
+from src.sources.rss_archive import ArchivedFeed, FeedArchive
+from src.sources.rss_cache import FeedCache, FeedValidators, body_digest
+from src.sources.rss_fast_parser import fast_parse_feed
+from src.sources.rss_health import FeedHealthTracker, SkippedFeed
 from src.sources.rss_parser import RSSParser
-from src.utils.dedup import deduplicate_papers, identity_keys_for_paper
+from src.sources.rss_schedule import FeedScheduler
+from src.sources.rss_seen import SeenEntryStore
+from src.sources.rss_stats import FeedTiming, RSSFetchStats
+from src.sources.rss_transport import (
+    TIMING_EXTENSION,
+    BoundedFeedTransport,
+    environment_proxies,
+)
+from src.utils.dedup import (
+    PaperDeduplicator,
+    deduplicate_papers,
+    identity_keys_for_paper,
+)
 
 logger = logging.getLogger(__name__)
 
+# A feed is treated as newest-first once this many dated entries arrived in
+# non-increasing order; this many consecutive entries older than ``since``
+# then end the scan.
+_ORDERED_PREFIX = 5
+_OLD_RUN_TO_STOP = 2
+
+
 def _dedup_key(paper: PaperItem) -> tuple[str, str] | None:
     keys = identity_keys_for_paper(paper)
     return keys[0] if keys else None
 
 
+def _entries_since(
+    entries: Iterable[Any], since: date, parser: RSSParser
+) -> Iterator[Any]:
+    """Yield raw entries that can pass the ``since`` filter.
+
+    Dates are checked on the raw entry so old entries never become a
+    ``PaperItem``; undated entries are kept, as ``RSSSource._filter_since``
+    does. For reverse-chronological feeds the scan stops at the first run of
+    old entries instead of walking the whole back catalogue.
+    """
+    previous: Optional[date] = None
+    dated = 0
+    descending = True
+    old_run = 0
+    for entry in entries:
+        entry_date = parser.published_date(entry)
+        if entry_date is None:
+            yield entry
+            continue
+
+        if previous is not None and entry_date > previous:
+            descending = False
+        previous = entry_date
+        dated += 1
+
+        if entry_date >= since:
+            old_run = 0
+            yield entry
+            continue
+
+        old_run += 1
+        if descending and dated >= _ORDERED_PREFIX and old_run >= _OLD_RUN_TO_STOP:
+            return
+
+
+def parse_feed_body(
+    parse_input: str | bytes,
+    source_name: str,
+    parser: Optional[RSSParser] = None,
+    fast: bool = True,
+    since: Optional[date] = None,
+    stats: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[PaperItem], Optional[str]]:
+    """Parse a raw feed body into papers.
+
+    Well-formed RSS 2.0 / Atom / RSS 1.0 bodies go through the streaming fast
+    parser; anything it declines is handed to feedparser. With ``since`` set,
+    older entries are dropped before conversion. Returns the parsed papers and
+    the bozo message (None for a clean parse). A ``stats`` dict, if given,
+    receives parse/conversion timings and entry counts.
+    """
+    parser = parser or RSSParser()
+    bozo: Optional[str] = None
+    started = time.perf_counter()
+
+    fast_result = fast_parse_feed(parse_input) if fast else None
+    if fast_result is not None:
+        feed_meta, entries = fast_result
+    else:
+        feed = feedparser.parse(parse_input)
+        if hasattr(feed, "bozo") and feed.bozo:
+            bozo = str(getattr(feed, "bozo_exception", "Unknown error"))
+        feed_meta = RSSSource._extract_feed_meta(feed)
+        entries = getattr(feed, "entries", [])
+    parsed_at = time.perf_counter()
+    entries_total = len(entries)
+
+    if since is not None:
+        entries = _entries_since(entries, since, parser)
+
+    papers: List[PaperItem] = []
+    entries_recent = 0
+    for entry in entries:
+        entries_recent += 1
+        try:
+            papers.append(parser.parse(entry, source_name, feed_meta=feed_meta))
+        except ValueError as e:
+            logger.warning(f"Skipping invalid entry from {source_name}: {e}")
+        except Exception as e:
+            logger.error(
+                f"Error parsing entry from {source_name}: {e}",
+                exc_info=True,
+            )
+
+    if stats is not None:
+        stats.update(
+            parse_seconds=parsed_at - started,
+            convert_seconds=time.perf_counter() - parsed_at,
+            entries_total=entries_total,
+            entries_dropped_since=entries_total - entries_recent,
+        )
+    return papers, bozo
+
+
+def _parse_feed_records(
+    parse_input: str | bytes,
+    source_name: str,
+    fast: bool = True,
+    since: Optional[date] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str], Dict[str, Any]]:
+    """Process-pool entry point returning compact picklable paper records.
+
+    Only non-default fields are shipped back, and the parent rebuilds them
+    with ``PaperItem.model_construct`` since the worker already validated.
+    The parse stats travel back alongside.
+    """
+    stats: Dict[str, Any] = {}
+    papers, bozo = parse_feed_body(
+        parse_input, source_name, fast=fast, since=since, stats=stats
+    )
+    return [p.model_dump(exclude_defaults=True) for p in papers], bozo, stats
+
+
+@dataclass
+class RSSFetchReport:
+    """Summary of the last RSS fetch: which feeds failed or were skipped.
+
+    ``deferred`` lists feeds the adaptive schedule did not poll because no
+    new entries were expected yet; their cached entries were replayed.
+    ``timed_out`` lists feeds still in flight when the fetch budget ran out.
+    """
+
+    feeds_total: int = 0
+    failed: List[str] = field(default_factory=list)
+    skipped: List[SkippedFeed] = field(default_factory=list)
+    deferred: List[str] = field(default_factory=list)
+    timed_out: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
 class RSSSource(PaperSource):
     """Paper source that reads RSS feeds from an OPML file."""
 
@@ -34,6 +206,16 @@ class RSSSource(PaperSource):
         user_agent: Optional[str] = None,
         timeout: Optional[int] = None,
         max_concurrent: Optional[int] = None,
+        max_per_host: Optional[int] = None,
+        http2: Optional[bool] = None,
+        max_feed_bytes: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        archive_dir: Optional[str] = None,
+        parse_workers: Optional[int] = None,
+        fast_parser: Optional[bool] = None,
+        adaptive_schedule: Optional[bool] = None,
+        force_all: bool = False,
+        shard: Optional[Tuple[int, int]] = None,
     ):
         config = get_rss_config()
 
@@ -48,14 +230,78 @@ class RSSSource(PaperSource):
             if max_concurrent is not None
             else config.get("max_concurrent", 10)
         )
+        self.max_per_host = (
+            max_per_host
+            if max_per_host is not None
+            else config.get("max_per_host", 4)
+        )
+        self.http2 = http2 if http2 is not None else config.get("http2", False)
+        self.keepalive_expiry = config.get("keepalive_expiry", 30.0)
+        self.max_feed_bytes = (
+            max_feed_bytes
+            if max_feed_bytes is not None
+            else config.get("max_feed_bytes", 10 * 1024 * 1024)
+        )
+        self.parse_workers = (
+            parse_workers
+            if parse_workers is not None
+            else config.get("parse_workers", 0)
+        )
+        self.fast_parser = (
+            fast_parser
+            if fast_parser is not None
+            else config.get("fast_parser", True)
+        )
+        self.adaptive_schedule = (
+            adaptive_schedule
+            if adaptive_schedule is not None
+            else config.get("adaptive_schedule", True)
+        )
+        self.force_all = force_all
         self._parser = RSSParser()
 
+        self.shard = shard
+        if cache_dir is None:
+            cache_dir = config.get("cache_dir")
+        if cache_dir and shard is not None:
+            # Shards run as separate processes; give each its own state files
+            # so concurrent saves do not overwrite each other.
+            cache_dir = str(Path(cache_dir) / f"shard-{shard[0]}-of-{shard[1]}")
+        self.cache_dir = cache_dir
+        self._cache: Optional[FeedCache] = FeedCache(cache_dir) if cache_dir else None
+        self._health = FeedHealthTracker(
+            cache_dir,
+            failure_threshold=config.get("failure_threshold", 3),
+            backoff_hours=config.get("backoff_hours", 24.0),
+        )
+        self._scheduler: Optional[FeedScheduler] = (
+            FeedScheduler(cache_dir)
+            if cache_dir and self.adaptive_schedule
+            else None
+        )
+        if archive_dir is None:
+            archive_dir = config.get("archive_dir")
+        self.archive_dir = archive_dir
+        self._archive: Optional[FeedArchive] = (
+            FeedArchive(archive_dir) if archive_dir else None
+        )
+        self.last_report = RSSFetchReport()
+        self.last_stats = RSSFetchStats()
+
         opml = OPMLParser(self.opml_path)
         self._feeds: List[Dict[str, str]] = opml.parse()
 
         if not self._feeds:
             raise ValueError(f"No RSS feeds found in OPML file: {self.opml_path}")
 
+        if shard is not None:
+            total = len(self._feeds)
+            self._feeds = shard_feeds(self._feeds, *shard)
+            logger.info(
+                f"Shard {shard[0]}/{shard[1]} holds {len(self._feeds)} "
+                f"of {total} feeds"
+            )
+
         logger.info(
             f"RSSSource initialised with {len(self._feeds)} feeds from {self.opml_path}"
         )
@@ -72,39 +318,496 @@ class RSSSource(PaperSource):
         self,
         limit: Optional[int] = None,
         since: Optional[date] = None,
+        incremental: bool = False,
+        budget_seconds: Optional[float] = None,
     ) -> List[PaperItem]:
+        """Fetch and deduplicate papers from every feed.
+
+        With ``incremental=True`` only entries never emitted by an earlier
+        incremental run are returned; the seen-entry state lives in
+        ``cache_dir`` and is only updated once the fetch completes.
+
+        ``budget_seconds`` is a wall-clock deadline for the whole fetch: feeds
+        still running when it expires are cancelled, the papers collected so
+        far are returned and the cut-off feeds are listed in
+        ``last_report.timed_out``.
+        """
         if limit is not None and limit < 1:
             raise ValueError("limit must be >= 1")
+        if budget_seconds is not None and budget_seconds <= 0:
+            raise ValueError("budget_seconds must be > 0")
+
+        if limit is not None:
+            return await self._fetch_until_limit(
+                limit,
+                since=since,
+                incremental=incremental,
+                budget_seconds=budget_seconds,
+            )
+
+        seen = self._open_seen_store() if incremental else None
+        skipped_seen = 0
+        per_feed: List[List[PaperItem]] = [[] for _ in self._feeds]
+        async for index, papers in self._iter_feed_results(
+            since=since, budget_seconds=budget_seconds
+        ):
+            if seen is not None:
+                fresh = self._take_unseen(self._feeds[index]["url"], papers, seen)
+                skipped_seen += len(papers) - len(fresh)
+                papers = fresh
+            per_feed[index] = papers
+
+        if seen is not None:
+            seen.save()
+            logger.info(
+                f"Incremental fetch skipped {skipped_seen} previously seen entries"
+            )
+
+        all_papers_raw = [paper for papers in per_feed for paper in papers]
+
+        all_papers, dedup_stats = deduplicate_papers(all_papers_raw, merge=True)
+        self._log_dedup_stats(dedup_stats)
+
+        logger.info(
+            f"Fetched {len(all_papers)} papers total from {len(self._feeds)} feeds"
+        )
+        return all_papers
+
+    async def fetch_from_archive(
+        self,
+        limit: Optional[int] = None,
+        since: Optional[date] = None,
+        as_of: Optional[datetime] = None,
+    ) -> List[PaperItem]:
+        """Re-parse archived feed bodies offline instead of hitting publishers.
+
+        Uses the latest archived download of every OPML feed (or the latest
+        one at ``as_of``), so parser changes can be checked against a fixed,
+        reproducible corpus.
+        """
+        if self._archive is None:
+            raise ValueError(
+                "archive replay requires an archive_dir (set RSS_ARCHIVE_DIR)"
+            )
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be >= 1")
+
+        archived = self._archive.latest(
+            (feed["url"] for feed in self._feeds), as_of=as_of
+        )
+        missing = len(self._feeds) - len(archived)
+        if missing:
+            logger.warning(f"{missing} feeds have no archived body; skipping them")
+
+        per_feed = await asyncio.to_thread(self._parse_archived, archived, since)
+        all_papers_raw = [paper for papers in per_feed for paper in papers]
+        all_papers, dedup_stats = deduplicate_papers(all_papers_raw, merge=True)
+        self._log_dedup_stats(dedup_stats)
+        if limit is not None:
+            all_papers = all_papers[:limit]
+
+        logger.info(
+            f"Replayed {len(all_papers)} papers from {len(archived)} archived feeds"
+        )
+        return all_papers
+
+    def _parse_archived(
+        self,
+        archived: Dict[str, ArchivedFeed],
+        since: Optional[date] = None,
+    ) -> List[List[PaperItem]]:
+        assert self._archive is not None
+        jobs = [
+            (self._archive.load(archived[feed["url"]].sha256), self._source_name(feed))
+            for feed in self._feeds
+            if feed["url"] in archived
+        ]
+        if self.parse_workers > 0 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=self.parse_workers) as pool:
+                results = pool.map(
+                    _parse_feed_records,
+                    [body for body, _ in jobs],
+                    [name for _, name in jobs],
+                    repeat(self.fast_parser),
+                    repeat(since),
+                )
+                return [
+                    [PaperItem.model_construct(**r) for r in records]
+                    for records, _, _ in results
+                ]
+        return [
+            parse_feed_body(body, name, self._parser, self.fast_parser, since)[0]
+            for body, name in jobs
+        ]
+
+    async def _fetch_until_limit(
+        self,
+        limit: int,
+        since: Optional[date] = None,
+        incremental: bool = False,
+        budget_seconds: Optional[float] = None,
+    ) -> List[PaperItem]:
+        """Stream feeds until ``limit`` unique papers arrive, then stop.
+
+        Feeds still downloading at that point are cancelled, so small limits
+        do not pay for the whole OPML. Duplicates that arrived by then are
+        kept and merged like :meth:`fetch_papers` does without a limit, so
+        the kept record and its filled-in fields do not depend on ``limit``.
+        A transitive match between the first papers (A~B by URL, B~C by
+        DOI) can leave slightly fewer than ``limit``.
+        """
+        deduplicator = PaperDeduplicator()
+        raw: List[PaperItem] = []
+        async with aclosing(
+            self._iter_with_duplicates(
+                deduplicator,
+                since=since,
+                incremental=incremental,
+                budget_seconds=budget_seconds,
+            )
+        ) as stream:
+            async for paper, _ in stream:
+                raw.append(paper)
+                if deduplicator.unique_count >= limit:
+                    break
+
+        papers, dedup_stats = deduplicate_papers(raw, merge=True)
+        self._log_dedup_stats(dedup_stats)
+        papers = papers[:limit]
+        logger.info(
+            f"Fetched {len(papers)} papers (limit={limit}) "
+            f"from {len(self._feeds)} feeds"
+        )
+        return papers
+
+    async def iter_papers(
+        self,
+        since: Optional[date] = None,
+        incremental: bool = False,
+        budget_seconds: Optional[float] = None,
+    ) -> AsyncGenerator[PaperItem, None]:
+        """Yield deduplicated papers as soon as each feed finishes.
+
+        Papers arrive in feed completion order rather than OPML order, so a
+        slow publisher no longer holds back the rest of the batch. A paper
+        is yielded before any later copy is seen, so duplicates are dropped
+        first-wins instead of merged as in :meth:`fetch_papers`. In
+        incremental mode a paper is recorded as seen right before it is
+        yielded, so stopping early leaves the rest for the next run.
+        """
+        deduplicator = PaperDeduplicator()
+        try:
+            async with aclosing(
+                self._iter_with_duplicates(
+                    deduplicator,
+                    since=since,
+                    incremental=incremental,
+                    budget_seconds=budget_seconds,
+                )
+            ) as stream:
+                async for paper, is_new in stream:
+                    if is_new:
+                        yield paper
+        finally:
+            self._log_dedup_stats(deduplicator.stats())
+
+    async def _iter_with_duplicates(
+        self,
+        deduplicator: PaperDeduplicator,
+        since: Optional[date] = None,
+        incremental: bool = False,
+        budget_seconds: Optional[float] = None,
+    ) -> AsyncGenerator[Tuple[PaperItem, bool], None]:
+        """Yield ``(paper, is_new)`` for every unseen paper as feeds finish."""
+        seen = self._open_seen_store() if incremental else None
+        try:
+            async with aclosing(
+                self._iter_feed_results(since=since, budget_seconds=budget_seconds)
+            ) as results:
+                async for index, papers in results:
+                    feed_url = self._feeds[index]["url"]
+                    for paper in papers:
+                        if seen is not None:
+                            already_seen = seen.is_seen(paper)
+                            seen.mark(feed_url, paper)
+                            if already_seen:
+                                continue
+                        yield paper, deduplicator.add(paper)
+        finally:
+            if seen is not None:
+                seen.save()
+
+    def _open_seen_store(self) -> SeenEntryStore:
+        if not self.cache_dir:
+            raise ValueError(
+                "incremental mode requires a cache_dir (set RSS_CACHE_DIR)"
+            )
+        return SeenEntryStore(self.cache_dir)
+
+    @staticmethod
+    def _take_unseen(
+        feed_url: str, papers: List[PaperItem], seen: SeenEntryStore
+    ) -> List[PaperItem]:
+        fresh = [p for p in papers if not seen.is_seen(p)]
+        for paper in papers:
+            seen.mark(feed_url, paper)
+        return fresh
+
+    async def _iter_feed_results(
+        self,
+        since: Optional[date] = None,
+        budget_seconds: Optional[float] = None,
+    ) -> AsyncGenerator[Tuple[int, List[PaperItem]], None]:
+        """Fetch all feeds concurrently, yielding ``(feed_index, papers)``.
+
+        Results are yielded in completion order. Closing the generator early,
+        or running past ``budget_seconds``, cancels the feeds still in flight.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + budget_seconds if budget_seconds else None
+        fetch_started = time.perf_counter()
+        order = self._feed_order(since)
+        report = RSSFetchReport(feeds_total=len(order))
+        self.last_report = report
+        stats = RSSFetchStats()
+        self.last_stats = stats
+        deferred: List[Tuple[int, List[PaperItem]]] = []
+        if not self.force_all:
+            order = [i for i in order if not self._skip_unhealthy(i, report)]
+            if report.skipped:
+                logger.warning(
+                    f"Skipping {len(report.skipped)} feeds with repeated failures"
+                )
+            deferred = self._deferred_feeds(order, since, report)
+            for index, papers in deferred:
+                stats.add(
+                    FeedTiming(
+                        url=self._feeds[index]["url"],
+                        title=self._source_name(self._feeds[index]),
+                        outcome="deferred",
+                        entries_kept=len(papers),
+                    )
+                )
+            if deferred:
+                deferred_indices = {index for index, _ in deferred}
+                order = [i for i in order if i not in deferred_indices]
+                logger.info(
+                    f"Deferred {len(deferred)} feeds not expected to have "
+                    f"new entries yet"
+                )
 
         semaphore = asyncio.Semaphore(self.max_concurrent)
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        parse_pool: Optional[ProcessPoolExecutor] = None
+        if self.parse_workers > 0:
+            parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        def _host_slot(url: str) -> asyncio.Semaphore | nullcontext:
+            if self.max_per_host <= 0:
+                return nullcontext()
+            host = urlparse(url).netloc.lower()
+            if host not in host_semaphores:
+                host_semaphores[host] = asyncio.Semaphore(self.max_per_host)
+            return host_semaphores[host]
+
+        async with httpx.AsyncClient(**self._client_options()) as client:
             async def _fetch_one(feed: Dict[str, str]) -> List[PaperItem]:
-                async with semaphore:
-                    return await self._fetch_single_feed(
-                        client=client,
-                        feed_url=feed["url"],
-                        source_name=feed.get("title")
-                        or self._detect_source_name(feed["url"]),
-                        since=since,
+                timing = FeedTiming(url=feed["url"], title=self._source_name(feed))
+                queued = time.perf_counter()
+                acquired: Optional[float] = None
+                try:
+                    # Take the host slot first so feeds queued behind a busy
+                    # publisher do not hold global slots other hosts could use.
+                    async with _host_slot(feed["url"]), semaphore:
+                        acquired = time.perf_counter()
+                        timing.wait_seconds = acquired - queued
+                        papers = await self._fetch_single_feed(
+                            client=client,
+                            feed_url=feed["url"],
+                            source_name=timing.title,
+                            since=since,
+                            parse_pool=parse_pool,
+                            timing=timing,
+                        )
+                        timing.entries_kept = len(papers)
+                        return papers
+                finally:
+                    finished = time.perf_counter()
+                    if acquired is None:
+                        timing.wait_seconds = finished - queued
+                    else:
+                        timing.total_seconds = finished - acquired
+                    if timing.outcome == "pending":
+                        timing.outcome = "cancelled"
+                    stats.add(timing)
+
+            tasks: Dict[asyncio.Task, int] = {
+                asyncio.create_task(_fetch_one(self._feeds[i])): i
+                for i in order
+            }
+            pending: Set[asyncio.Task] = set(tasks)
+            try:
+                for index, papers in deferred:
+                    yield index, papers
+                while pending:
+                    timeout = None
+                    if deadline is not None:
+                        timeout = max(deadline - loop.time(), 0)
+                    done, pending = await asyncio.wait(
+                        pending,
+                        timeout=timeout,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if not done:
+                        report.timed_out = [
+                            self._feeds[i]["url"]
+                            for i in sorted(tasks[task] for task in pending)
+                        ]
+                        logger.warning(
+                            f"RSS fetch budget of {budget_seconds}s exhausted; "
+                            f"cutting off {len(pending)} feeds"
+                        )
+                        break
+                    for task in sorted(done, key=tasks.__getitem__):
+                        index = tasks[task]
+                        exc = task.exception()
+                        if exc is not None:
+                            feed = self._feeds[index]
+                            logger.error(
+                                f"Failed to fetch feed "
+                                f"{feed.get('title', feed['url'])}: {exc}"
+                            )
+                            continue
+                        yield index, task.result()
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    logger.info(
+                        f"Cancelled {len(pending)} outstanding feed fetches"
                     )
+                    await asyncio.gather(*pending, return_exceptions=True)
+                if parse_pool is not None:
+                    parse_pool.shutdown(wait=False, cancel_futures=True)
+                if self._cache is not None:
+                    self._cache.save()
+                self._health.save()
+                if self._scheduler is not None:
+                    self._scheduler.save()
+                stats.wall_seconds = time.perf_counter() - fetch_started
 
-            tasks = [_fetch_one(f) for f in self._feeds]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+    def _client_options(self) -> Dict[str, Any]:
+        """Keyword arguments for the shared ``httpx.AsyncClient``.
 
-        all_papers_raw: List[PaperItem] = []
+        The connection pool lives on a :class:`BoundedFeedTransport`, which
+        caps every decoded body at ``max_feed_bytes`` and rejects non-feed
+        responses early, so peak memory stays around ``max_concurrent`` x
+        the cap. Because the client gets an explicit transport, proxies
+        from the environment are mounted here rather than by httpx.
+        """
+        options: Dict[str, Any] = {
+            "timeout": self.timeout,
+            "transport": self._feed_transport(),
+        }
+        proxies = environment_proxies()
+        if proxies:
+            options["mounts"] = {
+                pattern: None if proxy is None else self._feed_transport(proxy)
+                for pattern, proxy in proxies.items()
+            }
+        return options
+
+    def _feed_transport(self, proxy: Optional[str] = None) -> BoundedFeedTransport:
+        return BoundedFeedTransport(
+            httpx.AsyncHTTPTransport(proxy=proxy, **self._transport_options()),
+            max_bytes=self.max_feed_bytes,
+        )
 
-        for i, result in enumerate(results):
-            if isinstance(result, BaseException):
-                feed = self._feeds[i]
-                logger.error(
-                    f"Failed to fetch feed {feed.get('title', feed['url'])}: {result}"
+    def _transport_options(self) -> Dict[str, Any]:
+        """Pool settings for the underlying ``httpx.AsyncHTTPTransport``.
+
+        Keep-alive connections are sized to the global cap so each host's
+        connection is reused across its feeds; HTTP/2 additionally multiplexes
+        them over one connection when the optional ``h2`` package is present.
+        """
+        options: Dict[str, Any] = {
+            "limits": httpx.Limits(
+                max_connections=self.max_concurrent,
+                max_keepalive_connections=self.max_concurrent,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        }
+        if self.http2:
+            if importlib.util.find_spec("h2") is not None:
+                options["http2"] = True
+            else:
+                logger.warning(
+                    "RSS_HTTP2 is enabled but the 'h2' package is missing; "
+                    "install feedder-mcp[http2]. Falling back to HTTP/1.1."
                 )
+        return options
+
+    def _deferred_feeds(
+        self,
+        order: List[int],
+        since: Optional[date],
+        report: RSSFetchReport,
+    ) -> List[Tuple[int, List[PaperItem]]]:
+        """Replay cached entries for feeds the schedule says are not due."""
+        if self._scheduler is None or self._cache is None:
+            return []
+        deferred: List[Tuple[int, List[PaperItem]]] = []
+        for index in order:
+            url = self._feeds[index]["url"]
+            cached = self._cache.get(url)
+            if (
+                cached is None
+                or not cached.covers(since)
+                or self._scheduler.is_due(url)
+            ):
                 continue
+            report.deferred.append(url)
+            deferred.append((index, self._filter_since(cached.load_papers(), since)))
+        return deferred
+
+    def _skip_unhealthy(self, index: int, report: RSSFetchReport) -> bool:
+        feed = self._feeds[index]
+        if not self._health.should_skip(feed["url"]):
+            return False
+        health = self._health.get(feed["url"])
+        assert health is not None
+        report.skipped.append(
+            SkippedFeed(
+                url=feed["url"],
+                title=self._source_name(feed),
+                consecutive_failures=health.consecutive_failures,
+                retry_after=health.skip_until,
+            )
+        )
+        return True
+
+    def _feed_order(self, since: Optional[date] = None) -> List[int]:
+        """Feed indices ordered by the yield seen on the last cached fetch.
+
+        Task start order only matters while the semaphore is saturated, but it
+        lets limit-bound runs reach their quota from the most productive feeds
+        first. Without a cache the OPML order is kept.
+        """
+        indices = list(range(len(self._feeds)))
+        cache = self._cache
+        if cache is None:
+            return indices
 
-            all_papers_raw.extend(result)
+        def _historical_yield(index: int) -> int:
+            cached = cache.get(self._feeds[index]["url"])
+            if cached is None:
+                return 0
+            return cached.count_since(since)
 
-        all_papers, dedup_stats = deduplicate_papers(all_papers_raw)
+        return sorted(indices, key=_historical_yield, reverse=True)
+
+    @staticmethod
+    def _log_dedup_stats(dedup_stats: Dict[str, Any]) -> None:
         logger.info(
             "RSS fetch dedup stats: input=%d, unique=%d, dropped=%d, by_key=%s",
             dedup_stats["input_count"],
@@ -113,30 +816,45 @@ class RSSSource(PaperSource):
             dedup_stats["duplicates_by_key"],
         )
 
-        if limit and len(all_papers) > limit:
-            all_papers = all_papers[:limit]
-
-        logger.info(
-            f"Fetched {len(all_papers)} papers total from {len(self._feeds)} feeds"
-        )
-        return all_papers
-
     async def _fetch_single_feed(
         self,
         client: httpx.AsyncClient,
         feed_url: str,
         source_name: str,
         since: Optional[date] = None,
+        parse_pool: Optional[Executor] = None,
+        timing: Optional[FeedTiming] = None,
     ) -> List[PaperItem]:
+        timing = timing or FeedTiming(url=feed_url, title=source_name)
         papers: List[PaperItem] = []
+        cached = self._cache.get(feed_url) if self._cache is not None else None
+        if cached is not None and not cached.covers(since):
+            # Cached entries were parsed with a later cutoff; refetch in full.
+            cached = None
+        started = time.perf_counter()
 
         try:
+            headers = {"User-Agent": self.user_agent}
+            if cached is not None:
+                headers.update(cached.conditional_headers())
+
             response = await client.get(
                 feed_url,
-                headers={"User-Agent": self.user_agent},
+                headers=headers,
                 follow_redirects=True,
             )
+            latency = time.perf_counter() - started
+            self._record_download(timing, response, latency)
+            if cached is not None and response.status_code == 304:
+                logger.debug(f"Feed not modified (304): {source_name}")
+                timing.outcome = "not_modified"
+                self._health.record_success(feed_url, 304, latency)
+                self._record_poll(feed_url)
+                return self._replay_cached(feed_url, cached, since)
+
             response.raise_for_status()
+            status = response.status_code
+            status = status if isinstance(status, int) else None
             feed_content = response.content
             parse_input: str | bytes
             if isinstance(feed_content, (bytes, str)):
@@ -144,48 +862,163 @@ class RSSSource(PaperSource):
             else:
                 response_text = getattr(response, "text", "")
                 parse_input = response_text if isinstance(response_text, str) else ""
+            if not timing.bytes:
+                timing.bytes = len(parse_input)
 
-            feed = await asyncio.to_thread(feedparser.parse, parse_input)
+            if self._archive is not None:
+                await asyncio.to_thread(self._archive_body, feed_url, parse_input)
 
-            if hasattr(feed, "bozo") and feed.bozo:
-                logger.warning(
-                    f"Potential issue parsing feed {feed_url}: "
-                    f"{getattr(feed, 'bozo_exception', 'Unknown error')}"
-                )
-
-            feed_meta = self._extract_feed_meta(feed)
-            entries = getattr(feed, "entries", [])
-            logger.debug(f"Fetched {len(entries)} entries from {source_name}")
-
-            for entry in entries:
-                try:
-                    paper = self._parser.parse(entry, source_name, feed_meta=feed_meta)
+            body_hash = body_digest(parse_input)
+            if cached is not None and cached.body_hash == body_hash:
+                logger.debug(f"Feed body unchanged: {source_name}")
+                timing.outcome = "unchanged"
+                self._health.record_success(feed_url, status, latency)
+                self._record_poll(feed_url)
+                return self._replay_cached(feed_url, cached, since)
 
-                    if since and paper.published_date:
-                        if paper.published_date < since:
-                            continue
+            parse_stats: Dict[str, Any] = {}
+            if parse_pool is not None:
+                loop = asyncio.get_running_loop()
+                records, bozo, parse_stats = await loop.run_in_executor(
+                    parse_pool,
+                    _parse_feed_records,
+                    parse_input,
+                    source_name,
+                    self.fast_parser,
+                    since,
+                )
+                papers = [PaperItem.model_construct(**r) for r in records]
+            else:
+                papers, bozo = await asyncio.to_thread(
+                    parse_feed_body,
+                    parse_input,
+                    source_name,
+                    self._parser,
+                    self.fast_parser,
+                    since,
+                    parse_stats,
+                )
+            timing.outcome = "parsed"
+            timing.absorb_parse_stats(parse_stats)
 
-                    papers.append(paper)
+            if bozo:
+                logger.warning(f"Potential issue parsing feed {feed_url}: {bozo}")
+            logger.debug(f"Parsed {len(papers)} entries from {source_name}")
+            self._health.record_success(feed_url, status, latency)
+            self._record_poll(feed_url, papers)
 
-                except ValueError as e:
-                    logger.warning(f"Skipping invalid entry from {source_name}: {e}")
-                except Exception as e:
-                    logger.error(
-                        f"Error parsing entry from {source_name}: {e}",
-                        exc_info=True,
-                    )
+            if self._cache is not None:
+                self._cache.store(
+                    feed_url,
+                    body_hash=body_hash,
+                    papers=papers,
+                    etag=self._header_value(response, "ETag"),
+                    last_modified=self._header_value(response, "Last-Modified"),
+                    since=since,
+                )
 
         except httpx.HTTPStatusError as e:
+            timing.outcome = "failed"
             logger.error(f"HTTP error fetching {feed_url}: {e.response.status_code}")
+            self._record_failure(
+                feed_url,
+                started,
+                f"HTTP {e.response.status_code}",
+                status=e.response.status_code,
+            )
         except httpx.RequestError as e:
+            timing.outcome = "failed"
             logger.error(f"Request error fetching {feed_url}: {e}")
+            self._record_failure(feed_url, started, f"{type(e).__name__}: {e}")
         except Exception as e:
+            timing.outcome = "failed"
             logger.error(
                 f"Unexpected error fetching from {source_name}: {e}",
                 exc_info=True,
             )
+            self._record_failure(feed_url, started, f"{type(e).__name__}: {e}")
 
-        return papers
+        return self._filter_since(papers, since)
+
+    @staticmethod
+    def _record_download(timing: FeedTiming, response: Any, latency: float) -> None:
+        """Copy transport-level download timings onto ``timing``.
+
+        Falls back to the overall request latency when the response did not
+        come through :class:`BoundedFeedTransport`.
+        """
+        extensions = getattr(response, "extensions", None)
+        measured = (
+            extensions.get(TIMING_EXTENSION) if isinstance(extensions, dict) else None
+        )
+        if isinstance(measured, dict):
+            timing.ttfb_seconds = measured.get("ttfb_seconds")
+            timing.download_seconds = measured.get("download_seconds")
+            timing.bytes = measured.get("bytes", 0)
+        else:
+            timing.ttfb_seconds = latency
+
+    def _archive_body(self, feed_url: str, body: str | bytes) -> None:
+        assert self._archive is not None
+        try:
+            self._archive.store(feed_url, body)
+        except OSError as e:
+            logger.warning(f"Failed to archive feed body for {feed_url}: {e}")
+
+    def _record_poll(
+        self, feed_url: str, papers: Optional[List[PaperItem]] = None
+    ) -> None:
+        if self._scheduler is None:
+            return
+        self._scheduler.record_poll(
+            feed_url, (p.published_date for p in papers or [])
+        )
+
+    def _record_failure(
+        self,
+        feed_url: str,
+        started: float,
+        error: str,
+        status: Optional[int] = None,
+    ) -> None:
+        self._health.record_failure(
+            feed_url,
+            status if isinstance(status, int) else None,
+            time.perf_counter() - started,
+            error,
+        )
+        self.last_report.failed.append(feed_url)
+
+    def _replay_cached(
+        self,
+        feed_url: str,
+        cached: FeedValidators,
+        since: Optional[date] = None,
+    ) -> List[PaperItem]:
+        assert self._cache is not None
+        self._cache.touch(feed_url)
+        return self._filter_since(cached.load_papers(), since)
+
+    @staticmethod
+    def _filter_since(
+        papers: List[PaperItem], since: Optional[date] = None
+    ) -> List[PaperItem]:
+        if since is None:
+            return papers
+        return [
+            p for p in papers if not p.published_date or p.published_date >= since
+        ]
+
+    @staticmethod
+    def _header_value(response: Any, name: str) -> Optional[str]:
+        headers = getattr(response, "headers", None)
+        if headers is None:
+            return None
+        try:
+            value = headers.get(name)
+        except Exception:
+            return None
+        return value if isinstance(value, str) and value else None
 
     @staticmethod
     def _extract_feed_meta(feed: Any) -> Dict[str, Any]:
@@ -204,6 +1037,9 @@ class RSSSource(PaperSource):
             meta["encoding"] = str(encoding)
         return meta
 
+    def _source_name(self, feed: Dict[str, str]) -> str:
+        return feed.get("title") or self._detect_source_name(feed["url"])
+
     @staticmethod
     def _detect_source_name(url: str) -> str:
         parsed = urlparse(url)
@@ -0,0 +1,124 @@
+"""Content-addressed on-disk archive of raw RSS feed bodies."""
+
+import gzip
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.sources.rss_cache import body_digest
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_INDEX_FILENAME = "index.jsonl"
+_OBJECTS_DIRNAME = "objects"
+
+
+@dataclass
+class ArchivedFeed:
+    """One archived download: which feed, when, and which body blob."""
+
+    url: str
+    fetched_at: str
+    sha256: str
+    size: int
+
+
+class FeedArchive:
+    """Gzip-compressed feed bodies stored by SHA-256, indexed by URL and time.
+
+    Bodies live under ``objects/<aa>/<sha256>.xml.gz`` so an unchanged feed
+    costs one index line per fetch instead of another copy. ``index.jsonl``
+    is append-only, one :class:`ArchivedFeed` per line.
+    """
+
+    def __init__(self, archive_dir: str | Path):
+        self.root = Path(archive_dir)
+        self.index_path = self.root / ARCHIVE_INDEX_FILENAME
+        self._lock = threading.Lock()
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.root / _OBJECTS_DIRNAME / sha256[:2] / f"{sha256}.xml.gz"
+
+    def store(
+        self,
+        url: str,
+        body: str | bytes,
+        fetched_at: Optional[datetime] = None,
+    ) -> ArchivedFeed:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        sha256 = body_digest(body)
+        record = ArchivedFeed(
+            url=url,
+            fetched_at=(fetched_at or datetime.now(timezone.utc)).isoformat(),
+            sha256=sha256,
+            size=len(body),
+        )
+
+        object_path = self._object_path(sha256)
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = object_path.with_name(
+                f"{object_path.name}.{os.getpid()}-{threading.get_ident()}.tmp"
+            )
+            tmp_path.write_bytes(gzip.compress(body, compresslevel=6))
+            tmp_path.replace(object_path)
+
+        line = json.dumps(asdict(record), ensure_ascii=False) + "\n"
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with self.index_path.open("a", encoding="utf-8") as fh:
+                fh.write(line)
+        return record
+
+    def load(self, sha256: str) -> bytes:
+        return gzip.decompress(self._object_path(sha256).read_bytes())
+
+    def records(self) -> Iterable[ArchivedFeed]:
+        if not self.index_path.exists():
+            return
+        with self.index_path.open(encoding="utf-8") as fh:
+            for line_no, line in enumerate(fh, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield ArchivedFeed(**json.loads(line))
+                except (ValueError, TypeError) as e:
+                    logger.warning(
+                        f"Skipping malformed archive index line {line_no}: {e}"
+                    )
+
+    def latest(
+        self,
+        urls: Optional[Iterable[str]] = None,
+        as_of: Optional[datetime] = None,
+    ) -> Dict[str, ArchivedFeed]:
+        """Most recent archived download per URL, optionally as of a time."""
+        wanted = set(urls) if urls is not None else None
+        cutoff = None
+        if as_of is not None:
+            if as_of.tzinfo is None:
+                as_of = as_of.replace(tzinfo=timezone.utc)
+            cutoff = as_of.astimezone(timezone.utc).isoformat()
+        latest: Dict[str, ArchivedFeed] = {}
+        for record in self.records():
+            if wanted is not None and record.url not in wanted:
+                continue
+            if cutoff is not None and record.fetched_at > cutoff:
+                continue
+            current = latest.get(record.url)
+            if current is None or record.fetched_at >= current.fetched_at:
+                latest[record.url] = record
+        return latest
+
+    def history(self, url: str) -> List[ArchivedFeed]:
+        return sorted(
+            (r for r in self.records() if r.url == url),
+            key=lambda r: r.fetched_at,
+        )
@@ -0,0 +1,137 @@
+"""Persistent per-feed HTTP validator store for conditional RSS fetches."""
+
+import hashlib
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.models.responses import PaperItem
+from src.sources.rss_store import atomic_write_json, load_versioned_json
+
+FEED_CACHE_FILENAME = "feed_validators.json"
+_CACHE_VERSION = 1
+
+
+def body_digest(body: str | bytes) -> str:
+    """Return a stable SHA-256 hex digest for a feed body."""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return hashlib.sha256(body).hexdigest()
+
+
+@dataclass
+class FeedValidators:
+    """Validators and last parsed entries for a single feed URL.
+
+    ``since`` is the date cutoff the entries were parsed with (None for the
+    whole feed); the entries can only be replayed for the same or a later
+    cutoff.
+    """
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    body_hash: Optional[str] = None
+    checked_at: Optional[str] = None
+    papers: List[Dict[str, Any]] = field(default_factory=list)
+    since: Optional[str] = None
+
+    def covers(self, since: Optional[date] = None) -> bool:
+        if self.since is None:
+            return True
+        return since is not None and since.isoformat() >= self.since
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def count_since(self, since: Optional[date] = None) -> int:
+        """Number of cached entries that would pass the ``since`` filter."""
+        if since is None:
+            return len(self.papers)
+        cutoff = since.isoformat()
+        return sum(
+            1
+            for item in self.papers
+            if not item.get("published_date") or item["published_date"] >= cutoff
+        )
+
+    def load_papers(self) -> List[PaperItem]:
+        return [PaperItem(**item) for item in self.papers]
+
+
+class FeedCache:
+    """JSON-backed store of ETag / Last-Modified / body hash per feed.
+
+    The cache also keeps the entries parsed from the last full download so a
+    ``304 Not Modified`` (or a byte-identical body) can be answered without
+    running feedparser again.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self.path = Path(cache_dir) / FEED_CACHE_FILENAME
+        self._entries: Dict[str, FeedValidators] = {}
+        self._dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        raw = load_versioned_json(self.path, _CACHE_VERSION, "feed cache")
+        if raw is None:
+            return
+        feeds = raw.get("feeds")
+        if not isinstance(feeds, dict):
+            return
+        for url, data in feeds.items():
+            if not isinstance(data, dict):
+                continue
+            try:
+                self._entries[url] = FeedValidators(**data)
+            except TypeError:
+                continue
+
+    def get(self, url: str) -> Optional[FeedValidators]:
+        return self._entries.get(url)
+
+    def touch(self, url: str) -> None:
+        """Mark a cached feed as re-validated without changing its content."""
+        entry = self._entries.get(url)
+        if entry is None:
+            return
+        entry.checked_at = datetime.now(timezone.utc).isoformat()
+        self._dirty = True
+
+    def store(
+        self,
+        url: str,
+        body_hash: str,
+        papers: List[PaperItem],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        since: Optional[date] = None,
+    ) -> None:
+        self._entries[url] = FeedValidators(
+            etag=etag,
+            last_modified=last_modified,
+            body_hash=body_hash,
+            checked_at=datetime.now(timezone.utc).isoformat(),
+            papers=[p.model_dump(mode="json") for p in papers],
+            since=since.isoformat() if since is not None else None,
+        )
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        payload = {
+            "version": _CACHE_VERSION,
+            "feeds": {url: asdict(entry) for url, entry in self._entries.items()},
+        }
+        if atomic_write_json(self.path, payload, "feed cache"):
+            self._dirty = False
@@ -0,0 +1,469 @@
+"""Streaming fast-path parser for well-formed RSS 2.0, Atom and RSS 1.0 feeds.
+
+Produces feedparser-shaped entry dicts (``title``, ``links``, ``dc_identifier``,
+``published_parsed`` ...) so :class:`RSSParser` can consume them unchanged.
+Anything outside the supported subset raises :class:`UnsupportedFeedError`,
+and callers fall back to feedparser. That includes ``xml:base`` and relative
+link URLs, which feedparser resolves against the base.
+"""
+
+import logging
+import re
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
+from urllib.parse import urlsplit
+
+from dateutil import parser as date_parser
+
+logger = logging.getLogger(__name__)
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+RSS10_NS = "http://purl.org/rss/1.0/"
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+DC_NS = "http://purl.org/dc/elements/1.1/"
+CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+PRISM_NS_PREFIX = "http://prismstandard.org/namespaces/"
+_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+_XML_BASE = "{http://www.w3.org/XML/1998/namespace}base"
+_RDF_ABOUT = f"{{{RDF_NS}}}about"
+
+_ENCODING_DECL = re.compile(rb"""^\s*<\?xml[^>]*encoding=["']([A-Za-z0-9._-]+)["']""")
+_RSS_AUTHOR = re.compile(r"^\s*(\S+@\S+)\s*\((.+)\)\s*$")
+_ATOM_TEXT_TYPES = {"text": "text/plain", "html": "text/html"}
+_DC_FIELDS = {
+    "creator",
+    "contributor",
+    "date",
+    "identifier",
+    "publisher",
+    "rights",
+    "title",
+    "description",
+}
+_RSS_ITEM_FIELDS = {
+    "title",
+    "link",
+    "guid",
+    "description",
+    "pubDate",
+    "author",
+    "source",
+}
+_ATOM_ENTRY_FIELDS = {
+    "title",
+    "id",
+    "published",
+    "issued",
+    "updated",
+    "modified",
+    "summary",
+    "content",
+    "rights",
+}
+
+FeedMeta = Dict[str, Any]
+FeedEntry = Dict[str, Any]
+
+
+class UnsupportedFeedError(Exception):
+    """Raised when a feed is outside the fast parser's supported subset."""
+
+
+def _split_tag(tag: str) -> Tuple[str, str]:
+    if tag.startswith("{"):
+        ns, _, local = tag[1:].partition("}")
+        return ns, local
+    return "", tag
+
+
+def _text(elem: ET.Element) -> str:
+    if len(elem):
+        # Inline (x)html markup needs feedparser's content handling.
+        raise UnsupportedFeedError(f"nested markup in <{elem.tag}>")
+    return (elem.text or "").strip()
+
+
+def _absolute_url(url: str) -> str:
+    if not urlsplit(url).scheme:
+        raise UnsupportedFeedError(f"relative URL {url!r}")
+    return url
+
+
+def _parse_date(value: str) -> Optional[time.struct_time]:
+    """Parse RFC 822 / ISO 8601 dates to a UTC struct_time like feedparser."""
+    if not value:
+        return None
+    dt: Optional[datetime] = None
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        pass
+    if dt is None:
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            try:
+                dt = date_parser.parse(value)
+            except (ValueError, OverflowError):
+                return None
+    return dt.utctimetuple()
+
+
+class FastFeedParser:
+    """Incremental feed parser built on :class:`xml.etree.ElementTree.XMLPullParser`.
+
+    Call :meth:`feed` with body chunks and :meth:`close` to get
+    ``(feed_meta, entries)``. Each item element is converted and detached as
+    soon as it closes, so memory stays bounded by the largest single item.
+    """
+
+    def __init__(self) -> None:
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack: List[ET.Element] = []
+        self._channel: Optional[ET.Element] = None
+        self._encoding: Optional[str] = None
+        self._lang: Optional[str] = None
+        self.version: Optional[str] = None
+        self.feed_meta: FeedMeta = {}
+        self.entries: List[FeedEntry] = []
+
+    def feed(self, data: str | bytes) -> None:
+        if self._encoding is None:
+            if isinstance(data, bytes):
+                match = _ENCODING_DECL.match(data[:200])
+                self._encoding = match.group(1).decode().lower() if match else "utf-8"
+            else:
+                self._encoding = "utf-8"
+        self._parser.feed(data)
+        self._drain()
+
+    def close(self) -> Tuple[FeedMeta, List[FeedEntry]]:
+        self._parser.close()
+        self._drain()
+        if self.version is None:
+            raise UnsupportedFeedError("empty document")
+        meta = dict(self.feed_meta)
+        meta["version"] = self.version
+        meta["encoding"] = self._encoding or "utf-8"
+        return meta, self.entries
+
+    # -- event handling --------------------------------------------------
+
+    def _drain(self) -> None:
+        # Only "start" and "end" events are requested, and both carry an Element.
+        events = cast(Iterator[Tuple[str, ET.Element]], self._parser.read_events())
+        for event, elem in events:
+            if event == "start":
+                if elem.get(_XML_BASE) is not None:
+                    raise UnsupportedFeedError("xml:base")
+                if not self._stack:
+                    self._detect_format(elem)
+                elif self._is_channel(elem):
+                    self._channel = elem
+                self._stack.append(elem)
+                continue
+
+            self._stack.pop()
+            parent = self._stack[-1] if self._stack else None
+            if self._is_item(elem):
+                self.entries.append(self._map_item(elem))
+                if parent is not None:
+                    parent.remove(elem)
+            elif parent is not None and parent is self._channel:
+                self._map_channel_field(elem)
+
+    def _detect_format(self, root: ET.Element) -> None:
+        ns, name = _split_tag(root.tag)
+        if ns == "" and name == "rss":
+            if (root.get("version") or "").strip() != "2.0":
+                raise UnsupportedFeedError(f"RSS version {root.get('version')}")
+            self.version = "rss20"
+        elif ns == ATOM_NS and name == "feed":
+            self.version = "atom10"
+            self._channel = root
+            self._lang = root.get(_XML_LANG)
+            if self._lang:
+                self.feed_meta["language"] = self._lang
+        elif ns == RDF_NS and name == "RDF":
+            self.version = "rss10"
+        else:
+            raise UnsupportedFeedError(f"unknown root element {root.tag}")
+
+    def _is_channel(self, elem: ET.Element) -> bool:
+        if self.version == "rss20":
+            return elem.tag == "channel" and len(self._stack) == 1
+        if self.version == "rss10":
+            return elem.tag == f"{{{RSS10_NS}}}channel"
+        return False
+
+    def _is_item(self, elem: ET.Element) -> bool:
+        if self.version == "rss20":
+            return elem.tag == "item"
+        if self.version == "rss10":
+            return elem.tag == f"{{{RSS10_NS}}}item"
+        return elem.tag == f"{{{ATOM_NS}}}entry"
+
+    def _map_channel_field(self, elem: ET.Element) -> None:
+        ns, name = _split_tag(elem.tag)
+        core_ns = ATOM_NS if self.version == "atom10" else (
+            RSS10_NS if self.version == "rss10" else ""
+        )
+        if len(elem):
+            return
+        value = (elem.text or "").strip()
+        if not value:
+            return
+        if ns == core_ns and name == "title":
+            self.feed_meta["title"] = value
+        elif ns == core_ns and name in ("description", "subtitle"):
+            self.feed_meta["subtitle"] = value
+        elif (ns == core_ns and name == "language") or (
+            ns == DC_NS and name == "language"
+        ):
+            self.feed_meta["language"] = value
+
+    # -- item mapping ----------------------------------------------------
+
+    def _map_item(self, elem: ET.Element) -> FeedEntry:
+        entry: FeedEntry = {}
+        authors: List[Dict[str, str]] = []
+        contributors: List[Dict[str, str]] = []
+        links: List[Dict[str, str]] = []
+        content: List[Dict[str, Any]] = []
+
+        if self.version == "rss10":
+            about = elem.get(_RDF_ABOUT)
+            if about:
+                entry["id"] = about
+
+        lang = elem.get(_XML_LANG) or self._lang
+        core_ns = RSS10_NS if self.version == "rss10" else ""
+
+        for child in elem:
+            ns, name = _split_tag(child.tag)
+
+            if ns == DC_NS:
+                self._map_dc(entry, name, child, authors, contributors)
+            elif ns.startswith(PRISM_NS_PREFIX):
+                if name == "doi" and _text(child):
+                    entry["prism_doi"] = _text(child)
+            elif ns == CONTENT_NS and name == "encoded":
+                content.append({"type": "text/html", "value": _text(child)})
+            elif self.version == "atom10" and ns == ATOM_NS:
+                self._map_atom(
+                    entry, child, name, lang, authors, contributors, links, content
+                )
+            elif self.version != "atom10" and ns == core_ns:
+                self._map_rss(entry, child, name, authors, links)
+
+        if "link" not in entry:
+            for link in links:
+                if link.get("rel") == "alternate":
+                    entry["link"] = link["href"]
+                    break
+        if entry.get("link") and not any(
+            link.get("rel") == "alternate" for link in links
+        ):
+            links.insert(
+                0, {"rel": "alternate", "type": "text/html", "href": entry["link"]}
+            )
+        enclosures = [
+            {k: v for k, v in link.items() if k != "rel"}
+            for link in links
+            if link.get("rel") == "enclosure"
+        ]
+
+        if authors:
+            entry["authors"] = authors
+            if authors[0].get("name"):
+                entry["author"] = authors[0]["name"]
+        if contributors:
+            entry["contributors"] = contributors
+        if links:
+            entry["links"] = links
+        if enclosures:
+            entry["enclosures"] = enclosures
+        if content:
+            entry["content"] = content
+            if "summary" not in entry:
+                entry["summary"] = content[0]["value"]
+        for key in ("published", "updated"):
+            if key in entry:
+                parsed = _parse_date(entry[key])
+                if parsed is not None:
+                    entry[f"{key}_parsed"] = parsed
+        return entry
+
+    @staticmethod
+    def _map_dc(
+        entry: FeedEntry,
+        name: str,
+        child: ET.Element,
+        authors: List[Dict[str, str]],
+        contributors: List[Dict[str, str]],
+    ) -> None:
+        if name not in _DC_FIELDS:
+            return
+        value = _text(child)
+        if not value:
+            return
+        if name == "creator":
+            authors.append({"name": value})
+        elif name == "contributor":
+            contributors.append({"name": value})
+        elif name == "date":
+            entry["updated"] = value
+        elif name == "identifier":
+            entry["dc_identifier"] = value
+        elif name == "publisher":
+            entry["publisher"] = value
+        elif name == "rights":
+            entry["rights"] = value
+        elif name == "title":
+            entry["title"] = value
+        elif name == "description":
+            entry["summary"] = value
+            entry["summary_detail"] = {"type": "text/html", "value": value}
+
+    @staticmethod
+    def _map_rss(
+        entry: FeedEntry,
+        child: ET.Element,
+        name: str,
+        authors: List[Dict[str, str]],
+        links: List[Dict[str, str]],
+    ) -> None:
+        if name == "enclosure":
+            href = child.get("url")
+            if href:
+                link = {"rel": "enclosure", "href": _absolute_url(href)}
+                for attr in ("type", "length"):
+                    if child.get(attr):
+                        link[attr] = child.get(attr) or ""
+                links.append(link)
+            return
+        if name not in _RSS_ITEM_FIELDS:
+            return
+
+        value = _text(child)
+        if name == "title":
+            entry["title"] = value
+        elif name == "link":
+            if value:
+                entry["link"] = _absolute_url(value)
+        elif name == "guid":
+            if value:
+                entry["id"] = value
+                permalink = (child.get("isPermaLink") or "true").lower() == "true"
+                if permalink and "link" not in entry:
+                    entry["link"] = _absolute_url(value)
+        elif name == "description":
+            entry["summary"] = value
+            entry["summary_detail"] = {"type": "text/html", "value": value}
+        elif name == "pubDate":
+            entry["published"] = value
+        elif name == "author" and value:
+            match = _RSS_AUTHOR.match(value)
+            if match:
+                authors.append({"name": match.group(2), "email": match.group(1)})
+            else:
+                authors.append({"name": value})
+        elif name == "source":
+            source: Dict[str, str] = {}
+            if child.get("url"):
+                # feedparser exposes the source URL under both keys.
+                source["href"] = source["url"] = child.get("url") or ""
+            if value:
+                source["title"] = value
+            if source:
+                entry["source"] = source
+
+    @staticmethod
+    def _map_atom(
+        entry: FeedEntry,
+        child: ET.Element,
+        name: str,
+        lang: Optional[str],
+        authors: List[Dict[str, str]],
+        contributors: List[Dict[str, str]],
+        links: List[Dict[str, str]],
+        content: List[Dict[str, Any]],
+    ) -> None:
+        if name in ("author", "contributor"):
+            person: Dict[str, str] = {}
+            for part in child:
+                part_ns, part_name = _split_tag(part.tag)
+                if part_ns == ATOM_NS and part_name in ("name", "email", "uri"):
+                    value = _text(part)
+                    if value:
+                        person["href" if part_name == "uri" else part_name] = value
+            if person:
+                (authors if name == "author" else contributors).append(person)
+            return
+
+        if name == "link":
+            href = child.get("href")
+            if href:
+                link = {
+                    "rel": child.get("rel") or "alternate",
+                    "href": _absolute_url(href),
+                }
+                for attr in ("type", "length"):
+                    if child.get(attr):
+                        link[attr] = child.get(attr) or ""
+                links.append(link)
+            return
+
+        if name not in _ATOM_ENTRY_FIELDS:
+            return
+        text_type = (child.get("type") or "text").lower()
+        if text_type == "xhtml":
+            raise UnsupportedFeedError("xhtml text construct")
+        mime = _ATOM_TEXT_TYPES.get(text_type, text_type)
+        value = _text(child)
+
+        if name == "title":
+            entry["title"] = value
+        elif name == "id":
+            if value:
+                entry["id"] = value
+        elif name in ("published", "issued"):
+            entry["published"] = value
+        elif name in ("updated", "modified"):
+            entry["updated"] = value
+        elif name == "summary":
+            entry["summary"] = value
+            entry["summary_detail"] = {
+                "type": mime,
+                "language": child.get(_XML_LANG) or lang,
+                "value": value,
+            }
+        elif name == "content":
+            content.append(
+                {
+                    "type": mime,
+                    "language": child.get(_XML_LANG) or lang,
+                    "value": value,
+                }
+            )
+        elif name == "rights":
+            entry["rights"] = value
+
+
+def fast_parse_feed(
+    body: str | bytes,
+) -> Optional[Tuple[FeedMeta, List[FeedEntry]]]:
+    """Parse a feed body on the fast path, or return None to use feedparser."""
+    parser = FastFeedParser()
+    try:
+        parser.feed(body)
+        return parser.close()
+    except Exception as e:
+        # Anything the fast path cannot handle (malformed XML, an encoding
+        # expat does not know, unexpected structure) goes to feedparser,
+        # which is far more forgiving.
+        logger.debug(f"Fast feed parser declined, falling back to feedparser: {e}")
+        return None
@@ -0,0 +1,187 @@
+"""Per-feed health history and circuit breaker for RSS fetches."""
+
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.sources.rss_store import atomic_write_json, load_versioned_json
+
+logger = logging.getLogger(__name__)
+
+FEED_HEALTH_FILENAME = "feed_health.json"
+_HEALTH_VERSION = 1
+_HISTORY_LIMIT = 10
+_MAX_BACKOFF = timedelta(days=7)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class FeedHealth:
+    """Recent outcomes and breaker state for a single feed URL."""
+
+    consecutive_failures: int = 0
+    last_status: Optional[int] = None
+    last_latency: Optional[float] = None
+    last_error: Optional[str] = None
+    last_success_at: Optional[str] = None
+    skip_until: Optional[str] = None
+    history: List[Dict[str, Any]] = field(default_factory=list)
+
+    def retry_after(self) -> Optional[datetime]:
+        if not self.skip_until:
+            return None
+        try:
+            return datetime.fromisoformat(self.skip_until)
+        except ValueError:
+            return None
+
+    def is_open(self, now: Optional[datetime] = None) -> bool:
+        """True while the feed is inside its backoff window."""
+        retry_after = self.retry_after()
+        if retry_after is None:
+            return False
+        return (now or _utcnow()) < retry_after
+
+
+@dataclass
+class SkippedFeed:
+    """A feed left out of a fetch because its circuit was open."""
+
+    url: str
+    title: str
+    consecutive_failures: int
+    retry_after: Optional[str] = None
+
+
+class FeedHealthTracker:
+    """Track feed outcomes and back off from feeds that keep failing.
+
+    After ``failure_threshold`` consecutive failures a feed is skipped for
+    ``backoff_hours``; every further failed probe doubles the window, capped at
+    one week. A single successful fetch closes the circuit again. When
+    ``cache_dir`` is given the history is persisted as JSON next to the feed
+    validator cache; otherwise it only lives for the current process.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str | Path] = None,
+        failure_threshold: int = 3,
+        backoff_hours: float = 24.0,
+    ):
+        self.path = Path(cache_dir) / FEED_HEALTH_FILENAME if cache_dir else None
+        self.failure_threshold = failure_threshold
+        self.backoff = timedelta(hours=backoff_hours)
+        self._entries: Dict[str, FeedHealth] = {}
+        self._dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        raw = load_versioned_json(self.path, _HEALTH_VERSION, "feed health file")
+        if raw is None:
+            return
+        feeds = raw.get("feeds")
+        if not isinstance(feeds, dict):
+            return
+        for url, data in feeds.items():
+            if not isinstance(data, dict):
+                continue
+            try:
+                self._entries[url] = FeedHealth(**data)
+            except TypeError:
+                continue
+
+    def get(self, url: str) -> Optional[FeedHealth]:
+        return self._entries.get(url)
+
+    def should_skip(self, url: str, now: Optional[datetime] = None) -> bool:
+        if self.failure_threshold <= 0:
+            return False
+        health = self._entries.get(url)
+        return health is not None and health.is_open(now)
+
+    def record_success(
+        self,
+        url: str,
+        status: Optional[int],
+        latency: float,
+        now: Optional[datetime] = None,
+    ) -> None:
+        now = now or _utcnow()
+        health = self._entries.setdefault(url, FeedHealth())
+        if health.consecutive_failures >= max(self.failure_threshold, 1):
+            logger.info(
+                f"Feed recovered after {health.consecutive_failures} failures: {url}"
+            )
+        health.consecutive_failures = 0
+        health.last_error = None
+        health.last_success_at = now.isoformat()
+        health.skip_until = None
+        self._append(health, now, ok=True, status=status, latency=latency)
+
+    def record_failure(
+        self,
+        url: str,
+        status: Optional[int],
+        latency: float,
+        error: str,
+        now: Optional[datetime] = None,
+    ) -> None:
+        now = now or _utcnow()
+        health = self._entries.setdefault(url, FeedHealth())
+        health.consecutive_failures += 1
+        health.last_error = error
+        if 0 < self.failure_threshold <= health.consecutive_failures:
+            exponent = health.consecutive_failures - self.failure_threshold
+            delay = min(self.backoff * (2 ** min(exponent, 16)), _MAX_BACKOFF)
+            health.skip_until = (now + delay).isoformat()
+            logger.warning(
+                f"Feed failed {health.consecutive_failures} times in a row, "
+                f"skipping until {health.skip_until}: {url}"
+            )
+        self._append(
+            health, now, ok=False, status=status, latency=latency, error=error
+        )
+
+    def _append(
+        self,
+        health: FeedHealth,
+        now: datetime,
+        ok: bool,
+        status: Optional[int],
+        latency: float,
+        error: Optional[str] = None,
+    ) -> None:
+        health.last_status = status
+        health.last_latency = round(latency, 3)
+        outcome: Dict[str, Any] = {
+            "at": now.isoformat(),
+            "ok": ok,
+            "status": status,
+            "latency": health.last_latency,
+        }
+        if error:
+            outcome["error"] = error
+        health.history.append(outcome)
+        del health.history[:-_HISTORY_LIMIT]
+        self._dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        payload = {
+            "version": _HEALTH_VERSION,
+            "feeds": {url: asdict(entry) for url, entry in self._entries.items()},
+        }
+        if atomic_write_json(self.path, payload, "feed health file"):
+            self._dirty = False
@@ -52,6 +52,10 @@ class RSSParser:
             extra=metadata,
         )
 
+    def published_date(self, entry: Any) -> Optional[date]:
+        """Publication date ``parse`` would assign, without building the item."""
+        return self._extract_published_date(entry)
+
     def _get_field(self, entry: Any, key: str, default: Any = None) -> Any:
         if isinstance(entry, dict):
             return entry.get(key, default)
@@ -0,0 +1,120 @@
+"""Adaptive per-feed polling schedule learned from entry publication dates."""
+
+import statistics
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.sources.rss_store import atomic_write_json, load_versioned_json
+
+FEED_SCHEDULE_FILENAME = "feed_schedule.json"
+_SCHEDULE_VERSION = 1
+_DATE_HISTORY_LIMIT = 30
+_MIN_SAMPLES = 4
+_MAX_POLL_GAP = timedelta(days=7)
+_POLL_SLACK = timedelta(hours=2)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class FeedSchedule:
+    """Publication history and last poll time for a single feed URL."""
+
+    entry_dates: List[str] = field(default_factory=list)
+    last_polled: Optional[str] = None
+
+    def cadence_days(self) -> Optional[float]:
+        """Median gap between distinct publication dates, if enough are known."""
+        if len(self.entry_dates) < _MIN_SAMPLES:
+            return None
+        dates = [date.fromisoformat(d) for d in self.entry_dates]
+        gaps = [(later - earlier).days for earlier, later in zip(dates, dates[1:])]
+        return float(statistics.median(gaps))
+
+    def next_expected(self) -> Optional[date]:
+        cadence = self.cadence_days()
+        if cadence is None:
+            return None
+        last_entry = date.fromisoformat(self.entry_dates[-1])
+        return last_entry + timedelta(days=cadence)
+
+    def is_due(self, now: Optional[datetime] = None) -> bool:
+        """Whether the feed plausibly has new entries worth a request.
+
+        Feeds without enough history, never polled, or not polled for a week
+        are always due. Otherwise a feed becomes due one day before its next
+        expected publication date and stays due until new entries show up.
+        """
+        now = now or _utcnow()
+        expected = self.next_expected()
+        if expected is None or not self.last_polled:
+            return True
+        try:
+            last_polled = datetime.fromisoformat(self.last_polled)
+        except ValueError:
+            return True
+        if now - last_polled >= _MAX_POLL_GAP - _POLL_SLACK:
+            return True
+        return now.date() >= expected - timedelta(days=1)
+
+
+class FeedScheduler:
+    """JSON-backed store of per-feed cadences deciding which feeds to poll."""
+
+    def __init__(self, cache_dir: str | Path):
+        self.path = Path(cache_dir) / FEED_SCHEDULE_FILENAME
+        self._entries: Dict[str, FeedSchedule] = {}
+        self._dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        raw = load_versioned_json(self.path, _SCHEDULE_VERSION, "feed schedule")
+        if raw is None:
+            return
+        feeds = raw.get("feeds")
+        if not isinstance(feeds, dict):
+            return
+        for url, data in feeds.items():
+            if not isinstance(data, dict):
+                continue
+            try:
+                self._entries[url] = FeedSchedule(**data)
+            except TypeError:
+                continue
+
+    def get(self, url: str) -> Optional[FeedSchedule]:
+        return self._entries.get(url)
+
+    def is_due(self, url: str, now: Optional[datetime] = None) -> bool:
+        schedule = self._entries.get(url)
+        return schedule is None or schedule.is_due(now)
+
+    def record_poll(
+        self,
+        url: str,
+        entry_dates: Iterable[Optional[date]] = (),
+        now: Optional[datetime] = None,
+    ) -> None:
+        schedule = self._entries.setdefault(url, FeedSchedule())
+        schedule.last_polled = (now or _utcnow()).isoformat()
+        known = set(schedule.entry_dates)
+        known.update(d.isoformat() for d in entry_dates if d is not None)
+        schedule.entry_dates = sorted(known)[-_DATE_HISTORY_LIMIT:]
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        payload = {
+            "version": _SCHEDULE_VERSION,
+            "feeds": {url: asdict(entry) for url, entry in self._entries.items()},
+        }
+        if atomic_write_json(self.path, payload, "feed schedule"):
+            self._dirty = False
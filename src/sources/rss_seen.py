@@ -0,0 +1,84 @@
+"""Persistent per-feed record of already emitted RSS entries."""
+
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from src.models.responses import PaperItem
+from src.sources.rss_store import atomic_write_json, load_versioned_json
+from src.utils.dedup import identity_keys_for_paper
+
+SEEN_ENTRIES_FILENAME = "seen_entries.json"
+_SEEN_VERSION = 1
+
+
+def _paper_keys(paper: PaperItem) -> List[str]:
+    return [f"{kind}:{value}" for kind, value in identity_keys_for_paper(paper)]
+
+
+class SeenEntryStore:
+    """Identity keys of emitted entries, grouped by the feed they came from.
+
+    A paper counts as seen when any of its identity keys was recorded for
+    any feed, so an article cross-posted to a second feed is not emitted
+    again. Keys not observed for ``retention_days`` are pruned on save, which
+    keeps the file proportional to what feeds still publish.
+    """
+
+    def __init__(self, cache_dir: str | Path, retention_days: int = 90):
+        self.path = Path(cache_dir) / SEEN_ENTRIES_FILENAME
+        self.retention = timedelta(days=retention_days)
+        self._feeds: Dict[str, Dict[str, str]] = {}
+        self._index: Set[str] = set()
+        self._dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _load(self) -> None:
+        raw = load_versioned_json(self.path, _SEEN_VERSION, "seen-entry store")
+        if raw is None:
+            return
+        feeds = raw.get("feeds")
+        if not isinstance(feeds, dict):
+            return
+        for url, keys in feeds.items():
+            if not isinstance(keys, dict):
+                continue
+            self._feeds[url] = {str(k): str(v) for k, v in keys.items()}
+            self._index.update(self._feeds[url])
+
+    def is_seen(self, paper: PaperItem) -> bool:
+        return any(key in self._index for key in _paper_keys(paper))
+
+    def mark(
+        self, feed_url: str, paper: PaperItem, today: Optional[date] = None
+    ) -> None:
+        keys = _paper_keys(paper)
+        if not keys:
+            return
+        stamp = (today or date.today()).isoformat()
+        feed_keys = self._feeds.setdefault(feed_url, {})
+        for key in keys:
+            feed_keys[key] = stamp
+            self._index.add(key)
+        self._dirty = True
+
+    def _prune(self, today: date) -> None:
+        cutoff = (today - self.retention).isoformat()
+        for url in list(self._feeds):
+            kept = {k: v for k, v in self._feeds[url].items() if v >= cutoff}
+            if kept:
+                self._feeds[url] = kept
+            else:
+                del self._feeds[url]
+        self._index = {key for keys in self._feeds.values() for key in keys}
+
+    def save(self, today: Optional[date] = None) -> None:
+        if not self._dirty:
+            return
+        self._prune(today or date.today())
+        payload = {"version": _SEEN_VERSION, "feeds": self._feeds}
+        if atomic_write_json(self.path, payload, "seen-entry store"):
+            self._dirty = False
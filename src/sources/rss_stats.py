@@ -0,0 +1,78 @@
+"""Per-feed timing and entry statistics collected during an RSS fetch."""
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+FETCH_STATS_FILENAME = "rss_fetch_stats.json"
+
+
+@dataclass
+class FeedTiming:
+    """Where the time for one feed went, in seconds, plus entry counts.
+
+    ``wait_seconds`` is time spent queued on the host/global concurrency
+    slots and ``total_seconds`` everything after a slot was acquired.
+    ``ttfb_seconds`` is the time until response headers arrived and
+    ``download_seconds`` the time spent streaming the body after that.
+    """
+
+    url: str
+    title: str
+    outcome: str = "pending"
+    wait_seconds: float = 0.0
+    ttfb_seconds: Optional[float] = None
+    download_seconds: Optional[float] = None
+    bytes: int = 0
+    parse_seconds: float = 0.0
+    convert_seconds: float = 0.0
+    total_seconds: float = 0.0
+    entries_total: int = 0
+    entries_kept: int = 0
+    entries_dropped_since: int = 0
+
+    def absorb_parse_stats(self, stats: Dict[str, Any]) -> None:
+        self.parse_seconds = stats.get("parse_seconds", 0.0)
+        self.convert_seconds = stats.get("convert_seconds", 0.0)
+        self.entries_total = stats.get("entries_total", 0)
+        self.entries_dropped_since = stats.get("entries_dropped_since", 0)
+
+
+@dataclass
+class RSSFetchStats:
+    """Timings of every feed touched by the last fetch."""
+
+    feeds: List[FeedTiming] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    def add(self, timing: FeedTiming) -> None:
+        self.feeds.append(timing)
+
+    def slowest(self, n: int = 5) -> List[FeedTiming]:
+        return sorted(self.feeds, key=lambda t: t.total_seconds, reverse=True)[:n]
+
+    def summary(self) -> Dict[str, Any]:
+        outcomes: Dict[str, int] = {}
+        for timing in self.feeds:
+            outcomes[timing.outcome] = outcomes.get(timing.outcome, 0) + 1
+        return {
+            "feeds": len(self.feeds),
+            "wall_seconds": round(self.wall_seconds, 3),
+            "outcomes": outcomes,
+            "bytes": sum(t.bytes for t in self.feeds),
+            "wait_seconds": round(sum(t.wait_seconds for t in self.feeds), 3),
+            "parse_seconds": round(sum(t.parse_seconds for t in self.feeds), 3),
+            "convert_seconds": round(
+                sum(t.convert_seconds for t in self.feeds), 3
+            ),
+            "entries_total": sum(t.entries_total for t in self.feeds),
+            "entries_kept": sum(t.entries_kept for t in self.feeds),
+            "entries_dropped_since": sum(
+                t.entries_dropped_since for t in self.feeds
+            ),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "summary": self.summary(),
+            "feeds": [asdict(t) for t in self.feeds],
+        }
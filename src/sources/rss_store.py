@@ -0,0 +1,44 @@
+"""Versioned, atomically written JSON files shared by the per-feed RSS stores."""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def load_versioned_json(
+    path: Path, version: int, label: str
+) -> Optional[Dict[str, Any]]:
+    """Read ``path`` if it holds a JSON object with the expected ``version``.
+
+    Missing, unreadable or differently versioned files return None (the
+    latter two with a log line naming ``label``), so stores start empty
+    instead of failing.
+    """
+    if not path.exists():
+        return None
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable {label} {path}: {e}")
+        return None
+
+    if not isinstance(raw, dict) or raw.get("version") != version:
+        logger.info(f"Discarding {label} with unknown format: {path}")
+        return None
+    return raw
+
+
+def atomic_write_json(path: Path, payload: Dict[str, Any], label: str) -> bool:
+    """Write ``payload`` through a temp file and rename; False on failure."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+    except Exception as e:
+        logger.warning(f"Failed to save {label} {path}: {e}")
+        return False
+    return True
@@ -0,0 +1,262 @@
+"""httpx transport that bounds feed response bodies while they stream in."""
+
+import ipaddress
+import time
+import zlib
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+from urllib.request import getproxies
+
+import httpx
+
+_REJECTED_MEDIA_TYPES = frozenset(
+    {
+        "application/json",
+        "application/pdf",
+        "application/zip",
+    }
+)
+_REJECTED_MAJOR_TYPES = frozenset({"image", "audio", "video", "font"})
+_HTML_PREFIXES = (b"<!doctype html", b"<html")
+_SNIFF_BYTES = 512
+_DECODE_CHUNK_BYTES = 64 * 1024
+# Encodings the transport inflates itself; requests only advertise these.
+_DECODED_ENCODINGS = ("gzip", "deflate")
+_ACCEPT_ENCODING = ", ".join(_DECODED_ENCODINGS)
+
+# Response extension holding ``ttfb_seconds``, ``download_seconds`` and
+# ``bytes`` for the feed download.
+TIMING_EXTENSION = "feed_timing"
+
+
+class FeedBodyTooLargeError(httpx.RequestError):
+    """Response body exceeded the configured feed size cap."""
+
+
+class NotAFeedError(httpx.RequestError):
+    """Response content type or leading bytes show it is not an XML feed."""
+
+
+def environment_proxies() -> Dict[str, Optional[str]]:
+    """Proxy URL (or None to bypass) per httpx mount pattern, from the environment.
+
+    httpx only reads ``HTTP_PROXY``/``HTTPS_PROXY``/``ALL_PROXY`` and
+    ``NO_PROXY`` for a client built without an explicit transport, so
+    clients that wrap their transport mount these themselves. The rules
+    follow httpx's own: ``NO_PROXY=*`` disables proxying, and a bare
+    domain also covers its subdomains.
+    """
+    proxy_info = getproxies()
+    proxies: Dict[str, Optional[str]] = {}
+    for scheme in ("http", "https", "all"):
+        url = proxy_info.get(scheme)
+        if url:
+            proxies[f"{scheme}://"] = url if "://" in url else f"http://{url}"
+
+    for host in (h.strip() for h in proxy_info.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if not host:
+            continue
+        if "://" in host:
+            proxies[host] = None
+            continue
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            address = None
+        if address is not None and address.version == 6:
+            proxies[f"all://[{host}]"] = None
+        elif address is not None or host.lower() == "localhost":
+            proxies[f"all://{host}"] = None
+        else:
+            proxies[f"all://*{host}"] = None
+    return proxies
+
+
+def _media_type(response: httpx.Response) -> str:
+    return response.headers.get("content-type", "").split(";")[0].strip().lower()
+
+
+def _looks_like_html(head: bytes) -> bool:
+    head = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    return head.startswith(_HTML_PREFIXES)
+
+
+class _BoundedFeedStream(httpx.AsyncByteStream):
+    def __init__(
+        self,
+        stream: httpx.AsyncByteStream,
+        request: httpx.Request,
+        max_bytes: int,
+        sniff_html: bool,
+        content_encoding: str,
+        timing: Dict[str, Any],
+    ):
+        self._stream = stream
+        self._timing = timing
+        self._request = request
+        self._max_bytes = max_bytes
+        self._sniff_html = sniff_html
+        self._content_encoding = content_encoding
+        self._decompressor: Any = None
+        self._first_chunk = True
+        if content_encoding == "gzip":
+            self._decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        elif content_encoding == "deflate":
+            self._decompressor = zlib.decompressobj()
+
+    def _decompress(self, data: bytes) -> bytes:
+        try:
+            return self._decompressor.decompress(data, _DECODE_CHUNK_BYTES)
+        except zlib.error as exc:
+            if self._content_encoding == "deflate" and self._first_chunk:
+                # Some servers send raw deflate without the zlib header.
+                self._content_encoding = "raw-deflate"
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                return self._decompress(data)
+            raise httpx.DecodingError(str(exc), request=self._request) from exc
+        finally:
+            self._first_chunk = False
+
+    def _decode(self, chunk: bytes) -> Iterator[bytes]:
+        """Decoded pieces of ``chunk``, at most ``_DECODE_CHUNK_BYTES`` each.
+
+        Inflating in bounded steps means a small compressed chunk never
+        expands into memory beyond the cap before it can be counted.
+        """
+        if self._decompressor is None:
+            yield chunk
+            return
+        data = self._decompress(chunk)
+        while True:
+            if data:
+                yield data
+            tail = self._decompressor.unconsumed_tail
+            if not tail:
+                return
+            data = self._decompress(tail)
+
+    def _flush(self) -> bytes:
+        if self._decompressor is None:
+            return b""
+        return self._decompressor.flush()
+
+    def _check(self, decoded: int, data: bytes) -> None:
+        if self._max_bytes and decoded > self._max_bytes:
+            raise FeedBodyTooLargeError(
+                f"feed body exceeds {self._max_bytes} bytes",
+                request=self._request,
+            )
+        if self._sniff_html and data:
+            self._sniff_html = False
+            if _looks_like_html(data[:_SNIFF_BYTES]):
+                raise NotAFeedError(
+                    "response is an HTML page, not a feed",
+                    request=self._request,
+                )
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        decoded = 0
+        started = time.perf_counter()
+        async for chunk in self._stream:
+            self._timing["bytes"] += len(chunk)
+            for data in self._decode(chunk):
+                decoded += len(data)
+                self._check(decoded, data)
+                yield data
+        data = self._flush()
+        if data:
+            decoded += len(data)
+            self._check(decoded, data)
+            yield data
+        self._timing["download_seconds"] = time.perf_counter() - started
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class BoundedFeedTransport(httpx.AsyncBaseTransport):
+    """Wrap a transport so feed bodies are capped and non-feeds fail fast.
+
+    Responses announcing a non-XML media type (JSON, PDF, images, ...) are
+    rejected from their headers alone, and an HTML page is recognised from
+    its first chunk, so neither body is downloaded. gzip and deflate bodies
+    are inflated here rather than by the client, and every body is counted
+    as it decodes: the request fails once it exceeds ``max_bytes`` of
+    decoded data (``0`` disables the cap), so a compression bomb is stopped
+    at the cap too. Download timings, with ``bytes`` as transferred, are
+    exposed through the ``TIMING_EXTENSION`` response extension.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_bytes: int = 0):
+        self._transport = transport
+        self.max_bytes = max_bytes
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.headers["Accept-Encoding"] = _ACCEPT_ENCODING
+        started = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        timing: Dict[str, Any] = {
+            "ttfb_seconds": time.perf_counter() - started,
+            "download_seconds": None,
+            "bytes": 0,
+        }
+
+        media_type = _media_type(response)
+        rejected = media_type in _REJECTED_MEDIA_TYPES or (
+            media_type.split("/")[0] in _REJECTED_MAJOR_TYPES
+        )
+        if 200 <= response.status_code < 300 and rejected:
+            await response.aclose()
+            raise NotAFeedError(
+                f"unexpected content type for a feed: {media_type}",
+                request=request,
+            )
+
+        content_encoding = response.headers.get("content-encoding", "").lower()
+        if content_encoding not in ("", "identity", *_DECODED_ENCODINGS):
+            await response.aclose()
+            raise httpx.DecodingError(
+                f"unsupported content encoding for a feed: {content_encoding}",
+                request=request,
+            )
+
+        content_length = response.headers.get("content-length", "")
+        if (
+            self.max_bytes
+            and content_encoding in ("", "identity")
+            and content_length.isdigit()
+            and int(content_length) > self.max_bytes
+        ):
+            await response.aclose()
+            raise FeedBodyTooLargeError(
+                f"feed body of {content_length} bytes exceeds {self.max_bytes}",
+                request=request,
+            )
+
+        if not isinstance(response.stream, httpx.AsyncByteStream):
+            return response
+        headers = response.headers.copy()
+        if content_encoding in _DECODED_ENCODINGS:
+            # The body below is already decoded; stop the client decoding it
+            # again and drop the length of the encoded form.
+            del headers["content-encoding"]
+            headers.pop("content-length", None)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=headers,
+            stream=_BoundedFeedStream(
+                response.stream,
+                request,
+                self.max_bytes,
+                sniff_html=(
+                    200 <= response.status_code < 300 and "xml" not in media_type
+                ),
+                content_encoding=content_encoding,
+                timing=timing,
+            ),
+            extensions={**response.extensions, TIMING_EXTENSION: timing},
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -1,15 +1,19 @@
 """Utility functions for feedder-mcp."""
 
 from src.utils.dedup import (
+    NearDuplicateTitleIndex,
+    PaperDeduplicator,
     deduplicate_papers,
     identity_keys_for_paper,
     normalize_doi,
     normalize_title,
     normalize_url,
+    paper_quality,
     paper_export_identity_keys,
     paper_export_identity_key,
     zotero_data_identity_keys,
 )
+from src.utils.identity_index import PIPELINE_STAGES, PaperIdentityIndex
 from src.utils.text import DOI_PATTERN, clean_abstract, clean_html, clean_title
 
 __all__ = [
@@ -21,7 +25,12 @@ __all__ = [
     "normalize_title",
     "normalize_url",
     "identity_keys_for_paper",
+    "PaperDeduplicator",
+    "NearDuplicateTitleIndex",
     "deduplicate_papers",
+    "paper_quality",
+    "PIPELINE_STAGES",
+    "PaperIdentityIndex",
     "paper_export_identity_keys",
     "paper_export_identity_key",
     "zotero_data_identity_keys",
@@ -0,0 +1,78 @@
+"""Aho-Corasick automaton for finding many substrings in one pass."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher compiled into a DFA.
+
+    Building costs time proportional to the total pattern length times the
+    pattern alphabet; matching then reads each character of the text once,
+    however many patterns there are. Matching is case-sensitive, so callers
+    lowercase patterns and text themselves. Pattern ids are the positions
+    in the ``patterns`` iterable; an empty pattern matches every text.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = list(patterns)
+        self._always: Tuple[int, ...] = tuple(
+            i for i, pattern in enumerate(self.patterns) if not pattern
+        )
+
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            if pattern:
+                outputs[state].append(pattern_id)
+
+        # Breadth-first pass: compute failure links and fold them into a
+        # complete transition table over the pattern alphabet.
+        alphabet = {ch for edges in goto for ch in edges}
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict() for _ in goto]
+        for ch in alphabet:
+            delta[0][ch] = goto[0].get(ch, 0)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state].extend(outputs[fail[state]])
+            for ch in alphabet:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    delta[state][ch] = delta[fail[state]][ch]
+                else:
+                    fail[nxt] = delta[fail[state]][ch]
+                    delta[state][ch] = nxt
+                    queue.append(nxt)
+
+        self._delta = delta
+        self._outputs: List[Tuple[int, ...]] = [tuple(out) for out in outputs]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def iter_matches(self, text: str) -> Iterator[int]:
+        """Yield pattern ids as they end in ``text`` (ids may repeat)."""
+        yield from self._always
+        delta, outputs = self._delta, self._outputs
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                yield from outputs[state]
+
+    def matches(self, text: str) -> Set[int]:
+        """Ids of all patterns occurring in ``text``."""
+        return set(self.iter_matches(text))
@@ -0,0 +1,173 @@
+"""Compact probabilistic membership for large identity-key sets."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left
+from hashlib import blake2b
+from itertools import chain
+from typing import Iterable, List, Set, Tuple
+
+IdentityKey = Tuple[str, str]
+
+_LN2_SQUARED = math.log(2) ** 2
+_MASK_64 = (1 << 64) - 1
+# Fewest pending digests worth a merge into the sorted exact store.
+_MIN_MERGE = 4096
+
+
+def _digest(item: str) -> int:
+    raw = blake2b(item.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(raw, "big")
+
+
+class BloomFilter:
+    """Fixed-size bit-array Bloom filter sized for ``capacity`` items.
+
+    Uses ``k`` positions derived from one 128-bit BLAKE2b digest by double
+    hashing, so an item costs a single hash however small ``false_positive_rate``
+    is. Membership answers are "definitely not added" or "probably added".
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be in (0, 1)")
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(false_positive_rate) / _LN2_SQUARED)
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+    def add_digest(self, digest: int) -> None:
+        bits, m = self._bits, self.num_bits
+        h1, h2 = digest >> 64, (digest & _MASK_64) | 1
+        for _ in range(self.num_hashes):
+            pos = h1 % m
+            bits[pos >> 3] |= 1 << (pos & 7)
+            h1 += h2
+        self.count += 1
+
+    def contains_digest(self, digest: int) -> bool:
+        bits, m = self._bits, self.num_bits
+        h1, h2 = digest >> 64, (digest & _MASK_64) | 1
+        for _ in range(self.num_hashes):
+            pos = h1 % m
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+            h1 += h2
+        return True
+
+    def add(self, item: str) -> None:
+        self.add_digest(_digest(item))
+
+    def __contains__(self, item: str) -> bool:
+        return self.contains_digest(_digest(item))
+
+
+class IdentityKeySet:
+    """Set of ``(kind, value)`` identity keys with a Bloom filter in front.
+
+    Lookups first probe a scalable chain of :class:`BloomFilter` layers, and
+    only probable hits are confirmed against the exact store, so a key that
+    was never added is never reported present. The exact store is a sorted
+    ``array('Q')`` of 64-bit key digests searched with :mod:`bisect`, about
+    8 bytes per key instead of a tuple of strings; a false match would need
+    a 64-bit digest collision. Recently added digests wait in a small set
+    and are merged into the array in batches. ``false_positive_rate`` only
+    bounds how often a miss has to reach the exact store. When a layer fills
+    up, a layer twice as large with half the error rate is added, so the
+    overall rate stays within the budget without knowing the size up front.
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[IdentityKey] = (),
+        false_positive_rate: float = 0.01,
+        capacity: int = 1024,
+    ):
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be in (0, 1)")
+        self.false_positive_rate = false_positive_rate
+        self._layers: List[BloomFilter] = [
+            BloomFilter(max(capacity, 1), false_positive_rate / 2)
+        ]
+        self._exact = array("Q")
+        self._pending: Set[int] = set()
+        self.probable_hits = 0
+        self.false_positives = 0
+        self.update(keys)
+
+    @staticmethod
+    def _key_digest(key: IdentityKey) -> int:
+        kind, value = key
+        return _digest(f"{kind}\x1f{value}")
+
+    def _probably_contains(self, digest: int) -> bool:
+        return any(layer.contains_digest(digest) for layer in self._layers)
+
+    def _exactly_contains(self, short: int) -> bool:
+        if short in self._pending:
+            return True
+        exact = self._exact
+        i = bisect_left(exact, short)
+        return i < len(exact) and exact[i] == short
+
+    def _merge_pending(self) -> None:
+        # Timsort finds the existing sorted run, so this is close to linear.
+        self._exact = array("Q", sorted(chain(self._exact, self._pending)))
+        self._pending.clear()
+
+    def __len__(self) -> int:
+        return len(self._exact) + len(self._pending)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, tuple) or len(key) != 2:
+            return False
+        digest = self._key_digest(key)  # type: ignore[arg-type]
+        if not self._probably_contains(digest):
+            return False
+        self.probable_hits += 1
+        if self._exactly_contains(digest & _MASK_64):
+            return True
+        self.false_positives += 1
+        return False
+
+    def add(self, key: IdentityKey) -> None:
+        digest = self._key_digest(key)
+        short = digest & _MASK_64
+        if self._probably_contains(digest) and self._exactly_contains(short):
+            return
+        layer = self._layers[-1]
+        if layer.count >= layer.capacity:
+            layer = BloomFilter(layer.capacity * 2, layer.false_positive_rate / 2)
+            self._layers.append(layer)
+        layer.add_digest(digest)
+        self._pending.add(short)
+        if len(self._pending) >= max(_MIN_MERGE, len(self._exact) // 16):
+            self._merge_pending()
+
+    def update(self, keys: Iterable[IdentityKey]) -> None:
+        for key in keys:
+            self.add(key)
+
+    @property
+    def filter_bytes(self) -> int:
+        return sum(layer.nbytes for layer in self._layers)
+
+    @property
+    def exact_bytes(self) -> int:
+        """Size of the sorted digest array, excluding not yet merged keys."""
+        return self._exact.itemsize * len(self._exact)
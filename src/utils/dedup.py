@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import random
 import re
+import zlib
 from datetime import date
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 from src.models.responses import PaperItem
+from src.utils.bloom import IdentityKeySet
 from src.utils.text import DOI_PATTERN
 
 _TITLE_NOISE = re.compile(
@@ -23,10 +27,14 @@ _TRACKING_QUERY_KEYS = {
     "ref",
     "source",
 }
+# The same DOI/URL/title strings are normalized by RSS dedup, Gmail dedup,
+# export keys and the Zotero library preload. Each normalizer has its own
+# cache holding one kind of string, so the distinct DOIs, URLs and titles
+# of a 50k-paper batch each fit.
+_NORMALIZE_CACHE_SIZE = 1 << 16
 
 
-def normalize_doi(value: Optional[str]) -> Optional[str]:
-    """Normalize DOI-like text to lowercase bare DOI."""
+def _normalize_doi(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
 
@@ -49,6 +57,13 @@ def normalize_doi(value: Optional[str]) -> Optional[str]:
     return doi.lower() if doi else None
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def normalize_doi(value: Optional[str]) -> Optional[str]:
+    """Normalize DOI-like text to lowercase bare DOI."""
+    return _normalize_doi(value)
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_title(title: Optional[str]) -> str:
     """Normalize title text for stable dedup matching."""
     if not title:
@@ -60,6 +75,7 @@ def normalize_title(title: Optional[str]) -> str:
     return t
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_url(url: Optional[str]) -> Optional[str]:
     """Normalize URL by removing common tracking params and casing noise."""
     if not url:
@@ -69,7 +85,8 @@ def normalize_url(url: Optional[str]) -> Optional[str]:
     if not raw:
         return None
 
-    doi = normalize_doi(raw)
+    # Uncached: URLs would otherwise crowd DOIs out of normalize_doi's cache.
+    doi = _normalize_doi(raw)
     if doi and "doi.org/" in raw.lower():
         return f"https://doi.org/{doi}"
 
@@ -100,6 +117,13 @@ def normalize_url(url: Optional[str]) -> Optional[str]:
     )
 
 
+def clear_normalization_caches() -> None:
+    """Drop memoized DOI/URL/title normalizations."""
+    normalize_doi.cache_clear()
+    normalize_title.cache_clear()
+    normalize_url.cache_clear()
+
+
 def identity_keys_for_paper(paper: PaperItem) -> List[Tuple[str, str]]:
     """Build all stable identity keys for a paper."""
     keys: List[Tuple[str, str]] = []
@@ -119,49 +143,366 @@ def identity_keys_for_paper(paper: PaperItem) -> List[Tuple[str, str]]:
     return keys
 
 
-def deduplicate_papers(
-    papers: Iterable[PaperItem],
-) -> Tuple[List[PaperItem], Dict[str, Any]]:
-    """Deduplicate papers by DOI, URL, and normalized title."""
-    unique: List[PaperItem] = []
-    seen: Dict[Tuple[str, str], int] = {}
-    duplicates_by_key: Dict[str, int] = {"doi": 0, "url": 0, "title": 0}
-    kept_without_key = 0
-
-    input_count = 0
-    for paper in papers:
-        input_count += 1
+_MERSENNE_PRIME = (1 << 61) - 1
+_NEAR_MIN_TOKENS = 4
+
+
+def title_tokens(title: Optional[str]) -> frozenset[str]:
+    """Word set of the normalized title, the shingles used for MinHash."""
+    return frozenset(normalize_title(title).split())
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateTitleIndex:
+    """MinHash/LSH index returning earlier titles similar to a new one.
+
+    Each title is reduced to its normalized word set and a ``num_perm``
+    value MinHash signature, split into ``bands`` buckets. Only titles that
+    share a bucket are compared, and a candidate counts as a near duplicate
+    when the exact Jaccard similarity of the word sets is at least
+    ``threshold``, so a batch costs roughly linear time instead of comparing
+    every pair. Titles shorter than four words are never matched.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 32,
+        bands: int = 8,
+        seed: int = 1,
+    ) -> None:
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        if bands < 1 or num_perm % bands:
+            raise ValueError("num_perm must be a positive multiple of bands")
+        self.threshold = threshold
+        self._rows = num_perm // bands
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [
+            {} for _ in range(bands)
+        ]
+        self._token_hashes: Dict[str, Tuple[int, ...]] = {}
+        self._refs: List[Any] = []
+        self._tokens: List[frozenset[str]] = []
+        self._dois: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def ref(self, entry: int) -> Any:
+        """Caller-supplied reference stored with an entry."""
+        return self._refs[entry]
+
+    def _hashes(self, token: str) -> Tuple[int, ...]:
+        # Titles share most of their vocabulary, so each word is permuted once.
+        hashes = self._token_hashes.get(token)
+        if hashes is None:
+            h = zlib.crc32(token.encode("utf-8"))
+            hashes = tuple((a * h + b) % _MERSENNE_PRIME for a, b in self._perms)
+            self._token_hashes[token] = hashes
+        return hashes
+
+    def _signature(self, tokens: frozenset[str]) -> List[int]:
+        return list(map(min, zip(*(self._hashes(token) for token in tokens))))
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple[int, ...]]:
+        rows = self._rows
+        return [
+            tuple(signature[i * rows : (i + 1) * rows])
+            for i in range(len(self._buckets))
+        ]
+
+    def find_or_add(
+        self, title: Optional[str], doi: Optional[str] = None, ref: Any = None
+    ) -> Tuple[Optional[int], float]:
+        """Return ``(entry, similarity)`` of the best earlier match.
+
+        When nothing matches the title is added, with ``ref`` (default: the
+        title) retrievable through :meth:`ref`, and ``(None, 0.0)`` is
+        returned. Titles whose DOIs are both known and differ never match,
+        mirroring the exact tiers.
+        """
+        tokens = title_tokens(title)
+        if len(tokens) < _NEAR_MIN_TOKENS:
+            return None, 0.0
+
+        band_keys = self._band_keys(self._signature(tokens))
+        candidates: set[int] = set()
+        for buckets, key in zip(self._buckets, band_keys):
+            candidates.update(buckets.get(key, ()))
+
+        best, best_score = None, 0.0
+        for entry in candidates:
+            other_doi = self._dois[entry]
+            if doi and other_doi and doi != other_doi:
+                continue
+            score = _jaccard(tokens, self._tokens[entry])
+            if score >= self.threshold and score > best_score:
+                best, best_score = entry, score
+        if best is not None:
+            return best, best_score
+
+        entry = len(self._tokens)
+        self._refs.append(title if ref is None else ref)
+        self._tokens.append(tokens)
+        self._dois.append(doi)
+        for buckets, key in zip(self._buckets, band_keys):
+            buckets.setdefault(key, []).append(entry)
+        return None, 0.0
+
+
+class PaperDeduplicator:
+    """Incremental DOI/URL/title deduplicator for streamed papers.
+
+    Feeding papers one at a time through :meth:`add` gives the same
+    first-wins result as :func:`deduplicate_papers` over the whole list.
+    With ``near_duplicates`` a paper passing the exact tiers is also
+    checked against earlier titles through :class:`NearDuplicateTitleIndex`,
+    and the resulting clusters are reported in :meth:`stats`. Long-running
+    streams can pass ``false_positive_rate`` to keep seen keys as 64-bit
+    digests behind the Bloom filter of :class:`~src.utils.bloom.IdentityKeySet`,
+    which cuts memory without ever dropping a new paper as a duplicate.
+    """
+
+    def __init__(
+        self,
+        near_duplicates: bool = False,
+        near_threshold: float = 0.8,
+        false_positive_rate: Optional[float] = None,
+    ) -> None:
+        self._seen: set[Tuple[str, str]] | IdentityKeySet = set()
+        if false_positive_rate is not None:
+            self._seen = IdentityKeySet(false_positive_rate=false_positive_rate)
+        self.input_count = 0
+        self.unique_count = 0
+        self.kept_without_key = 0
+        self.duplicates_by_key: Dict[str, int] = {"doi": 0, "url": 0, "title": 0}
+        self._near: Optional[NearDuplicateTitleIndex] = None
+        self._near_clusters: Dict[int, List[Dict[str, Any]]] = {}
+        if near_duplicates:
+            self._near = NearDuplicateTitleIndex(threshold=near_threshold)
+            self.duplicates_by_key["near_title"] = 0
+
+    def add(self, paper: PaperItem) -> bool:
+        """Record a paper; return True if it is new, False if a duplicate."""
+        self.input_count += 1
         keys = identity_keys_for_paper(paper)
 
         if not keys:
-            kept_without_key += 1
-            unique.append(paper)
-            continue
+            self.kept_without_key += 1
+            self.unique_count += 1
+            return True
 
-        matched_kind: Optional[str] = None
         for key in keys:
-            if key in seen:
-                matched_kind = key[0]
-                break
+            if key in self._seen:
+                kind = key[0]
+                self.duplicates_by_key[kind] = self.duplicates_by_key.get(kind, 0) + 1
+                return False
+
+        if self._near is not None and self._is_near_duplicate(paper):
+            return False
+
+        self._seen.update(keys)
+        self.unique_count += 1
+        return True
+
+    def _is_near_duplicate(self, paper: PaperItem) -> bool:
+        assert self._near is not None
+        entry, similarity = self._near.find_or_add(
+            paper.title, normalize_doi(paper.doi)
+        )
+        if entry is None:
+            return False
 
-        if matched_kind:
-            duplicates_by_key[matched_kind] = duplicates_by_key.get(matched_kind, 0) + 1
+        self.duplicates_by_key["near_title"] += 1
+        self._near_clusters.setdefault(entry, []).append(
+            {"title": paper.title, "similarity": round(similarity, 3)}
+        )
+        return True
+
+    def near_duplicate_clusters(self) -> List[Dict[str, Any]]:
+        assert self._near is not None
+        return [
+            {"kept": self._near.ref(entry), "duplicates": duplicates}
+            for entry, duplicates in self._near_clusters.items()
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {
+            "input_count": self.input_count,
+            "unique_count": self.unique_count,
+            "dropped_count": self.input_count - self.unique_count,
+            "duplicates_by_key": dict(self.duplicates_by_key),
+            "kept_without_key": self.kept_without_key,
+        }
+        if self._near is not None:
+            stats["near_duplicate_clusters"] = self.near_duplicate_clusters()
+        return stats
+
+
+def paper_quality(paper: PaperItem) -> int:
+    """Metadata completeness score used to pick the best duplicate copy."""
+    score = 0
+    if paper.doi:
+        score += 4
+    if paper.url:
+        score += 2
+    if paper.abstract:
+        score += 1
+    score += min(len(paper.authors), 3)
+    return score
+
+
+class _UnionFind:
+    """Disjoint sets over ``0..size-1``; the smallest index is the root."""
+
+    def __init__(self, size: int) -> None:
+        self._parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> bool:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if root_b < root_a:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        return True
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _merge_group(members: List[PaperItem]) -> Tuple[PaperItem, int]:
+    """Best-scored copy with its empty fields filled from the other copies."""
+    ranked = sorted(members, key=paper_quality, reverse=True)
+    best = ranked[0]
+    updates: Dict[str, Any] = {}
+    for name in PaperItem.model_fields:
+        if name == "extra" or not _is_empty(getattr(best, name)):
             continue
+        for other in ranked[1:]:
+            value = getattr(other, name)
+            if not _is_empty(value):
+                updates[name] = value
+                break
+    filled = len(updates)
+
+    extra: Dict[str, Any] = {}
+    for other in reversed(ranked):
+        extra.update(other.extra)
+    if extra != best.extra:
+        updates["extra"] = extra
+
+    return (best.model_copy(update=updates) if updates else best), filled
 
-        new_index = len(unique)
-        unique.append(paper)
+
+def _merge_duplicate_papers(
+    papers: List[PaperItem],
+    near_duplicates: bool,
+    near_threshold: float,
+) -> Tuple[List[PaperItem], Dict[str, Any]]:
+    sets = _UnionFind(len(papers))
+    owners: Dict[Tuple[str, str], int] = {}
+    duplicates_by_key: Dict[str, int] = {"doi": 0, "url": 0, "title": 0}
+    kept_without_key = 0
+    near = None
+    near_links: Dict[int, List[Dict[str, Any]]] = {}
+    if near_duplicates:
+        near = NearDuplicateTitleIndex(threshold=near_threshold)
+        duplicates_by_key["near_title"] = 0
+
+    for i, paper in enumerate(papers):
+        keys = identity_keys_for_paper(paper)
+        if not keys:
+            kept_without_key += 1
+            continue
         for key in keys:
-            seen[key] = new_index
+            owner = owners.setdefault(key, i)
+            if owner != i and sets.union(owner, i):
+                duplicates_by_key[key[0]] += 1
+
+        if near is not None and sets.find(i) == i:
+            entry, similarity = near.find_or_add(
+                paper.title, normalize_doi(paper.doi), ref=i
+            )
+            if entry is not None:
+                owner = near.ref(entry)
+                sets.union(owner, i)
+                duplicates_by_key["near_title"] += 1
+                near_links.setdefault(owner, []).append(
+                    {"title": paper.title, "similarity": round(similarity, 3)}
+                )
+
+    groups: Dict[int, List[PaperItem]] = {}
+    for i, paper in enumerate(papers):
+        groups.setdefault(sets.find(i), []).append(paper)
+
+    merged: Dict[int, PaperItem] = {}
+    fields_filled = 0
+    for root, members in groups.items():
+        merged[root], filled = _merge_group(members)
+        fields_filled += filled
 
-    dropped = input_count - len(unique)
     stats: Dict[str, Any] = {
-        "input_count": input_count,
-        "unique_count": len(unique),
-        "dropped_count": dropped,
+        "input_count": len(papers),
+        "unique_count": len(merged),
+        "dropped_count": len(papers) - len(merged),
         "duplicates_by_key": duplicates_by_key,
         "kept_without_key": kept_without_key,
+        "merged_groups": sum(1 for members in groups.values() if len(members) > 1),
+        "fields_filled": fields_filled,
     }
-    return unique, stats
+    if near is not None:
+        stats["near_duplicate_clusters"] = [
+            {"kept": merged[sets.find(owner)].title, "duplicates": duplicates}
+            for owner, duplicates in near_links.items()
+        ]
+    return list(merged.values()), stats
+
+
+def deduplicate_papers(
+    papers: Iterable[PaperItem],
+    near_duplicates: bool = False,
+    near_threshold: float = 0.8,
+    merge: bool = False,
+) -> Tuple[List[PaperItem], Dict[str, Any]]:
+    """Deduplicate papers by DOI, URL, and normalized title.
+
+    ``near_duplicates`` adds a MinHash/LSH tier that also drops papers whose
+    title word sets have a Jaccard similarity of at least ``near_threshold``
+    with an earlier paper.
+
+    By default the first copy wins. With ``merge`` duplicates are grouped
+    with a union-find over their identity keys, so transitive matches (A~B
+    by URL, B~C by DOI) collapse into one record. Each group keeps its
+    highest :func:`paper_quality` copy, in the position of its first
+    member, with empty fields filled from the other copies.
+    """
+    if merge:
+        return _merge_duplicate_papers(list(papers), near_duplicates, near_threshold)
+
+    deduplicator = PaperDeduplicator(
+        near_duplicates=near_duplicates, near_threshold=near_threshold
+    )
+    unique = [paper for paper in papers if deduplicator.add(paper)]
+    return unique, deduplicator.stats()
 
 
 def _normalize_date_text(value: Any) -> Optional[str]:
@@ -0,0 +1,215 @@
+"""Persistent cross-run index of paper identities and pipeline progress."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.models.responses import PaperItem
+from src.utils.dedup import identity_keys_for_paper
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages in the order a paper passes through them.
+PIPELINE_STAGES: Tuple[str, ...] = ("fetched", "filtered", "enriched", "exported")
+_STAGE_RANK = {stage: rank for rank, stage in enumerate(PIPELINE_STAGES)}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS paper_identity (
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    stage INTEGER NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (kind, value)
+) WITHOUT ROWID
+"""
+
+# Keys already run through a stage under a given configuration (a filter's
+# criteria), whatever the outcome, so a rerun with the same settings can
+# skip them while other settings still see them.
+_SCOPE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS paper_stage_scope (
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    stage INTEGER NOT NULL,
+    scope TEXT NOT NULL,
+    PRIMARY KEY (kind, value, stage, scope)
+) WITHOUT ROWID
+"""
+
+_UPSERT = """
+INSERT INTO paper_identity (kind, value, first_seen, stage, updated_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (kind, value) DO UPDATE SET
+    first_seen = MIN(first_seen, excluded.first_seen),
+    stage = MAX(stage, excluded.stage),
+    updated_at = excluded.updated_at
+"""
+
+
+def _stage_rank(stage: str) -> int:
+    try:
+        return _STAGE_RANK[stage]
+    except KeyError:
+        raise ValueError(
+            f"Unknown pipeline stage {stage!r}; expected one of {PIPELINE_STAGES}"
+        ) from None
+
+
+class PaperIdentityIndex:
+    """SQLite table of identity keys with first-seen time and stage reached.
+
+    Rows are keyed by the ``(kind, value)`` tuples of
+    :func:`identity_keys_for_paper`, so a paper arriving from another source
+    or on a later run matches whenever it shares a DOI, URL, or title with
+    an indexed one. Each key keeps the earliest time it was seen and the
+    furthest stage of :data:`PIPELINE_STAGES` it reached; lookups are a
+    primary-key probe per key.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(_SCOPE_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> "PaperIdentityIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM paper_identity").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _lookup(self, keys: Sequence[Tuple[str, str]]) -> List[Tuple[str, int]]:
+        rows = []
+        for kind, value in keys:
+            row = self._conn.execute(
+                "SELECT first_seen, stage FROM paper_identity "
+                "WHERE kind = ? AND value = ?",
+                (kind, value),
+            ).fetchone()
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    def stage_of(self, paper: PaperItem) -> Optional[str]:
+        """Furthest stage any of the paper's identity keys reached."""
+        rows = self._lookup(identity_keys_for_paper(paper))
+        if not rows:
+            return None
+        return PIPELINE_STAGES[max(stage for _, stage in rows)]
+
+    def first_seen(self, paper: PaperItem) -> Optional[datetime]:
+        rows = self._lookup(identity_keys_for_paper(paper))
+        if not rows:
+            return None
+        return datetime.fromisoformat(min(first for first, _ in rows))
+
+    def has_reached(self, paper: PaperItem, stage: str) -> bool:
+        rank = _stage_rank(stage)
+        return any(
+            reached >= rank
+            for _, reached in self._lookup(identity_keys_for_paper(paper))
+        )
+
+    def _checked(self, keys: Sequence[Tuple[str, str]], rank: int, scope: str) -> bool:
+        return any(
+            self._conn.execute(
+                "SELECT 1 FROM paper_stage_scope "
+                "WHERE kind = ? AND value = ? AND stage = ? AND scope = ?",
+                (kind, value, rank, scope),
+            ).fetchone()
+            is not None
+            for kind, value in keys
+        )
+
+    def partition(
+        self,
+        papers: Iterable[PaperItem],
+        stage: str,
+        scope: Optional[str] = None,
+    ) -> Tuple[List[PaperItem], List[PaperItem]]:
+        """Split papers into ``(pending, done)`` for the given stage.
+
+        With ``scope``, a paper is done once :meth:`record_checked` saw it
+        for that stage and scope, whatever the outcome was. Papers without
+        any identity key can never be matched and are always pending.
+        """
+        rank = _stage_rank(stage)
+        pending: List[PaperItem] = []
+        done: List[PaperItem] = []
+        for paper in papers:
+            keys = identity_keys_for_paper(paper)
+            if scope is not None:
+                is_done = self._checked(keys, rank, scope)
+            else:
+                is_done = any(reached >= rank for _, reached in self._lookup(keys))
+            (done if is_done else pending).append(paper)
+        return pending, done
+
+    def record(
+        self,
+        papers: Iterable[PaperItem],
+        stage: str,
+        now: Optional[datetime] = None,
+    ) -> int:
+        """Mark papers as having reached ``stage``; returns keys written.
+
+        A key never moves back to an earlier stage and keeps its original
+        first-seen time.
+        """
+        rank = _stage_rank(stage)
+        stamp = (now or datetime.now(timezone.utc)).isoformat()
+        rows: Dict[Tuple[str, str], Tuple[str, str, str, int, str]] = {}
+        for paper in papers:
+            for kind, value in identity_keys_for_paper(paper):
+                rows[(kind, value)] = (kind, value, stamp, rank, stamp)
+        if not rows:
+            return 0
+        with self._conn:
+            self._conn.executemany(_UPSERT, rows.values())
+        return len(rows)
+
+    def record_checked(
+        self, papers: Iterable[PaperItem], stage: str, scope: str
+    ) -> int:
+        """Mark papers as run through ``stage`` under ``scope``.
+
+        Unlike :meth:`record` this does not advance the papers' stage, so
+        it also covers papers the stage rejected.
+        """
+        rank = _stage_rank(stage)
+        rows = {
+            (kind, value, rank, scope)
+            for paper in papers
+            for kind, value in identity_keys_for_paper(paper)
+        }
+        if not rows:
+            return 0
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO paper_stage_scope (kind, value, stage, scope) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def stage_counts(self) -> Dict[str, int]:
+        counts = {stage: 0 for stage in PIPELINE_STAGES}
+        for rank, count in self._conn.execute(
+            "SELECT stage, COUNT(*) FROM paper_identity GROUP BY stage"
+        ):
+            if 0 <= rank < len(PIPELINE_STAGES):
+                counts[PIPELINE_STAGES[rank]] = count
+        return counts
@@ -6,7 +6,8 @@ commonly found in RSS feeds and email alerts.
 
 import html
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import FrozenSet, Optional
 
 # Precompiled regex for HTML tag removal
 _HTML_TAG_PATTERN = re.compile(r"<.*?>")
@@ -81,3 +82,54 @@ def clean_abstract(abstract: Optional[str]) -> Optional[str]:
 
     return abstract if abstract else None
 
+
+def normalize_words(text: str) -> str:
+    """Lowercase text with hyphens, underscores and punctuation as spaces.
+
+    Args:
+        text: Raw text.
+
+    Returns:
+        Space-separated words used for keyword matching.
+    """
+    text = text.lower()
+    text = re.sub(r"[-_]", " ", text)
+    text = re.sub(r"[^\w\s]", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def word_stem(word: str) -> str:
+    """Strip common English plural and verb suffixes from a word.
+
+    Args:
+        word: A single word.
+
+    Returns:
+        Lowercase stem, e.g. ``batteries`` -> ``battery``.
+    """
+    word = word.lower()
+    if word.endswith("ies") and len(word) > 3:
+        return word[:-3] + "y"
+    elif word.endswith("es") and len(word) > 2:
+        return word[:-2]
+    elif word.endswith("s") and len(word) > 2 and not word.endswith("ss"):
+        return word[:-1]
+    elif word.endswith("ed") and len(word) > 2:
+        return word[:-2]
+    elif word.endswith("ing") and len(word) > 3:
+        return word[:-3]
+    return word
+
+
+@lru_cache(maxsize=4096)
+def title_words(title: str) -> FrozenSet[str]:
+    """Word set of a title with punctuation removed, for title similarity.
+
+    Args:
+        title: Title text.
+
+    Returns:
+        Lowercase words; ``zinc-air`` becomes ``zincair``.
+    """
+    title = re.sub(r"[^\w\s]", "", title.lower())
+    return frozenset(re.sub(r"\s+", " ", title).strip().split())
@@ -294,6 +294,79 @@ class TestKeywordGeneratorMatching:
         assert kg._matches_keyword(text, "zinc") is False
 
 
+class TestCompiledKeywordSet:
+    """Tests for keywords compiled once and matched per text analysis."""
+
+    def test_compiled_set_matches_any_keyword(self):
+        kg = KeywordGenerator(api_key="test")
+        compiled = kg.compile_keywords(["lithium", "operando xas", "protein"])
+        analysis = compiled.analyze("In-situ XAS of Li-ion cathodes")
+
+        assert analysis.norm == "in situ xas of li ion cathodes"
+        assert "cathod" in analysis.stems
+        assert "lithium" in analysis.expanded
+        assert compiled.matches(analysis) is True
+        assert compiled.matches("Protein folding") is True
+        assert kg.compile_keywords(["zinc"]).matches(analysis) is False
+
+    def test_compiled_set_agrees_with_single_keyword_matching(self):
+        kg = KeywordGenerator(api_key="test")
+        keywords = ["zinc air", "batteries", "in situ", "synchrotron", "cobalt"]
+        texts = [
+            "Zinc-air battery electrode",
+            "Operando study of Co oxides",
+            "Insitu cell design",
+            "Protein folding study",
+        ]
+        compiled = kg.compile_keywords(keywords)
+        for text in texts:
+            expected = any(kg._matches_keyword(text, kw) for kw in keywords)
+            assert compiled.matches(text) is expected
+
+    def test_analyze_paper_matches_analyze_text(self):
+        kg = KeywordGenerator(api_key="test")
+        paper = PaperItem(
+            title="In-situ XAS of Li-ion cathodes",
+            abstract="Cobalt oxides, operando.",
+            source="Test",
+            source_type="rss",
+        )
+        assert kg.analyze_paper(paper) == kg.analyze_text(
+            f"{paper.title} {paper.abstract}"
+        )
+
+
+class TestPaperTextAnalysis:
+    """Tests for the cached per-paper text analysis."""
+
+    def test_analysis_is_cached_and_not_serialized(self):
+        paper = PaperItem(
+            title="Zn-ion Batteries", abstract="  Aqueous cells. ",
+            source="Test", source_type="rss",
+        )
+        analysis = paper.text_analysis
+
+        assert paper.text_analysis is analysis
+        assert analysis.lower_text == "zn-ion batteries   aqueous cells. "
+        assert {"zn", "ion", "battery", "cell"} <= analysis.stems
+        assert analysis.abstract_text == "Aqueous cells."
+        assert "_text_analysis" not in paper.model_dump()
+        assert paper == PaperItem(**paper.model_dump())
+        assert paper != paper.model_copy(update={"abstract": "Other"})
+        assert paper.model_copy() == paper
+
+    def test_analysis_follows_title_and_abstract_changes(self):
+        paper = PaperItem(title="Zinc anodes", source="Test", source_type="rss")
+        stale = paper.text_analysis
+
+        copy = paper.model_copy(update={"abstract": "Dendrite growth"})
+        assert "dendrite" in copy.text_analysis.words
+        assert paper.text_analysis is stale
+
+        paper.title = "Lithium anodes"
+        assert "lithium" in paper.text_analysis.words
+
+
 class TestKeywordGeneratorFiltering:
     """Tests for filter_items() method."""
 
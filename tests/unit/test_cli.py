@@ -16,6 +16,7 @@ from src.client.cli import (
     _handle_filter,
     _handle_export,
     _handle_enrich,
+    _handle_merge,
     main,
 )
 from src.models.responses import PaperItem, FilterResult
@@ -188,6 +189,13 @@ class TestBuildParser:
         assert args.has_pdf is True
         assert args.semantic_filter is False
 
+    def test_filter_parser_accepts_query(self):
+        args = _build_parser().parse_args(
+            ["filter", "-i", "in.json", "-q", 'title:zinc AND NOT "review"']
+        )
+
+        assert args.query == 'title:zinc AND NOT "review"'
+
     def test_export_parser_has_expected_defaults(self):
         """Test export subcommand defaults."""
         parser = _build_parser()
@@ -531,6 +539,112 @@ class TestHandleFetch:
             call_args = mock_source.fetch_papers.call_args
             assert call_args.kwargs["since"] == date(2024, 1, 1)
 
+    @pytest.mark.asyncio
+    async def test_handle_fetch_rss_writes_timing_stats(
+        self, tmp_path, sample_papers, capsys
+    ):
+        """Test fetch handler prints slowest feeds and saves timing stats."""
+        from src.sources.rss_stats import FeedTiming, RSSFetchStats
+
+        output_file = tmp_path / "papers.json"
+        args = argparse.Namespace(
+            source="rss",
+            opml="/custom/path.opml",
+            limit=None,
+            since=None,
+            output=str(output_file),
+            slowest=1,
+        )
+        stats = RSSFetchStats(
+            feeds=[
+                FeedTiming(url="https://a", title="Fast", total_seconds=0.1),
+                FeedTiming(url="https://b", title="Slow", total_seconds=2.5),
+            ],
+            wall_seconds=2.6,
+        )
+
+        with patch("src.sources.rss.RSSSource") as mock_rss_class:
+            mock_source = AsyncMock()
+            mock_source.fetch_papers.return_value = sample_papers
+            mock_source.last_stats = stats
+            mock_rss_class.return_value = mock_source
+
+            await _handle_fetch(args)
+
+        captured = capsys.readouterr()
+        assert "Slowest 1 feeds:" in captured.out
+        assert "Slow" in captured.out
+        assert "Fast" not in captured.out.split("Slowest")[1]
+        saved = json.loads((tmp_path / "rss_fetch_stats.json").read_text())
+        assert saved["summary"]["feeds"] == 2
+        assert [f["title"] for f in saved["feeds"]] == ["Fast", "Slow"]
+
+    def test_fetch_parses_shard_spec(self):
+        """Test --shard i/N is parsed and validated."""
+        parser = _build_parser()
+        args = parser.parse_args(["fetch", "--shard", "2/4"])
+        assert args.shard == (2, 4)
+
+        for bad in ("0/4", "5/4", "2", "a/b"):
+            with pytest.raises(SystemExit):
+                parser.parse_args(["fetch", "--shard", bad])
+
+    @pytest.mark.asyncio
+    async def test_handle_merge_deduplicates_shards(
+        self, tmp_path, sample_papers, capsys
+    ):
+        """Test merge combines shard outputs and drops duplicates."""
+        shard1 = tmp_path / "shard1.json"
+        shard2 = tmp_path / "shard2.json"
+        _save_papers(sample_papers, str(shard1))
+        _save_papers(sample_papers[:1], str(shard2))
+        output_file = tmp_path / "merged.json"
+        args = argparse.Namespace(
+            inputs=[str(shard1), str(shard2)], output=str(output_file)
+        )
+
+        await _handle_merge(args)
+
+        merged = _load_papers(str(output_file))
+        assert [p.title for p in merged] == [p.title for p in sample_papers]
+        assert "1 duplicates dropped" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_handle_fetch_only_records_first_seen_in_identity_index(
+        self, tmp_path, sample_papers, capsys
+    ):
+        """Test fetch notes papers in the index without dropping any."""
+        from src.utils.identity_index import PaperIdentityIndex
+
+        index_path = tmp_path / "identity.sqlite"
+        output_file = tmp_path / "papers.json"
+        args = argparse.Namespace(
+            source="gmail",
+            query=None,
+            limit=None,
+            since=None,
+            output=str(output_file),
+            identity_index=str(index_path),
+        )
+
+        with patch("src.sources.gmail.GmailSource") as mock_gmail_class:
+            mock_source = AsyncMock()
+            mock_source.fetch_papers.return_value = sample_papers[:1]
+            mock_gmail_class.return_value = mock_source
+            await _handle_fetch(args)
+
+            mock_source.fetch_papers.return_value = sample_papers
+            await _handle_fetch(args)
+
+        saved = _load_papers(str(output_file))
+        assert [p.title for p in saved] == [p.title for p in sample_papers]
+        assert "Skipped" not in capsys.readouterr().out
+        with PaperIdentityIndex(index_path) as index:
+            assert index.stage_of(sample_papers[0]) == "fetched"
+            first, second = (index.first_seen(p) for p in sample_papers)
+        assert first is not None and second is not None
+        assert first < second
+
     @pytest.mark.asyncio
     async def test_handle_fetch_invalid_source_exits(self, tmp_path):
         """Test fetch with invalid source causes exit."""
@@ -554,6 +668,44 @@ class TestHandleFetch:
 class TestHandleFilter:
     """Tests for _handle_filter handler."""
 
+    @pytest.mark.asyncio
+    async def test_handle_filter_identity_index_is_scoped_to_criteria(
+        self, sample_papers_json, sample_papers, tmp_path, capsys
+    ):
+        """Test reruns skip checked papers only under the same criteria."""
+        from src.utils.identity_index import PaperIdentityIndex
+
+        index_path = tmp_path / "identity.sqlite"
+        output_file = tmp_path / "filtered.json"
+
+        def _args(keywords):
+            return argparse.Namespace(
+                input=str(sample_papers_json),
+                output=str(output_file),
+                keywords=keywords,
+                exclude=None,
+                authors=None,
+                min_date=None,
+                has_pdf=False,
+                semantic_filter=False,
+                identity_index=str(index_path),
+            )
+
+        await _handle_filter(_args(["machine"]))
+        assert [p.title for p in _load_papers(str(output_file))] == ["Test Paper 1"]
+        with PaperIdentityIndex(index_path) as index:
+            assert index.stage_of(sample_papers[0]) == "filtered"
+            assert index.stage_of(sample_papers[1]) is None
+        capsys.readouterr()
+
+        await _handle_filter(_args(["machine"]))
+        assert "Skipped 2 papers already filtered" in capsys.readouterr().out
+        assert _load_papers(str(output_file)) == []
+
+        await _handle_filter(_args(["another"]))
+        assert "Skipped" not in capsys.readouterr().out
+        assert [p.title for p in _load_papers(str(output_file))] == ["Test Paper 2"]
+
     @pytest.mark.asyncio
     async def test_handle_filter_autogenerates_keywords(
         self, sample_papers_json, tmp_path
@@ -629,6 +781,47 @@ class TestHandleFilter:
         captured = capsys.readouterr()
         assert "Filtered:" in captured.out
 
+    @pytest.mark.asyncio
+    async def test_handle_filter_applies_boolean_query(
+        self, sample_papers_json, tmp_path
+    ):
+        output_file = tmp_path / "filtered.json"
+        args = argparse.Namespace(
+            input=str(sample_papers_json),
+            output=str(output_file),
+            keywords=None,
+            exclude=None,
+            authors=None,
+            min_date=None,
+            has_pdf=False,
+            semantic_filter=False,
+            query="abstract:(machine learn*) OR journal:nature NOT author:three",
+        )
+
+        await _handle_filter(args)
+
+        assert [p.title for p in _load_papers(str(output_file))] == ["Test Paper 1"]
+
+    @pytest.mark.asyncio
+    async def test_handle_filter_rejects_invalid_query(
+        self, sample_papers_json, tmp_path, capsys
+    ):
+        args = argparse.Namespace(
+            input=str(sample_papers_json),
+            output=str(tmp_path / "filtered.json"),
+            keywords=None,
+            exclude=None,
+            authors=None,
+            min_date=None,
+            has_pdf=False,
+            semantic_filter=False,
+            query="(zinc OR",
+        )
+
+        with pytest.raises(SystemExit):
+            await _handle_filter(args)
+        assert "invalid --query" in capsys.readouterr().err
+
     @pytest.mark.asyncio
     async def test_handle_filter_without_keywords_does_not_autogenerate_when_other_filters_present(
         self, sample_papers_json, tmp_path
@@ -1035,6 +1228,43 @@ class TestHandleEnrich:
         captured = capsys.readouterr()
         assert "Enriched" in captured.out
 
+    @pytest.mark.asyncio
+    async def test_handle_enrich_records_only_enriched_papers(
+        self, sample_papers_json, sample_papers, tmp_path, capsys
+    ):
+        """Test papers without new metadata are retried on the next run."""
+        index_path = tmp_path / "identity.sqlite"
+        args = argparse.Namespace(
+            input=str(sample_papers_json),
+            output=str(tmp_path / "enriched.json"),
+            source="crossref",
+            concurrency=5,
+            identity_index=str(index_path),
+        )
+
+        async def enrich_first(paper):
+            if paper.title != sample_papers[0].title:
+                return paper
+            enriched = paper.model_copy(deep=True)
+            enriched.extra["enriched"] = True
+            return enriched
+
+        with patch("src.sources.crossref.CrossrefClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.enrich_paper.side_effect = enrich_first
+            mock_client_class.return_value = mock_client
+
+            await _handle_enrich(args)
+            assert (
+                f"Enriched 1/{len(sample_papers)} papers" in capsys.readouterr().out
+            )
+
+            await _handle_enrich(args)
+
+        out = capsys.readouterr().out
+        assert "Skipped 1 papers already enriched" in out
+        assert f"Enriched 0/{len(sample_papers) - 1} papers" in out
+
     @pytest.mark.asyncio
     async def test_handle_enrich_openalex_source(
         self, sample_papers_json, sample_papers, tmp_path
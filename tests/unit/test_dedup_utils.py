@@ -4,7 +4,9 @@ from datetime import date
 
 from src.models.responses import PaperItem
 from src.utils.dedup import (
+    PaperDeduplicator,
     deduplicate_papers,
+    identity_keys_for_paper,
     normalize_doi,
     normalize_title,
     normalize_url,
@@ -131,3 +133,168 @@ def test_zotero_data_identity_keys_from_wrapped_payload():
     assert ("doi", "10.3000/kkk") in keys
     assert ("title_date", "sample paper|2024-05-01") in keys
     assert ("url", "https://example.org/sample") in keys
+
+
+def test_paper_deduplicator_matches_batch_dedup():
+    papers = [
+        _paper("A", doi="10.1000/a"),
+        _paper("A copy", doi="https://doi.org/10.1000/A"),
+        _paper("B", url="https://example.com/b?utm_source=x"),
+        _paper("B again", url="https://example.com/b"),
+        _paper("C"),
+    ]
+
+    deduplicator = PaperDeduplicator()
+    streamed = [p for p in papers if deduplicator.add(p)]
+    batch, batch_stats = deduplicate_papers(papers)
+
+    assert [p.title for p in streamed] == [p.title for p in batch]
+    assert deduplicator.stats() == batch_stats
+    assert batch_stats["duplicates_by_key"]["doi"] == 1
+    assert batch_stats["duplicates_by_key"]["url"] == 1
+
+
+def test_near_duplicate_tier_clusters_title_variants():
+    papers = [
+        _paper("Operando imaging of zinc dendrite growth in aqueous batteries"),
+        _paper("Operando Imaging of Zinc Dendrite Growth in Aqueous Batteries - ASAP"),
+        _paper("Operando imaging of zinc dendrite growth in mildly aqueous batteries"),
+        _paper("Sodium layered oxide cathodes with suppressed phase transitions"),
+        _paper(
+            "Operando imaging of zinc dendrite growth in aqueous batteries",
+            doi="10.1000/other",
+        ),
+    ]
+
+    exact, exact_stats = deduplicate_papers(papers)
+    near, near_stats = deduplicate_papers(papers, near_duplicates=True)
+
+    assert len(exact) == 4
+    assert "near_duplicate_clusters" not in exact_stats
+    assert [p.title for p in near] == [papers[0].title, papers[3].title]
+    assert near_stats["duplicates_by_key"]["near_title"] == 2
+    (cluster,) = near_stats["near_duplicate_clusters"]
+    assert cluster["kept"] == papers[0].title
+    assert [d["title"] for d in cluster["duplicates"]] == [
+        papers[2].title,
+        papers[4].title,
+    ]
+
+
+def test_near_duplicate_index_respects_differing_dois():
+    from src.utils.dedup import NearDuplicateTitleIndex
+
+    index = NearDuplicateTitleIndex(threshold=0.8)
+    title = "High entropy electrolytes for lithium metal anodes"
+    assert index.find_or_add(title, "10.1000/a") == (None, 0.0)
+    assert index.find_or_add(title, "10.1000/b") == (None, 0.0)
+    entry, similarity = index.find_or_add(title)
+    assert entry == 0
+    assert similarity == 1.0
+    assert index.find_or_add("Short title") == (None, 0.0)
+    assert len(index) == 2
+
+
+def test_merge_mode_unions_transitive_duplicates_and_fills_fields():
+    bare = _paper("Zinc anodes", url="https://example.com/zn?utm_source=rss")
+    with_doi = _paper(
+        "Zinc anodes", doi="10.1000/zn", url="https://example.com/zn"
+    ).model_copy(update={"pdf_url": None, "extra": {"feed": "b"}})
+    with_abstract = _paper(
+        "Zinc anodes (ASAP)",
+        doi="https://doi.org/10.1000/ZN",
+        authors=["A. Author", "B. Author"],
+    ).model_copy(update={"abstract": "Dendrite-free zinc.", "pdf_url": "https://x/pdf"})
+    other = _paper("Sodium cathodes", url="https://example.com/na")
+
+    first_wins, _ = deduplicate_papers([bare, other, with_doi, with_abstract])
+    merged, stats = deduplicate_papers(
+        [bare, other, with_doi, with_abstract], merge=True
+    )
+
+    assert first_wins[0] is bare
+    assert [p.title for p in merged] == ["Zinc anodes (ASAP)", "Sodium cathodes"]
+    record = merged[0]
+    assert record.doi == "https://doi.org/10.1000/ZN"
+    assert record.url == "https://example.com/zn"
+    assert record.abstract == "Dendrite-free zinc."
+    assert record.pdf_url == "https://x/pdf"
+    assert record.authors == ["A. Author", "B. Author"]
+    assert record.extra == {"feed": "b"}
+    assert stats["dropped_count"] == 2
+    assert stats["duplicates_by_key"] == {"doi": 1, "url": 1, "title": 0}
+    assert stats["merged_groups"] == 1
+    assert stats["fields_filled"] == 1
+
+
+def test_merge_mode_keeps_identical_copies_unchanged():
+    papers = [_paper("A", doi="10.1000/a"), _paper("A", doi="10.1000/a"), _paper("B")]
+
+    merged, stats = deduplicate_papers(papers, merge=True)
+
+    assert merged == [papers[0], papers[2]]
+    assert stats["fields_filled"] == 0
+    assert stats["kept_without_key"] == 0
+
+
+def test_normalizers_are_memoized():
+    from src.utils.dedup import clear_normalization_caches
+
+    clear_normalization_caches()
+    paper = _paper("Zinc anodes", url="https://Example.com/a/?utm_source=rss")
+    first = identity_keys_for_paper(paper)
+    hits = normalize_url.cache_info().hits
+    assert identity_keys_for_paper(paper) == first
+    assert normalize_url.cache_info().hits == hits + 1
+    assert normalize_doi(None) is None
+
+
+def test_identity_key_set_is_exact_behind_bloom_filter():
+    from src.utils.bloom import IdentityKeySet
+
+    keys = [("doi", f"10.1000/{i}") for i in range(5000)]
+    key_set = IdentityKeySet(keys, false_positive_rate=0.05, capacity=100)
+
+    assert len(key_set) == len(keys)
+    assert all(key in key_set for key in keys)
+    misses = [("doi", f"10.2000/{i}") for i in range(5000)]
+    assert not any(key in key_set for key in misses)
+    assert 0 < key_set.false_positives < 0.08 * len(misses)
+    assert "doi" not in key_set
+
+    key_set.update(keys[:10])
+    assert len(key_set) == len(keys)
+    assert key_set.exact_bytes <= 8 * len(keys)
+
+
+def test_identity_key_set_rejects_forced_bloom_false_positive():
+    from src.utils.bloom import IdentityKeySet
+
+    key_set = IdentityKeySet([("doi", "10.1000/a")], false_positive_rate=0.5, capacity=1)
+    collision = next(
+        key
+        for key in (("doi", f"10.2000/{i}") for i in range(10_000))
+        if key_set._probably_contains(key_set._key_digest(key))
+    )
+
+    assert collision not in key_set
+    assert key_set.false_positives == 1
+    key_set.add(collision)
+    assert collision in key_set
+    assert len(key_set) == 2
+
+
+def test_paper_deduplicator_with_bloom_matches_exact_set():
+    papers = [
+        _paper("A", doi="10.1000/a"),
+        _paper("A copy", doi="https://doi.org/10.1000/A"),
+        _paper("B", url="https://example.com/b?utm_source=x"),
+        _paper("B again", url="https://example.com/b"),
+        _paper("C"),
+    ]
+
+    exact = PaperDeduplicator()
+    bloom = PaperDeduplicator(false_positive_rate=0.5)
+
+    assert [exact.add(p) for p in papers] == [bloom.add(p) for p in papers]
+    assert exact.stats() == bloom.stats()
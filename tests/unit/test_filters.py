@@ -231,3 +231,143 @@ async def test_keyword_or_logic(sample_papers):
     assert result.rejected_count == 0
 
 
+
+
+@pytest.mark.asyncio
+async def test_many_keywords_use_single_pass_automaton(sample_papers):
+    """Large keyword sets go through the automaton with the same results."""
+    from src.filters.keyword import KeywordMatcher
+
+    padding = [f"unused keyword {i}" for i in range(150)]
+    criteria = FilterCriteria(
+        keywords=padding + ["LEARNING", "quantum"],
+        exclude_keywords=padding + ["Vision"],
+    )
+    matcher = KeywordMatcher(criteria.keywords, criteria.exclude_keywords)
+    assert matcher._automaton is not None
+
+    result = await FilterPipeline().filter(sample_papers, criteria)
+
+    assert [p.title for p in result.papers] == [
+        "Machine Learning for Natural Language Processing",
+        "Quantum Computing Applications",
+        "Traditional Machine Learning Survey",
+    ]
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    """Automaton reports every pattern, including overlaps and suffixes."""
+    from src.utils.aho_corasick import AhoCorasick
+
+    automaton = AhoCorasick(["he", "she", "his", "hers", "zinc ion", ""])
+
+    assert automaton.matches("ushers") == {0, 1, 3, 5}
+    assert automaton.matches("aqueous zinc ion battery") == {4, 5}
+    assert automaton.matches("") == {5}
+
+
+@pytest.mark.asyncio
+async def test_inverted_index_agrees_with_scanning(sample_papers):
+    """Index-backed filtering returns the same papers and messages."""
+    from src.filters import KeywordFilterStage, PaperIndex
+
+    index = PaperIndex(sample_papers)
+    stage = KeywordFilterStage()
+    for criteria in [
+        FilterCriteria(keywords=["machine learning", "quantum"]),
+        FilterCriteria(keywords=["LEARN"], exclude_keywords=["vision"]),
+        FilterCriteria(keywords=["n-grams", "nlp."], authors=["smith"]),
+        FilterCriteria(exclude_keywords=["survey"], has_pdf=True),
+        FilterCriteria(authors=["lee", "WILSON"], min_date=date(2024, 1, 1)),
+        FilterCriteria(keywords=["", "zzz"]),
+    ]:
+        expected = await stage.filter(sample_papers, criteria)
+        assert await stage.filter(sample_papers, criteria, index=index) == expected
+
+
+def test_inverted_index_matches_substrings_within_tokens(sample_papers):
+    from src.filters import PaperIndex
+
+    index = PaperIndex(sample_papers)
+
+    assert index.match_keyword("Learn") == {0, 1, 3}
+    assert index.match_keyword("ing for") == {0, 1}
+    assert index.match_keyword("learning in") == {1}
+    assert index.match_any_author(["ALICE", "lee"]) == {0, 1, 2}
+    assert index.match_keyword("learn") is index.match_keyword("LEARN")
+
+
+@pytest.mark.asyncio
+async def test_filter_service_reuses_corpus_index(sample_papers):
+    import json
+
+    from src.services.filter import FilterService
+
+    service = FilterService()
+    papers_json = json.dumps([p.model_dump(mode="json") for p in sample_papers])
+
+    first = await service.filter_keywords(papers_json, keywords=["quantum"])
+    second = await service.filter_keywords(
+        papers_json, keywords=["learning"], exclude=["deep"]
+    )
+
+    assert service.corpus_index(papers_json) is service.corpus_index(papers_json)
+    assert len(service._corpora) == 1
+    assert [p.title for p in first.papers] == ["Quantum Computing Applications"]
+    assert second.passed_count == 2
+
+
+def test_parse_query_precedence_fields_and_errors():
+    from src.filters.query import And, Not, Or, QuerySyntaxError, Term, parse_query
+
+    assert parse_query('a OR title:(b "c d") -author:e*') == Or(
+        (
+            Term("text", "a"),
+            And(
+                (
+                    Term("title", "b"),
+                    Term("title", "c d"),
+                    Not(Term("author", "e*", wildcard=True)),
+                )
+            ),
+        )
+    )
+    assert parse_query("Zn-ion and NOT x") == And(
+        (Term("text", "zn-ion"), Term("text", "and"), Not(Term("text", "x")))
+    )
+    for bad in ["", "a OR", "(a", '"a', "a )", "*"]:
+        with pytest.raises(QuerySyntaxError):
+            parse_query(bad)
+
+
+@pytest.mark.asyncio
+async def test_query_matches_and_index_select_agree(sample_papers):
+    """Per-paper evaluation and posting-set evaluation give the same ids."""
+    from src.filters import PaperIndex
+    from src.filters.query import PaperQuery
+
+    index = PaperIndex(sample_papers)
+    cases = {
+        "learning": {0, 1, 3},
+        "machine AND NOT survey": {0},
+        'title:"deep learning" OR journal:nature': {1, 2},
+        "author:smith -title:vision": {0},
+        "learn* OR quant?m": {0, 1, 2, 3},
+        "earn*": set(),
+        "learn*ng NOT (natural OR deep)": {3},
+        "abstract:crypto* author:(lee OR wilson)": {2},
+        "NOT journal:arxiv": {2, 3},
+    }
+    for source, expected in cases.items():
+        query = PaperQuery(source)
+        scanned = {i for i, p in enumerate(sample_papers) if query.matches(p)}
+        assert scanned == expected, source
+        assert query.select(index) == expected, source
+
+    result = await FilterPipeline().filter(
+        sample_papers, FilterCriteria(query="machine OR quantum", has_pdf=True)
+    )
+    assert [p.title for p in result.papers] == [
+        "Machine Learning for Natural Language Processing",
+        "Traditional Machine Learning Survey",
+    ]
@@ -0,0 +1,62 @@
+"""Unit tests for the cross-run paper identity index."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.models.responses import PaperItem
+from src.utils.identity_index import PaperIdentityIndex
+
+
+def _paper(title: str, url: str | None = None) -> PaperItem:
+    return PaperItem(title=title, url=url, source="Test", source_type="rss")
+
+
+def test_identity_index_tracks_stage_across_sources(tmp_path):
+    path = tmp_path / "identity.sqlite"
+    rss_copy = _paper("Zinc anodes", url="https://example.com/a?utm_source=rss")
+    with PaperIdentityIndex(path) as index:
+        index.record(
+            [rss_copy], "filtered", now=datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+        index.record(
+            [rss_copy], "fetched", now=datetime(2024, 1, 2, tzinfo=timezone.utc)
+        )
+
+    gmail_copy = _paper("Zinc Anodes - ASAP", url="https://example.com/a")
+    other = _paper("Sodium cathodes")
+    with PaperIdentityIndex(path) as index:
+        assert index.stage_of(gmail_copy) == "filtered"
+        assert index.first_seen(gmail_copy) == datetime(
+            2024, 1, 1, tzinfo=timezone.utc
+        )
+        assert index.stage_of(other) is None
+        pending, done = index.partition([gmail_copy, other], "filtered")
+        assert pending == [other]
+        assert done == [gmail_copy]
+        assert index.partition([gmail_copy], "enriched") == ([gmail_copy], [])
+        assert index.stage_counts()["filtered"] == 2
+
+
+def test_identity_index_rejects_unknown_stage(tmp_path):
+    with PaperIdentityIndex(tmp_path / "identity.sqlite") as index:
+        with pytest.raises(ValueError):
+            index.record([_paper("A")], "published")
+
+
+def test_identity_index_checked_scope_does_not_advance_stage(tmp_path):
+    paper = _paper("Zinc anodes", url="https://example.com/a")
+    other = _paper("Sodium cathodes")
+    with PaperIdentityIndex(tmp_path / "identity.sqlite") as index:
+        index.record_checked([paper], "filtered", "criteria-a")
+
+        assert index.stage_of(paper) is None
+        assert index.partition([paper, other], "filtered", scope="criteria-a") == (
+            [other],
+            [paper],
+        )
+        assert index.partition([paper], "filtered", scope="criteria-b") == (
+            [paper],
+            [],
+        )
+        assert index.partition([paper], "filtered") == ([paper], [])
@@ -613,3 +613,1190 @@ class TestRSSParserBackwardCompat:
         assert paper.abstract == "Compat abstract"
         assert paper.source == "TestSource"
         assert paper.source_type == "rss"
+
+
+# ---------------------------------------------------------------------------
+# Conditional GET cache (ETag / Last-Modified / body hash)
+# ---------------------------------------------------------------------------
+
+
+def _mock_client_for(get_side_effect):
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=get_side_effect)
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=False)
+    return mock_client
+
+
+def _feed_response(status_code=200, body=SAMPLE_RSS_XML, headers=None):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.content = body.encode("utf-8")
+    resp.headers = headers or {}
+    resp.raise_for_status = MagicMock()
+    return resp
+
+
+class TestRSSConditionalCache:
+    """Tests for the persistent per-feed validator store."""
+
+    @pytest.mark.asyncio
+    async def test_304_replays_cached_entries_without_parsing(self, tmp_path):
+        opml_path = _make_opml_source(tmp_path, feed_count=1).opml_path
+        cache_dir = tmp_path / "cache"
+        source = RSSSource(opml_path, cache_dir=str(cache_dir))
+
+        validators = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        client = _mock_client_for(lambda *a, **kw: _feed_response(headers=validators))
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            papers = await source.fetch_papers()
+        assert len(papers) == 2
+        assert (cache_dir / "feed_validators.json").exists()
+
+        reloaded = RSSSource(opml_path, cache_dir=str(cache_dir))
+        client = _mock_client_for(lambda *a, **kw: _feed_response(status_code=304))
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client), patch(
+            "src.sources.rss.feedparser.parse"
+        ) as mock_parse:
+            papers = await reloaded.fetch_papers()
+
+        mock_parse.assert_not_called()
+        assert {p.title for p in papers} == {"Paper Alpha", "Paper Beta"}
+        sent_headers = client.get.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"v1"'
+        assert sent_headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_body_hash_skips_parsing(self, tmp_path):
+        opml_path = _make_opml_source(tmp_path, feed_count=1).opml_path
+        cached_source = RSSSource(opml_path, cache_dir=str(tmp_path / "c"))
+
+        client = _mock_client_for(lambda *a, **kw: _feed_response())
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            await cached_source.fetch_papers()
+
+        again = RSSSource(opml_path, cache_dir=str(tmp_path / "c"))
+        client = _mock_client_for(lambda *a, **kw: _feed_response())
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client), patch(
+            "src.sources.rss.feedparser.parse"
+        ) as mock_parse:
+            papers = await again.fetch_papers()
+
+        mock_parse.assert_not_called()
+        assert len(papers) == 2
+        assert "If-None-Match" not in client.get.call_args.kwargs["headers"]
+
+    def test_versioned_store_ignores_corrupt_and_stale_files(self, tmp_path):
+        from src.sources.rss_store import atomic_write_json, load_versioned_json
+
+        path = tmp_path / "store" / "feeds.json"
+        assert load_versioned_json(path, 1, "store") is None
+        assert atomic_write_json(path, {"version": 1, "feeds": {}}, "store")
+        assert load_versioned_json(path, 1, "store") == {"version": 1, "feeds": {}}
+        assert load_versioned_json(path, 2, "store") is None
+        assert not path.with_suffix(".tmp").exists()
+
+        path.write_text("{not json", encoding="utf-8")
+        assert load_versioned_json(path, 1, "store") is None
+
+
+# ---------------------------------------------------------------------------
+# Streaming iter_papers
+# ---------------------------------------------------------------------------
+
+
+class TestRSSIterPapers:
+    """Tests for the async-generator fetch mode."""
+
+    @pytest.mark.asyncio
+    async def test_iter_papers_yields_deduplicated(self, tmp_path):
+        source = _make_opml_source(tmp_path, feed_count=3)
+        client = _mock_client_for(lambda *a, **kw: _feed_response())
+
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            papers = [p async for p in source.iter_papers()]
+
+        assert sorted(p.title for p in papers) == ["Paper Alpha", "Paper Beta"]
+
+    @pytest.mark.asyncio
+    async def test_iter_papers_does_not_wait_for_slow_feed(self, tmp_path):
+        import asyncio
+
+        source = _make_opml_source(tmp_path, feed_count=2)
+        release_slow = asyncio.Event()
+        fast_xml = SAMPLE_RSS_XML.replace("aper-", "aper-fast-").replace(
+            "Paper ", "Fast Paper "
+        )
+
+        async def _get(url, **kwargs):
+            if url.endswith("feed0"):
+                await release_slow.wait()
+                return _feed_response()
+            return _feed_response(body=fast_xml)
+
+        client = _mock_client_for(_get)
+        received = []
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            async for paper in source.iter_papers():
+                received.append(paper.url)
+                if len(received) == 2:
+                    assert all("fast" in url for url in received)
+                    release_slow.set()
+
+        assert len(received) == 4
+
+
+# ---------------------------------------------------------------------------
+# Limit-aware early termination
+# ---------------------------------------------------------------------------
+
+
+class TestRSSFetchLimit:
+    """Tests for cancelling outstanding feeds once the limit is reached."""
+
+    @pytest.mark.asyncio
+    async def test_limit_cancels_outstanding_feeds(self, tmp_path):
+        import asyncio
+
+        source = _make_opml_source(tmp_path, feed_count=2)
+        never = asyncio.Event()
+        cancelled = []
+
+        async def _get(url, **kwargs):
+            if url.endswith("feed1"):
+                try:
+                    await never.wait()
+                except asyncio.CancelledError:
+                    cancelled.append(url)
+                    raise
+            return _feed_response()
+
+        client = _mock_client_for(_get)
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            papers = await asyncio.wait_for(source.fetch_papers(limit=2), timeout=5)
+
+        assert len(papers) == 2
+        assert cancelled == ["https://example.com/feed1"]
+
+    @pytest.mark.asyncio
+    async def test_limit_merges_duplicates_like_full_fetch(self, tmp_path):
+        import asyncio
+
+        sparse = SAMPLE_RSS_XML.replace(
+            "<description>Abstract for paper alpha.</description>", ""
+        ).replace(
+            "<item>\n      <title>Paper Beta</title>\n"
+            "      <link>https://example.com/paper-beta</link>\n"
+            "      <description>Abstract for paper beta.</description>\n"
+            "    </item>",
+            "",
+        )
+
+        async def _get(url, **kwargs):
+            if url.endswith("feed1"):
+                await asyncio.sleep(0.05)
+                return _feed_response()
+            return _feed_response(body=sparse)
+
+        results = []
+        for limit in (2, None):
+            source = _make_opml_source(tmp_path, feed_count=2)
+            with patch(
+                "src.sources.rss.httpx.AsyncClient",
+                return_value=_mock_client_for(_get),
+            ):
+                results.append(await source.fetch_papers(limit=limit))
+        limited, full = results
+
+        assert [p.title for p in limited] == ["Paper Alpha", "Paper Beta"]
+        assert limited[0].abstract == "Abstract for paper alpha."
+        assert [p.model_dump() for p in limited] == [p.model_dump() for p in full]
+
+    def test_feed_order_prefers_historical_yield(self, tmp_path):
+        opml_path = _make_opml_source(tmp_path, feed_count=3).opml_path
+        source = RSSSource(opml_path, cache_dir=str(tmp_path / "cache"))
+        paper = RSSParser().parse(
+            {"title": "Cached", "link": "https://example.com/c"}, "Feed 2"
+        )
+        assert source._cache is not None
+        source._cache.store("https://example.com/feed2", "hash", [paper, paper])
+        source._cache.store("https://example.com/feed1", "hash", [paper])
+
+        assert source._feed_order() == [2, 1, 0]
+
+
+# ---------------------------------------------------------------------------
+# Process-pool parse backend
+# ---------------------------------------------------------------------------
+
+
+class TestRSSProcessPoolParsing:
+    """Tests for parsing feed bodies in worker processes."""
+
+    def test_parse_feed_records_are_compact(self):
+        from src.sources.rss import _parse_feed_records
+
+        records, bozo, stats = _parse_feed_records(SAMPLE_RSS_XML, "Test Feed")
+
+        assert bozo is None
+        assert [r["title"] for r in records] == ["Paper Alpha", "Paper Beta"]
+        assert "pdf_url" not in records[0]
+        assert records[0]["source_type"] == "rss"
+        assert stats["entries_total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_with_process_pool(self, tmp_path):
+        opml_path = _make_opml_source(tmp_path, feed_count=2).opml_path
+        source = RSSSource(opml_path, parse_workers=2)
+        client = _mock_client_for(lambda *a, **kw: _feed_response())
+
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            papers = await source.fetch_papers()
+
+        assert {p.title for p in papers} == {"Paper Alpha", "Paper Beta"}
+        assert all(p.extra["feed"]["title"] == "Test Feed" for p in papers)
+
+
+# ---------------------------------------------------------------------------
+# Fast-path XML parser
+# ---------------------------------------------------------------------------
+
+PUBLISHER_RSS20 = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:prism="http://prismstandard.org/namespaces/basic/2.0/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel>
+<title>ACS Energy Letters</title>
+<description>Latest articles</description>
+<language>en</language>
+<item>
+<title>  Operando XAS of &lt;i&gt;Zn&lt;/i&gt; anodes  </title>
+<link>http://dx.doi.org/10.1021/acsenergylett.4c00001</link>
+<guid isPermaLink="false">10.1021/acsenergylett.4c00001</guid>
+<description><![CDATA[<p>Abstract &amp; more</p>]]></description>
+<pubDate>Mon, 01 Jan 2024 23:30:00 -0500</pubDate>
+<dc:creator>Alice Smith, Bob Jones</dc:creator>
+<dc:identifier>doi:10.1021/acsenergylett.4c00001</dc:identifier>
+<prism:doi>10.1021/acsenergylett.4c00001</prism:doi>
+<enclosure url="https://pubs.acs.org/pdf/x.pdf" type="application/pdf" length="1"/>
+<source url="https://orig.example/rss">Original</source>
+<dc:publisher>American Chemical Society</dc:publisher>
+</item>
+<item>
+<title>Guid only</title>
+<guid>https://example.com/guid-only</guid>
+<content:encoded><![CDATA[<b>full</b>]]></content:encoded>
+<author>editor@example.com (Ed Itor)</author>
+</item>
+</channel>
+</rss>"""
+
+PUBLISHER_ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="en">
+<title>Nature Chemistry</title>
+<subtitle>Latest</subtitle>
+<entry>
+<title type="html">Cathode &lt;sub&gt;2&lt;/sub&gt; study</title>
+<id>tag:nature.com,2024:s41557-024-0001</id>
+<link rel="alternate" type="text/html" href="https://www.nature.com/articles/a1"/>
+<link rel="related" type="application/pdf" href="https://www.nature.com/a1.pdf"/>
+<published>2024-02-03T01:00:00+08:00</published>
+<updated>2024-02-04T00:00:00Z</updated>
+<author><name>Carol White</name></author>
+<contributor><name>Eve Green</name></contributor>
+<summary type="html">&lt;p&gt;Sum&lt;/p&gt;</summary>
+<content type="html">&lt;p&gt;Full content&lt;/p&gt;</content>
+<rights>CC BY</rights>
+</entry>
+</feed>"""
+
+PUBLISHER_RDF = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/"
+         xmlns:prism="http://prismstandard.org/namespaces/basic/2.0/"
+         xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel rdf:about="https://onlinelibrary.wiley.com/feed/1">
+<title>Advanced Energy Materials</title>
+<description>Wiley: Table of Contents</description>
+<dc:language>en-US</dc:language>
+</channel>
+<item rdf:about="https://onlinelibrary.wiley.com/doi/10.1002/aenm.1?af=R">
+<title>Sodium Ion Batteries</title>
+<link>https://onlinelibrary.wiley.com/doi/10.1002/aenm.1?af=R</link>
+<content:encoded>&lt;p&gt;Abstract&lt;/p&gt;</content:encoded>
+<dc:description>Dc desc</dc:description>
+<dc:creator>
+Frank Blue,
+Gina Red
+</dc:creator>
+<dc:date>2024-03-05T20:00:00-08:00</dc:date>
+<dc:identifier>10.1002/aenm.1</dc:identifier>
+<prism:doi>10.1002/aenm.1</prism:doi>
+</item>
+</rdf:RDF>"""
+
+
+PUBLISHER_ATOM_XML_BASE = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xml:base="https://pubs.example.org/">
+<title>Relative links</title>
+<entry>
+<title>Relative href</title>
+<id>tag:pubs.example.org,2024:abc</id>
+<link rel="alternate" href="/doi/10.1/abc"/>
+<updated>2024-02-04T00:00:00Z</updated>
+</entry>
+</feed>"""
+
+
+class TestFastFeedParser:
+    """The fast path must produce the same papers as feedparser."""
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            PUBLISHER_RSS20,
+            PUBLISHER_ATOM,
+            PUBLISHER_RDF,
+            SAMPLE_RSS_XML,
+            PUBLISHER_ATOM_XML_BASE,
+        ],
+    )
+    def test_matches_feedparser_output(self, body):
+        from src.sources.rss import parse_feed_body
+
+        fast, fast_bozo = parse_feed_body(body, "Feed", fast=True)
+        slow, slow_bozo = parse_feed_body(body, "Feed", fast=False)
+
+        assert fast_bozo is None and slow_bozo is None
+        assert [p.model_dump() for p in fast] == [p.model_dump() for p in slow]
+
+    def test_extracts_publisher_fields(self):
+        from src.sources.rss_fast_parser import fast_parse_feed
+
+        parsed = fast_parse_feed(PUBLISHER_RSS20)
+        assert parsed is not None
+        meta, entries = parsed
+        paper = RSSParser().parse(entries[0], "ACS", feed_meta=meta)
+
+        assert meta["version"] == "rss20"
+        assert paper.doi == "10.1021/acsenergylett.4c00001"
+        assert paper.pdf_url == "https://pubs.acs.org/pdf/x.pdf"
+        assert str(paper.published_date) == "2024-01-02"
+        assert entries[1]["link"] == "https://example.com/guid-only"
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b'<?xml version="1.0"?><rss version="0.91"><channel></channel></rss>',
+            b"<rss version='2.0'><channel><item><title>&nbsp;</title></item>",
+            b"<html><body>Not a feed</body></html>",
+            PUBLISHER_ATOM_XML_BASE,
+            b"<rss version='2.0'><channel><item><link>/a/b</link></item>"
+            b"</channel></rss>",
+            b'<?xml version="1.0" encoding="bogus-enc"?>'
+            b"<rss version='2.0'><channel></channel></rss>",
+        ],
+    )
+    def test_declines_unsupported_input(self, body):
+        from src.sources.rss_fast_parser import fast_parse_feed
+
+        assert fast_parse_feed(body) is None
+
+    def test_falls_back_to_feedparser(self):
+        from src.sources.rss import parse_feed_body
+
+        body = SAMPLE_RSS_XML.replace('version="2.0"', 'version="0.92"')
+        with patch(
+            "src.sources.rss.feedparser.parse", wraps=__import__("feedparser").parse
+        ) as mock_parse:
+            papers, _ = parse_feed_body(body, "Feed")
+
+        mock_parse.assert_called_once()
+        assert len(papers) == 2
+
+    def test_unknown_encoding_falls_back_to_feedparser(self):
+        from src.sources.rss import parse_feed_body
+
+        body = SAMPLE_RSS_XML.encode("utf-8")
+        body = b'<?xml version="1.0" encoding="bogus-enc"?>' + body.split(b"?>", 1)[1]
+        fast, _ = parse_feed_body(body, "Feed", fast=True)
+        slow, _ = parse_feed_body(body, "Feed", fast=False)
+
+        assert len(fast) == 2
+        assert [p.model_dump() for p in fast] == [p.model_dump() for p in slow]
+
+    def test_xml_base_resolves_relative_links(self):
+        from src.sources.rss import parse_feed_body
+
+        papers, _ = parse_feed_body(PUBLISHER_ATOM_XML_BASE, "Feed")
+
+        assert papers[0].url == "https://pubs.example.org/doi/10.1/abc"
+
+
+class TestRSSFeedHealth:
+    """Tests for per-feed health tracking and the failure circuit breaker."""
+
+    @staticmethod
+    def _failing_get(bad_url):
+        import httpx
+
+        def _get(url, *args, **kwargs):
+            if url == bad_url:
+                raise httpx.ConnectError("connection refused")
+            return _feed_response()
+
+        return _get
+
+    @pytest.mark.asyncio
+    async def test_repeated_failures_open_circuit(self, tmp_path):
+        opml_path = _make_opml_source(tmp_path, feed_count=2).opml_path
+        cache_dir = tmp_path / "cache"
+        bad_url = "https://example.com/feed0"
+
+        for _ in range(3):
+            source = RSSSource(opml_path, cache_dir=str(cache_dir))
+            client = _mock_client_for(self._failing_get(bad_url))
+            with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+                await source.fetch_papers()
+            assert source.last_report.failed == [bad_url]
+            assert source.last_report.skipped == []
+
+        source = RSSSource(opml_path, cache_dir=str(cache_dir))
+        client = _mock_client_for(self._failing_get(bad_url))
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            papers = await source.fetch_papers()
+
+        assert len(papers) == 2
+        fetched_urls = [call.args[0] for call in client.get.call_args_list]
+        assert fetched_urls == ["https://example.com/feed1"]
+        report = source.last_report
+        assert report.feeds_total == 2
+        assert [s.url for s in report.skipped] == [bad_url]
+        assert report.skipped[0].consecutive_failures == 3
+        assert (cache_dir / "feed_health.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_probe_after_backoff_closes_circuit(self, tmp_path):
+        from datetime import datetime, timedelta, timezone
+
+        opml_path = _make_opml_source(tmp_path, feed_count=1).opml_path
+        url = "https://example.com/feed0"
+        source = RSSSource(opml_path)
+        earlier = datetime.now(timezone.utc) - timedelta(days=30)
+        for _ in range(3):
+            source._health.record_failure(url, 503, 0.1, "HTTP 503", now=earlier)
+        assert not source._health.should_skip(url)
+
+        client = _mock_client_for(lambda *a, **kw: _feed_response())
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            papers = await source.fetch_papers()
+
+        assert len(papers) == 2
+        health = source._health.get(url)
+        assert health is not None
+        assert health.consecutive_failures == 0
+        assert health.skip_until is None
+        assert health.last_status == 200
+        assert [h["ok"] for h in health.history] == [False, False, False, True]
+
+    def test_backoff_doubles_per_failed_probe(self):
+        from datetime import datetime, timezone
+        from src.sources.rss_health import FeedHealthTracker
+
+        tracker = FeedHealthTracker(failure_threshold=2, backoff_hours=1)
+        now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        url = "https://example.com/feed"
+
+        tracker.record_failure(url, None, 1.0, "timeout", now=now)
+        health = tracker.get(url)
+        assert health is not None and health.skip_until is None
+
+        windows = []
+        for _ in range(3):
+            tracker.record_failure(url, None, 1.0, "timeout", now=now)
+            retry_after = health.retry_after()
+            assert retry_after is not None
+            windows.append((retry_after - now).total_seconds() / 3600)
+            assert tracker.should_skip(url, now=now)
+        assert windows == [1, 2, 4]
+
+    def test_zero_threshold_never_skips(self):
+        from src.sources.rss_health import FeedHealthTracker
+
+        tracker = FeedHealthTracker(failure_threshold=0)
+        for _ in range(5):
+            tracker.record_failure("u", 500, 0.1, "HTTP 500")
+        assert not tracker.should_skip("u")
+
+
+class TestRSSAdaptiveSchedule:
+    """Tests for the publication-cadence based polling schedule."""
+
+    @staticmethod
+    def _weekly_schedule(last_entry, polled_at):
+        from datetime import timedelta
+        from src.sources.rss_schedule import FeedSchedule
+
+        dates = [(last_entry - timedelta(days=7 * i)).isoformat() for i in range(4)]
+        return FeedSchedule(entry_dates=sorted(dates), last_polled=polled_at.isoformat())
+
+    def test_weekly_feed_not_due_mid_week(self):
+        from datetime import date, datetime, timezone
+
+        now = datetime(2024, 1, 10, 6, tzinfo=timezone.utc)
+        schedule = self._weekly_schedule(
+            date(2024, 1, 8), datetime(2024, 1, 9, 6, tzinfo=timezone.utc)
+        )
+        assert schedule.cadence_days() == 7
+        assert schedule.next_expected() == date(2024, 1, 15)
+        assert not schedule.is_due(now)
+        assert schedule.is_due(datetime(2024, 1, 14, 6, tzinfo=timezone.utc))
+
+    def test_short_history_is_always_due(self):
+        from datetime import date, datetime, timezone
+        from src.sources.rss_schedule import FeedScheduler
+
+        scheduler = FeedScheduler("/nonexistent")
+        now = datetime(2024, 1, 10, tzinfo=timezone.utc)
+        scheduler.record_poll("u", [date(2024, 1, 1), date(2024, 1, 8)], now=now)
+        assert scheduler.is_due("u", now=now)
+
+    def test_stale_poll_is_due(self):
+        from datetime import date, datetime, timezone
+        from src.sources.rss_schedule import FeedSchedule
+
+        schedule = FeedSchedule(
+            entry_dates=["2024-01-01", "2024-03-01", "2024-05-01", "2024-07-01"],
+            last_polled=datetime(2024, 7, 2, tzinfo=timezone.utc).isoformat(),
+        )
+        assert schedule.next_expected() == date(2024, 8, 31)
+        assert not schedule.is_due(datetime(2024, 7, 5, tzinfo=timezone.utc))
+        assert schedule.is_due(datetime(2024, 7, 9, tzinfo=timezone.utc))
+
+    @pytest.mark.asyncio
+    async def test_not_due_feed_replays_cache_unless_forced(self, tmp_path):
+        from datetime import date, datetime, timezone
+
+        opml_path = _make_opml_source(tmp_path, feed_count=2).opml_path
+        cache_dir = tmp_path / "cache"
+
+        source = RSSSource(opml_path, cache_dir=str(cache_dir))
+        client = _mock_client_for(lambda *a, **kw: _feed_response())
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            await source.fetch_papers()
+        weekly = self._weekly_schedule(
+            date.today(), datetime.now(timezone.utc)
+        )
+        assert source._scheduler is not None
+        source._scheduler._entries["https://example.com/feed0"] = weekly
+        source._scheduler._dirty = True
+        source._scheduler.save()
+
+        source = RSSSource(opml_path, cache_dir=str(cache_dir))
+        client = _mock_client_for(lambda *a, **kw: _feed_response())
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            papers = await source.fetch_papers()
+        assert len(papers) == 2
+        assert [c.args[0] for c in client.get.call_args_list] == [
+            "https://example.com/feed1"
+        ]
+        assert source.last_report.deferred == ["https://example.com/feed0"]
+
+        source = RSSSource(opml_path, cache_dir=str(cache_dir), force_all=True)
+        client = _mock_client_for(lambda *a, **kw: _feed_response())
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            await source.fetch_papers()
+        assert client.get.call_count == 2
+        assert source.last_report.deferred == []
+
+
+class TestRSSIncrementalFetch:
+    """Tests for incremental fetches backed by the seen-entry store."""
+
+    @pytest.mark.asyncio
+    async def test_second_run_emits_only_new_entries(self, tmp_path):
+        opml_path = _make_opml_source(tmp_path, feed_count=1).opml_path
+        cache_dir = tmp_path / "cache"
+
+        source = RSSSource(opml_path, cache_dir=str(cache_dir))
+        client = _mock_client_for(lambda *a, **kw: _feed_response())
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            first = await source.fetch_papers(incremental=True)
+        assert len(first) == 2
+
+        newer = SAMPLE_RSS_XML.replace(
+            "<item>",
+            "<item><title>Brand New Paper</title>"
+            "<link>https://example.com/new</link></item><item>",
+            1,
+        )
+        source = RSSSource(opml_path, cache_dir=str(cache_dir))
+        client = _mock_client_for(lambda *a, **kw: _feed_response(body=newer))
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            second = await source.fetch_papers(incremental=True)
+            non_incremental = await source.fetch_papers()
+
+        assert [p.title for p in second] == ["Brand New Paper"]
+        assert len(non_incremental) == 3
+
+    @pytest.mark.asyncio
+    async def test_limit_marks_only_emitted_entries(self, tmp_path):
+        opml_path = _make_opml_source(tmp_path, feed_count=1).opml_path
+        cache_dir = tmp_path / "cache"
+
+        source = RSSSource(opml_path, cache_dir=str(cache_dir))
+        client = _mock_client_for(lambda *a, **kw: _feed_response())
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            first = await source.fetch_papers(limit=1, incremental=True)
+            rest = await source.fetch_papers(incremental=True)
+
+        assert len(first) == 1
+        assert len(rest) == 1
+        assert rest[0].title != first[0].title
+
+    @pytest.mark.asyncio
+    async def test_requires_cache_dir(self, tmp_path):
+        source = _make_opml_source(tmp_path, feed_count=1)
+        with pytest.raises(ValueError, match="cache_dir"):
+            await source.fetch_papers(incremental=True)
+
+
+class TestRSSConnectionLimits:
+    """Tests for per-host concurrency caps and client pooling options."""
+
+    @pytest.mark.asyncio
+    async def test_per_host_cap_limits_concurrent_requests(self, tmp_path):
+        import asyncio
+
+        opml_path = _make_opml_source(tmp_path, feed_count=6).opml_path
+        source = RSSSource(opml_path, max_concurrent=10, max_per_host=2)
+        active = 0
+        peak = 0
+
+        async def _get(*args, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _feed_response()
+
+        client = _mock_client_for(_get)
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            papers = await source.fetch_papers()
+
+        assert len(papers) == 2
+        assert client.get.call_count == 6
+        assert peak == 2
+
+    def test_client_options_pool_connections(self, tmp_path):
+        opml_path = _make_opml_source(tmp_path, feed_count=1).opml_path
+        source = RSSSource(opml_path, max_concurrent=7, http2=False)
+        options = source._transport_options()
+
+        assert "http2" not in options
+        assert options["limits"].max_keepalive_connections == 7
+
+    def test_client_options_mount_environment_proxies(self, tmp_path, monkeypatch):
+        import httpx
+        from src.sources.rss_transport import BoundedFeedTransport
+
+        for name in ("HTTP_PROXY", "ALL_PROXY", "http_proxy", "all_proxy"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("HTTPS_PROXY", "proxy.internal:3128")
+        monkeypatch.setenv("NO_PROXY", "localhost,feeds.example.org")
+        opml_path = _make_opml_source(tmp_path, feed_count=1).opml_path
+        options = RSSSource(opml_path, http2=False)._client_options()
+
+        mounts = options["mounts"]
+        assert set(mounts) == {
+            "https://",
+            "all://localhost",
+            "all://*feeds.example.org",
+        }
+        assert isinstance(mounts["https://"], BoundedFeedTransport)
+        assert mounts["all://*feeds.example.org"] is None
+
+        client = httpx.AsyncClient(**options)
+        proxied = client._transport_for_url(httpx.URL("https://example.com/feed"))
+        direct = client._transport_for_url(httpx.URL("https://feeds.example.org/rss"))
+        assert proxied is mounts["https://"]
+        assert direct is options["transport"]
+
+    def test_client_options_without_proxies(self, tmp_path, monkeypatch):
+        for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.lower(), raising=False)
+        opml_path = _make_opml_source(tmp_path, feed_count=1).opml_path
+
+        assert "mounts" not in RSSSource(opml_path)._client_options()
+
+    def test_http2_requires_h2(self, tmp_path):
+        opml_path = _make_opml_source(tmp_path, feed_count=1).opml_path
+        source = RSSSource(opml_path, http2=True)
+
+        with patch("importlib.util.find_spec", return_value=None) as find_spec:
+            assert "http2" not in source._transport_options()
+        find_spec.assert_called_once_with("h2")
+
+
+class TestRSSFetchBudget:
+    """Tests for the wall-clock fetch budget."""
+
+    @pytest.mark.asyncio
+    async def test_budget_returns_partial_results(self, tmp_path):
+        import asyncio
+
+        opml_path = _make_opml_source(tmp_path, feed_count=2).opml_path
+        source = RSSSource(opml_path)
+
+        async def _get(url, *args, **kwargs):
+            if url.endswith("feed0"):
+                await asyncio.sleep(10)
+            return _feed_response()
+
+        client = _mock_client_for(_get)
+        started = time.monotonic()
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            papers = await source.fetch_papers(budget_seconds=0.2)
+
+        assert time.monotonic() - started < 5
+        assert len(papers) == 2
+        assert source.last_report.timed_out == ["https://example.com/feed0"]
+
+    @pytest.mark.asyncio
+    async def test_budget_not_reported_when_met(self, tmp_path):
+        source = _make_opml_source(tmp_path, feed_count=2)
+        client = _mock_client_for(lambda *a, **kw: _feed_response())
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            await source.fetch_papers(limit=1, budget_seconds=30)
+
+        assert source.last_report.timed_out == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_budget(self, tmp_path):
+        source = _make_opml_source(tmp_path, feed_count=1)
+        with pytest.raises(ValueError, match="budget_seconds"):
+            await source.fetch_papers(budget_seconds=0)
+
+
+class TestBoundedFeedTransport:
+    """Tests for size caps and early non-feed rejection on feed downloads."""
+
+    @staticmethod
+    def _client(handler, max_bytes=1024):
+        import httpx
+        from src.sources.rss_transport import BoundedFeedTransport
+
+        transport = BoundedFeedTransport(httpx.MockTransport(handler), max_bytes)
+        return httpx.AsyncClient(transport=transport)
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_over_cap_is_aborted(self):
+        import httpx
+        from src.sources.rss_transport import FeedBodyTooLargeError
+
+        sent = []
+
+        async def _chunks():
+            for _ in range(100):
+                sent.append(1)
+                yield b"x" * 256
+
+        def handler(request):
+            return httpx.Response(
+                200, headers={"content-type": "application/rss+xml"}, content=_chunks()
+            )
+
+        async with self._client(handler) as client:
+            with pytest.raises(FeedBodyTooLargeError):
+                await client.get("https://example.com/feed")
+        assert len(sent) == 5
+
+    @pytest.mark.asyncio
+    async def test_gzip_bomb_is_capped_on_decoded_bytes(self):
+        import gzip
+        import httpx
+        from src.sources.rss_transport import FeedBodyTooLargeError
+
+        bomb = gzip.compress(b"<rss>" + b" " * (50 * 1024 * 1024), 9)
+        assert len(bomb) < 100 * 1024
+
+        def handler(request):
+            assert request.headers["accept-encoding"] == "gzip, deflate"
+            return httpx.Response(
+                200,
+                headers={
+                    "content-type": "application/rss+xml",
+                    "content-encoding": "gzip",
+                },
+                content=bomb,
+            )
+
+        async with self._client(handler, max_bytes=1_000_000) as client:
+            with pytest.raises(FeedBodyTooLargeError):
+                await client.get("https://example.com/feed")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate", "raw-deflate"])
+    async def test_compressed_feed_is_decoded_once(self, encoding):
+        import gzip
+        import httpx
+        import zlib
+
+        body = SAMPLE_RSS_XML.encode("utf-8")
+        if encoding == "gzip":
+            encoded = gzip.compress(body)
+        elif encoding == "deflate":
+            encoded = zlib.compress(body)
+        else:
+            compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+            encoded = compressor.compress(body) + compressor.flush()
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                headers={
+                    "content-type": "text/html",
+                    "content-encoding": encoding.replace("raw-", ""),
+                },
+                content=encoded,
+            )
+
+        async with self._client(handler, max_bytes=len(body)) as client:
+            response = await client.get("https://example.com/feed")
+        assert response.content == body
+        assert "content-encoding" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_declared_length_over_cap_is_rejected(self):
+        import httpx
+        from src.sources.rss_transport import FeedBodyTooLargeError
+
+        def handler(request):
+            return httpx.Response(200, content=b"<rss/>" * 1000)
+
+        async with self._client(handler) as client:
+            with pytest.raises(FeedBodyTooLargeError):
+                await client.get("https://example.com/feed")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "content_type, body",
+        [
+            ("application/json", b"{}"),
+            ("image/png", b"\x89PNG"),
+            ("text/html; charset=utf-8", b"\n<!DOCTYPE html><html></html>"),
+        ],
+    )
+    async def test_non_feed_responses_are_rejected(self, content_type, body):
+        import httpx
+        from src.sources.rss_transport import NotAFeedError
+
+        def handler(request):
+            return httpx.Response(
+                200, headers={"content-type": content_type}, content=body
+            )
+
+        async with self._client(handler) as client:
+            with pytest.raises(NotAFeedError):
+                await client.get("https://example.com/feed")
+
+    @pytest.mark.asyncio
+    async def test_gzipped_html_is_sniffed(self):
+        import gzip
+        import httpx
+        from src.sources.rss_transport import NotAFeedError
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/html", "content-encoding": "gzip"},
+                content=gzip.compress(b"<html><body>login</body></html>"),
+            )
+
+        async with self._client(handler) as client:
+            with pytest.raises(NotAFeedError):
+                await client.get("https://example.com/feed")
+
+    @pytest.mark.asyncio
+    async def test_feed_served_as_html_and_error_pages_pass(self):
+        import httpx
+
+        def handler(request):
+            if request.url.path == "/missing":
+                return httpx.Response(
+                    404, headers={"content-type": "text/html"}, content=b"<html/>"
+                )
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/html"},
+                content=SAMPLE_RSS_XML.encode("utf-8"),
+            )
+
+        async with self._client(handler, max_bytes=0) as client:
+            feed = await client.get("https://example.com/feed")
+            missing = await client.get("https://example.com/missing")
+        assert feed.content == SAMPLE_RSS_XML.encode("utf-8")
+        assert missing.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_rss_source_records_rejected_feed_as_failure(self, tmp_path):
+        import httpx
+
+        opml_path = _make_opml_source(tmp_path, feed_count=2).opml_path
+        source = RSSSource(opml_path, max_feed_bytes=64 * 1024)
+
+        def handler(request):
+            if request.url.path == "/feed0":
+                return httpx.Response(
+                    200, headers={"content-type": "application/json"}, content=b"{}"
+                )
+            return httpx.Response(
+                200,
+                headers={"content-type": "application/rss+xml"},
+                content=SAMPLE_RSS_XML.encode("utf-8"),
+            )
+
+        with patch.object(
+            httpx, "AsyncHTTPTransport", return_value=httpx.MockTransport(handler)
+        ):
+            papers = await source.fetch_papers()
+
+        assert len(papers) == 2
+        assert source.last_report.failed == ["https://example.com/feed0"]
+
+
+class TestRSSFeedArchive:
+    """Tests for the content-addressed raw feed archive and offline replay."""
+
+    def test_identical_bodies_share_one_blob(self, tmp_path):
+        from datetime import datetime, timezone
+        from src.sources.rss_archive import FeedArchive
+
+        archive = FeedArchive(tmp_path / "archive")
+        t1 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        t2 = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        first = archive.store("https://example.com/a", SAMPLE_RSS_XML, fetched_at=t1)
+        second = archive.store("https://example.com/a", SAMPLE_RSS_XML, fetched_at=t2)
+        archive.store("https://example.com/b", "<rss/>", fetched_at=t1)
+
+        assert first.sha256 == second.sha256
+        blobs = list((tmp_path / "archive" / "objects").rglob("*.xml.gz"))
+        assert len(blobs) == 2
+        assert archive.load(first.sha256) == SAMPLE_RSS_XML.encode("utf-8")
+        assert archive.latest()["https://example.com/a"].fetched_at == t2.isoformat()
+        assert archive.latest(as_of=t1)["https://example.com/a"].fetched_at == (
+            t1.isoformat()
+        )
+        assert len(archive.history("https://example.com/a")) == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_archives_and_replays_offline(self, tmp_path):
+        opml_path = _make_opml_source(tmp_path, feed_count=2).opml_path
+        archive_dir = tmp_path / "archive"
+
+        source = RSSSource(opml_path, archive_dir=str(archive_dir))
+        client = _mock_client_for(lambda *a, **kw: _feed_response())
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            fetched = await source.fetch_papers()
+
+        with patch("src.sources.rss.httpx.AsyncClient") as mock_client_class:
+            replayed = await source.fetch_from_archive()
+            limited = await source.fetch_from_archive(limit=1)
+        mock_client_class.assert_not_called()
+
+        assert [p.title for p in replayed] == [p.title for p in fetched]
+        assert len(limited) == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_requires_archive_dir(self, tmp_path):
+        source = _make_opml_source(tmp_path, feed_count=1)
+        with pytest.raises(ValueError, match="archive_dir"):
+            await source.fetch_from_archive()
+
+
+def _dated_rss(dates):
+    items = "".join(
+        f"<item><title>Paper {i}</title>"
+        f"<link>https://example.com/p{i}</link>"
+        f"<pubDate>{d.strftime('%a, %d %b %Y 10:00:00 GMT')}</pubDate></item>"
+        for i, d in enumerate(dates)
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>'
+        f"{items}</channel></rss>"
+    )
+
+
+class TestRSSSincePushdown:
+    """Tests for dropping old entries before PaperItem construction."""
+
+    def test_reverse_chronological_feed_stops_early(self):
+        from datetime import date, timedelta
+        from src.sources.rss import parse_feed_body
+
+        newest = date(2024, 6, 30)
+        body = _dated_rss([newest - timedelta(days=i) for i in range(200)])
+        parser = RSSParser()
+
+        with (
+            patch.object(parser, "parse", wraps=parser.parse) as mock_parse,
+            patch.object(
+                parser, "published_date", wraps=parser.published_date
+            ) as mock_date,
+        ):
+            papers, _ = parse_feed_body(
+                body, "Feed", parser=parser, since=date(2024, 6, 21)
+            )
+
+        assert [p.title for p in papers] == [f"Paper {i}" for i in range(10)]
+        assert mock_parse.call_count == 10
+        assert mock_date.call_count < 20
+
+    def test_unordered_feed_is_scanned_fully(self):
+        from datetime import date
+        from src.sources.rss import parse_feed_body
+
+        dates = [date(2024, 6, d) for d in (30, 29, 28, 27, 1, 2, 3, 29)]
+        papers, _ = parse_feed_body(_dated_rss(dates), "Feed", since=date(2024, 6, 20))
+
+        assert [p.title for p in papers] == [
+            "Paper 0", "Paper 1", "Paper 2", "Paper 3", "Paper 7"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cache_not_replayed_for_earlier_since(self, tmp_path):
+        from datetime import date
+
+        opml_path = _make_opml_source(tmp_path, feed_count=1).opml_path
+        cache_dir = tmp_path / "cache"
+        body = _dated_rss([date(2024, 6, 30), date(2024, 6, 1)])
+        validators = {"ETag": '"v1"'}
+
+        source = RSSSource(opml_path, cache_dir=str(cache_dir))
+        client = _mock_client_for(
+            lambda *a, **kw: _feed_response(body=body, headers=validators)
+        )
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            recent = await source.fetch_papers(since=date(2024, 6, 20))
+            later = await source.fetch_papers(since=date(2024, 6, 25))
+            full = await source.fetch_papers(since=date(2024, 5, 1))
+
+        assert len(recent) == 1
+        assert len(later) == 1
+        assert len(full) == 2
+        sent_headers = [c.kwargs["headers"] for c in client.get.call_args_list]
+        assert "If-None-Match" in sent_headers[1]
+        assert "If-None-Match" not in sent_headers[2]
+
+
+class TestRSSFetchStats:
+    """Tests for per-feed timing instrumentation."""
+
+    @pytest.mark.asyncio
+    async def test_stats_cover_each_feed(self, tmp_path):
+        from datetime import date
+
+        opml_path = _make_opml_source(tmp_path, feed_count=2).opml_path
+        source = RSSSource(opml_path)
+        body = _dated_rss([date(2024, 6, 30), date(2024, 6, 1), date(2024, 5, 1)])
+        client = _mock_client_for(lambda *a, **kw: _feed_response(body=body))
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            await source.fetch_papers(since=date(2024, 6, 20))
+
+        stats = source.last_stats
+        assert sorted(t.url for t in stats.feeds) == [
+            "https://example.com/feed0",
+            "https://example.com/feed1",
+        ]
+        timing = stats.feeds[0]
+        assert timing.outcome == "parsed"
+        assert timing.bytes == len(body.encode("utf-8"))
+        assert timing.ttfb_seconds is not None
+        assert (timing.entries_total, timing.entries_kept) == (3, 1)
+        assert timing.entries_dropped_since == 2
+        summary = stats.summary()
+        assert summary["outcomes"] == {"parsed": 2}
+        assert summary["entries_kept"] == 2
+        assert stats.wall_seconds > 0
+
+    @pytest.mark.asyncio
+    async def test_failed_and_cancelled_feeds_are_recorded(self, tmp_path):
+        import asyncio
+        import httpx
+
+        opml_path = _make_opml_source(tmp_path, feed_count=2).opml_path
+        source = RSSSource(opml_path)
+
+        async def _get(url, *args, **kwargs):
+            if url.endswith("feed0"):
+                await asyncio.sleep(10)
+            raise httpx.ConnectError("refused")
+
+        client = _mock_client_for(_get)
+        with patch("src.sources.rss.httpx.AsyncClient", return_value=client):
+            await source.fetch_papers(budget_seconds=0.2)
+
+        outcomes = {t.url: t.outcome for t in source.last_stats.feeds}
+        assert outcomes == {
+            "https://example.com/feed0": "cancelled",
+            "https://example.com/feed1": "failed",
+        }
+
+    @pytest.mark.asyncio
+    async def test_transport_reports_download_timing(self):
+        import httpx
+        from src.sources.rss_transport import TIMING_EXTENSION, BoundedFeedTransport
+
+        def handler(request):
+            return httpx.Response(200, content=SAMPLE_RSS_XML.encode("utf-8"))
+
+        transport = BoundedFeedTransport(httpx.MockTransport(handler))
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get("https://example.com/feed")
+
+        timing = response.extensions[TIMING_EXTENSION]
+        assert timing["bytes"] == len(SAMPLE_RSS_XML.encode("utf-8"))
+        assert timing["ttfb_seconds"] >= 0
+        assert timing["download_seconds"] is not None
+
+
+class TestRSSSharding:
+    """Tests for partitioning feeds across shard processes."""
+
+    def test_shards_partition_feeds(self):
+        from src.sources.opml import shard_feeds
+
+        feeds = [
+            {"url": f"https://example.com/feed{i}", "title": f"Feed {i}"}
+            for i in range(40)
+        ]
+        shards = [shard_feeds(feeds, i, 4) for i in range(1, 5)]
+
+        urls = [f["url"] for shard in shards for f in shard]
+        assert sorted(urls) == sorted(f["url"] for f in feeds)
+        assert len(urls) == len(set(urls))
+        assert shards == [shard_feeds(feeds, i, 4) for i in range(1, 5)]
+        assert shard_feeds(feeds, 1, 1) == feeds
+
+    def test_invalid_shard_raises(self):
+        from src.sources.opml import shard_feeds
+
+        with pytest.raises(ValueError):
+            shard_feeds([], 0, 4)
+        with pytest.raises(ValueError):
+            shard_feeds([], 5, 4)
+
+    def test_source_keeps_only_its_shard(self, tmp_path):
+        from src.sources.opml import shard_feeds
+
+        opml_path = _make_opml_source(tmp_path, feed_count=10).opml_path
+        full = RSSSource(opml_path)
+        cache_dir = tmp_path / "cache"
+        sharded = RSSSource(opml_path, cache_dir=str(cache_dir), shard=(2, 3))
+
+        assert sharded._feeds == shard_feeds(full._feeds, 2, 3)
+        assert sharded._cache is not None
+        assert sharded._cache.path.parent == cache_dir / "shard-2-of-3"
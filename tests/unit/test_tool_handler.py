@@ -31,3 +31,51 @@ async def test_enrich_tool_rejects_invalid_provider():
     payload = json.loads(text)
     assert is_error is True
     assert payload["ok"] is False
+
+
+@pytest.mark.asyncio
+async def test_filter_keywords_tool_accepts_boolean_query():
+    handler = ToolHandler()
+    papers_json = json.dumps(
+        [
+            {"title": "Operando XAS of zinc anodes", "source": "JACS", "source_type": "rss"},
+            {"title": "Zinc anode review", "source": "JACS", "source_type": "rss"},
+            {"title": "Lithium cathodes", "source": "Nature", "source_type": "rss"},
+        ]
+    )
+
+    text, is_error = await handler.handle_tool(
+        ToolName.FILTER_KEYWORDS.value,
+        {"papers_json": papers_json, "query": "title:zinc NOT review"},
+    )
+    payload = json.loads(text)
+    assert is_error is False
+    assert [p["title"] for p in payload["data"]["papers"]] == [
+        "Operando XAS of zinc anodes"
+    ]
+
+    text, is_error = await handler.handle_tool(
+        ToolName.FILTER_KEYWORDS.value,
+        {"papers_json": papers_json, "query": "title:(zinc"},
+    )
+    assert is_error is True
+    assert "QuerySyntaxError" in json.loads(text)["error"]
+
+
+@pytest.mark.asyncio
+async def test_filter_keywords_tool_requires_keywords_or_query():
+    handler = ToolHandler()
+    papers_json = json.dumps(
+        [{"title": "Zinc anodes", "source": "JACS", "source_type": "rss"}]
+    )
+
+    for args in (
+        {"papers_json": papers_json},
+        {"papers_json": papers_json, "keywords": [], "query": "  "},
+        {"papers_json": papers_json, "authors": ["Smith"]},
+    ):
+        text, is_error = await handler.handle_tool(
+            ToolName.FILTER_KEYWORDS.value, args
+        )
+        assert is_error is True
+        assert "keywords or query" in json.loads(text)["error"]